@@ -1,10 +1,15 @@
 ﻿from flask import Flask, render_template, jsonify, request, Response
 from database import ScoutDatabase
-from consensus_scraper import scrape_consensus_big_board_2026, scrape_nflmockdraftdatabase_big_board
-from webscraper import scrape_nfl_big_board, save_to_json as save_tankathon_json
+from consensus_scraper import (
+    CONSENSUS_URL, crawl_nflmockdraftdatabase_big_boards, fetch_board_html, parse_board_entries, parse_board_name,
+    validate_nflmock_board_url
+)
+from webscraper import fetch_nfl_big_board_html, parse_nfl_big_board_html, save_to_json as save_tankathon_json
 from download_logos import get_schools_from_database, get_schools_from_json, get_school_logos
-import random
+from jobs import JobRunner, SingleFlight
 import urllib.parse
+import functools
+import hashlib
 import os
 import sys
 import signal
@@ -25,32 +30,76 @@ app = Flask(
     template_folder=str(BASE_PATH / 'templates'),
     static_folder=str(BASE_PATH / 'static')
 )
-db = ScoutDatabase()
+db = ScoutDatabase(defer_rank_recalculation=True)
+jobs = JobRunner(max_workers=2)
+# Concurrent identical requests for synchronous settings actions share one execution
+single_flight = SingleFlight()
+
+IMPORT_JOB_STAGES = ('fetch', 'parse', 'normalize', 'resolve', 'enrich', 'write', 'recalc')
+
+# Distinguishes ETags of this process from ones issued before a restart (the data generation restarts at 0)
+_ETAG_PROCESS_TOKEN = f'{os.getpid():x}{time.time_ns():x}'
+
+
+def conditional_get(view):
+    """Tag GET responses with a strong ETag tied to the database data generation.
+
+    The tag covers the request path and query string plus the generation, so a matching
+    If-None-Match is answered with 304 before the view touches the database.
+    """
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        path_digest = hashlib.sha1(request.full_path.encode('utf-8')).hexdigest()[:16]
+        etag = f'{_ETAG_PROCESS_TOKEN}-{db.data_generation}-{path_digest}'
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'no-cache'
+            return response
+
+        response = app.make_response(view(*args, **kwargs))
+        if response.status_code == 200:
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'no-cache'
+        return response
+    return wrapper
+
 
 @app.route('/')
 def index():
     """Main page"""
     return render_template('index.html')
 
+@app.route('/api/bootstrap')
+@conditional_get
+def get_bootstrap():
+    """Get the initial UI state (stats, positions, schools, rank boards, watch list) in one request"""
+    include_big_board = request.args.get('big_board', 'false').lower() == 'true'
+    return jsonify(db.get_bootstrap_state(include_big_board=include_big_board))
+
 @app.route('/api/positions')
+@conditional_get
 def get_positions():
     """Get all available positions"""
     positions = db.get_all_positions()
     return jsonify(positions)
 
 @app.route('/api/schools')
+@conditional_get
 def get_schools():
     """Get all available schools"""
     schools = db.get_all_schools()
     return jsonify(schools)
 
 @app.route('/api/stats')
+@conditional_get
 def get_stats():
     """Get database statistics"""
     stats = db.get_db_stats()
     return jsonify(stats)
 
 @app.route('/api/players')
+@conditional_get
 def get_players():
     """Get filtered players"""
     positions = request.args.getlist('positions[]')
@@ -60,6 +109,34 @@ def get_players():
     school = request.args.get('school', '').strip()
     include_scouted = request.args.get('include_scouted', 'false').lower() == 'true'
     watch_list_only = request.args.get('watch_list_only', 'false').lower() == 'true'
+    sort = request.args.get('sort', '').strip().lower()
+    fields = [field.strip() for field in request.args.get('fields', '').split(',') if field.strip()]
+    limit = request.args.get('limit', type=int)
+    cursor = request.args.get('cursor', '').strip()
+
+    if fields or limit or cursor:
+        try:
+            page = db.get_players_page(
+                positions=positions if positions else None,
+                max_rank=max_rank,
+                include_scouted=include_scouted,
+                search_term=search_term if search_term else None,
+                name_search=name_search if name_search else None,
+                school=school if school else None,
+                watch_list_only=watch_list_only,
+                sort=sort if sort else None,
+                fields=fields if fields else None,
+                limit=limit if limit else (50 if cursor else None),
+                cursor=cursor if cursor else None
+            )
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        response = jsonify(page['players'])
+        response.headers['X-Total-Count'] = str(page['total'])
+        if page['next_cursor']:
+            response.headers['X-Next-Cursor'] = page['next_cursor']
+        return response
  
     players = db.get_filtered_players(
         positions=positions if positions else None,
@@ -68,10 +145,13 @@ def get_players():
         search_term=search_term if search_term else None,
         name_search=name_search if name_search else None,
         school=school if school else None,
-        watch_list_only=watch_list_only
+        watch_list_only=watch_list_only,
+        sort=sort if sort else None
     )
  
-    return jsonify(players)
+    response = jsonify(players)
+    response.headers['X-Total-Count'] = str(len(players))
+    return response
 
 @app.route('/api/random')
 def get_random_player():
@@ -79,28 +159,60 @@ def get_random_player():
     positions = request.args.getlist('positions[]')
     max_rank = request.args.get('max_rank', type=int)
     watch_list_only = request.args.get('watch_list_only', 'false').lower() == 'true'
+    sample_size = max(1, min(request.args.get('n', 1, type=int), 100))
+    fields = [field.strip() for field in request.args.get('fields', '').split(',') if field.strip()]
  
-    players = db.get_filtered_players(
-        positions=positions if positions else None,
-        max_rank=max_rank,
-        include_scouted=False,
-        watch_list_only=watch_list_only
-    )
+    # Sample ids inside SQLite; n > 1 draws without replacement
+    try:
+        sampled = db.sample_random_players(
+            n=sample_size,
+            positions=positions if positions else None,
+            max_rank=max_rank,
+            include_scouted=False,
+            watch_list_only=watch_list_only,
+            fields=fields if fields else ['id']
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
  
-    if not players:
+    if not sampled:
         return jsonify({'error': 'No players available with current filters'}), 404
+
+    if fields:
+        return jsonify(sampled)
+
+    selected_players = db.get_players_by_ids([sampled_player['id'] for sampled_player in sampled])
+    for selected_player in selected_players:
+        # Enhance with external links
+        selected_player['sports_reference_url'] = generate_sports_reference_url(selected_player)
+        selected_player['espn_url'] = generate_espn_url(selected_player)
  
-    # Select random player
-    selected_player = random.choice(players)
-    selected_player = db.get_player_by_id(selected_player['id']) or selected_player
- 
-    # Enhance with external links
-    selected_player['sports_reference_url'] = generate_sports_reference_url(selected_player)
-    selected_player['espn_url'] = generate_espn_url(selected_player)
- 
-    return jsonify(selected_player)
+    if not selected_players:
+        return jsonify({'error': 'No players available with current filters'}), 404
+    return jsonify(selected_players if sample_size > 1 else selected_players[0])
+
+@app.route('/api/players/batch')
+@conditional_get
+def get_players_batch():
+    """Get detail records for many players in one round trip (ids=1,2,3)"""
+    raw_ids = [value.strip() for value in request.args.get('ids', '').split(',') if value.strip()]
+    if not raw_ids:
+        return jsonify({'error': 'ids is required'}), 400
+    if len(raw_ids) > 200:
+        return jsonify({'error': 'At most 200 ids can be requested at once'}), 400
+    try:
+        player_ids = [int(value) for value in raw_ids]
+    except ValueError:
+        return jsonify({'error': 'ids must be integers'}), 400
+
+    players = db.get_players_by_ids(player_ids)
+    for player in players:
+        player['sports_reference_url'] = generate_sports_reference_url(player)
+        player['espn_url'] = generate_espn_url(player)
+    return jsonify(players)
 
 @app.route('/api/player/<int:player_id>')
+@conditional_get
 def get_player(player_id):
     """Get specific player details"""
     player = db.get_player_by_id(player_id)
@@ -156,13 +268,33 @@ def update_player_profile(player_id):
     """Update editable player profile fields"""
     data = request.get_json() or {}
     try:
-        db.update_player_profile(player_id, data)
+        result = db.update_player_profile(player_id, data)
     except ValueError as e:
         return jsonify({'success': False, 'error': str(e)}), 400
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
-    return jsonify({'success': True})
+    return jsonify(result)
+
+@app.route('/api/player/<int:player_id>/aliases', methods=['GET'])
+def get_player_aliases(player_id):
+    """List confirmed alternate name spellings and pending import suggestions for this player"""
+    return jsonify(db.get_player_aliases(player_id))
+
+@app.route('/api/player/<int:player_id>/aliases', methods=['POST'])
+def add_player_alias(player_id):
+    """Confirm an alternate name spelling (or a pending suggestion) for a player"""
+    data = request.get_json() or {}
+    result = db.add_player_alias(player_id, data.get('alias') or '')
+    return jsonify(result), (200 if result.get('success') else 400)
+
+@app.route('/api/player/<int:player_id>/aliases', methods=['DELETE'])
+def remove_player_alias(player_id):
+    """Forget an alternate name spelling or dismiss a pending suggestion"""
+    data = request.get_json(silent=True) or {}
+    alias = data.get('alias') or request.args.get('alias') or ''
+    result = db.remove_player_alias(player_id, alias)
+    return jsonify(result), (200 if result.get('success') else 404)
 
 @app.route('/api/settings/player', methods=['POST'])
 def add_player_from_settings():
@@ -193,6 +325,7 @@ def add_player_from_settings():
     return jsonify(result)
 
 @app.route('/api/bigboard')
+@conditional_get
 def get_big_board():
     """Get overall or positional big board"""
     board_type = request.args.get('type', 'overall')
@@ -229,6 +362,18 @@ def reorder_big_board():
     result = db.reorder_big_board(ordered_player_ids, board_type=board_type, position=position)
     return jsonify(result)
 
+@app.route('/api/bigboard/move', methods=['POST'])
+def move_big_board_entries():
+    """Apply move/move_block/swap operations and return the changed positions"""
+    data = request.get_json() or {}
+    operations = data.get('operations', [])
+    board_type = data.get('type', 'overall')
+    position = data.get('position') if board_type == 'position' else None
+
+    result = db.apply_big_board_moves(operations, board_type=board_type, position=position)
+    status_code = 200 if result.get('success') else 400
+    return jsonify(result), status_code
+
 @app.route('/api/bigboard/remove', methods=['POST'])
 def remove_from_big_board():
     """Remove player from big board"""
@@ -255,6 +400,7 @@ def autosort_big_board():
 
 
 @app.route('/api/watchlist')
+@conditional_get
 def get_watch_list():
     """Get personal watch list entries."""
     return jsonify(db.get_watch_list())
@@ -284,6 +430,15 @@ def reorder_watch_list():
     return jsonify(db.reorder_watch_list(ordered_player_ids))
 
 
+@app.route('/api/watchlist/move', methods=['POST'])
+def move_watch_list_entries():
+    """Apply move/move_block/swap operations to the watch list."""
+    data = request.get_json() or {}
+    result = db.apply_watch_list_moves(data.get('operations', []))
+    status_code = 200 if result.get('success') else 400
+    return jsonify(result), status_code
+
+
 @app.route('/api/watchlist/remove', methods=['POST'])
 def remove_from_watch_list():
     """Remove player from personal watch list."""
@@ -294,46 +449,154 @@ def remove_from_watch_list():
 
     return jsonify(db.remove_player_from_watch_list(player_id))
 
-@app.route('/api/settings/refresh-logos', methods=['POST'])
-def refresh_logos():
-    """Refresh school logos using in-process downloader logic."""
-    try:
-        schools = get_schools_from_database() or get_schools_from_json()
-        if not schools:
-            return jsonify({'success': False, 'error': 'No schools found to refresh logos.'}), 400
+def _job_started(job):
+    return jsonify({'success': True, 'job_id': job['id'], 'job': job}), 202
+
+
+def _wait_for_rankings_stage(context, result, timeout=120.0):
+    """Job stage that waits for the deferred rank recalculation an import requested."""
+    generation = (result or {}).get('ranking_generation')
+    if not generation:
+        return
+    context.stage('recalc')
+    deadline = time.monotonic() + timeout
+    while not db.wait_for_rankings(generation, timeout=0.5):
+        # The recalculation keeps running in the background; cancelling only stops waiting
+        if context.cancel_requested or time.monotonic() >= deadline:
+            return
+
+
+def _refresh_logos_job(context):
+    context.stage('match', 'Collecting schools')
+    schools = get_schools_from_database() or get_schools_from_json()
+    if not schools:
+        return {'success': False, 'error': 'No schools found to refresh logos.'}
+
+    context.raise_if_cancelled()
+    context.stage('fetch', f'Downloading logos for {len(schools)} schools')
+    get_school_logos(schools, should_stop=lambda: context.cancel_requested)
+    context.raise_if_cancelled()
+    return {
+        'success': True,
+        'output': f'Logo refresh complete for {len(schools)} schools.'
+    }
 
-        get_school_logos(schools)
-        return jsonify({
-            'success': True,
-            'output': f'Logo refresh complete for {len(schools)} schools.'
-        })
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
 
-@app.route('/api/settings/update-rankings', methods=['POST'])
-def update_rankings():
-    """Fetch Tankathon data and import without recalculating rankings."""
-    try:
-        players_data = scrape_nfl_big_board()
-        if not players_data:
-            return jsonify({'success': False, 'error': 'Failed to fetch Tankathon big board data.'}), 502
+def _update_rankings_job(context):
+    context.stage('fetch', 'Downloading Tankathon big board')
+    content = fetch_nfl_big_board_html()
+    context.raise_if_cancelled()
 
-        output_json_path = Path.cwd() / 'nfl_big_board.json'
-        save_tankathon_json(players_data, filename=str(output_json_path))
+    context.stage('parse')
+    players_data = parse_nfl_big_board_html(content)
+    if not players_data:
+        return {'success': False, 'error': 'Failed to fetch Tankathon big board data.'}
+    context.raise_if_cancelled()
 
-        import_result = db.import_players_from_json(str(output_json_path), recalculate_rankings=False)
-        if not import_result.get('success'):
-            return jsonify({
-                'success': False,
-                'error': import_result.get('error') or 'Tankathon import failed after fetch.'
-            }), 500
+    output_json_path = Path.cwd() / 'nfl_big_board.json'
+    save_tankathon_json(players_data, filename=str(output_json_path))
 
-        return jsonify({
-            'success': True,
-            'output': f"Fetched {len(players_data)} Tankathon players and imported {import_result.get('imported', 0)} without recalculating ranks."
-        })
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+    import_result = db.import_players_from_json(str(output_json_path), recalculate_rankings=False, progress=context.stage)
+    if not import_result.get('success'):
+        return {
+            'success': False,
+            'error': import_result.get('error') or 'Tankathon import failed after fetch.'
+        }
+
+    if import_result.get('unchanged'):
+        return {'success': True, 'output': f"Fetched {len(players_data)} Tankathon players; the board is unchanged since the last import."}
+    return {
+        'success': True,
+        'output': f"Fetched {len(players_data)} Tankathon players and imported {import_result.get('imported', 0)} without recalculating ranks."
+    }
+
+
+def _import_consensus_board_job(context):
+    context.stage('fetch', 'Downloading consensus big board')
+    html = fetch_board_html(CONSENSUS_URL)
+    context.raise_if_cancelled()
+
+    context.stage('parse')
+    players = parse_board_entries(html)
+    if not players:
+        return {'success': False, 'error': 'No players found from consensus source.'}
+    context.raise_if_cancelled()
+
+    result = db.import_consensus_board(players, progress=context.stage)
+    _wait_for_rankings_stage(context, result)
+    if result.get('unchanged'):
+        result['output'] = 'Consensus board is unchanged since the last import.'
+    return result
+
+
+def _import_nflmock_board_job(context, board_url, custom_board_name):
+    context.stage('fetch', 'Downloading board page')
+    html = fetch_board_html(board_url)
+    context.raise_if_cancelled()
+
+    context.stage('parse')
+    players = parse_board_entries(html)
+    board_name = custom_board_name or parse_board_name(html, board_url)
+    if not players:
+        return {'success': False, 'error': 'No players found from the provided board URL.'}
+    context.raise_if_cancelled()
+
+    result = db.import_nflmock_url_board(players, board_name, progress=context.stage)
+    _wait_for_rankings_stage(context, result)
+    return result
+
+
+def _crawl_nflmock_boards_job(context):
+    crawl = crawl_nflmockdraftdatabase_big_boards(
+        progress=context.stage,
+        should_stop=lambda: context.cancel_requested
+    )
+    context.raise_if_cancelled()
+    if not crawl['boards']:
+        return {'success': False, 'error': 'No boards could be imported from the big boards index.', 'failed': crawl['failed']}
+
+    result = db.import_nflmock_url_boards(crawl['boards'], progress=context.stage)
+    _wait_for_rankings_stage(context, result)
+    result['failed'] = crawl['failed']
+    if result.get('success'):
+        result['output'] = (
+            f"Imported {result['boards_imported']} boards ({result['entries_imported']} rankings) from the index"
+            + (f", {result['boards_unchanged']} unchanged since the last import" if result['boards_unchanged'] else '')
+            + (f"; {len(crawl['failed'])} boards could not be fetched." if crawl['failed'] else '.')
+        )
+    return result
+
+
+@app.route('/api/settings/refresh-logos', methods=['POST'])
+def refresh_logos():
+    """Start a background job that refreshes school logos."""
+    return _job_started(jobs.submit('refresh-logos', ('match', 'fetch'), _refresh_logos_job, key='refresh-logos'))
+
+@app.route('/api/settings/update-rankings', methods=['POST'])
+def update_rankings():
+    """Start a background job that fetches Tankathon data and imports it without recalculating rankings."""
+    return _job_started(jobs.submit('update-rankings', ('fetch', 'parse', 'normalize', 'resolve', 'enrich', 'write'), _update_rankings_job, key='update-rankings'))
+
+@app.route('/api/jobs')
+def list_jobs():
+    """List queued, running and recently finished background jobs."""
+    return jsonify(jobs.list_jobs())
+
+@app.route('/api/jobs/<job_id>')
+def get_job(job_id):
+    """Get status, stage progress and (once finished) the result of a background job."""
+    job = jobs.status(job_id)
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job)
+
+@app.route('/api/jobs/<job_id>/cancel', methods=['POST'])
+def cancel_job(job_id):
+    """Request cancellation; the job stops at its next stage boundary."""
+    job = jobs.cancel(job_id)
+    if not job:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    return jsonify({'success': True, 'job': job})
 
 
 @app.route('/api/system/shutdown', methods=['POST'])
@@ -361,15 +624,40 @@ def shutdown_system():
 @app.route('/api/settings/recalculate-player-rankings', methods=['POST'])
 def recalculate_player_rankings():
     """Recalculate default and positional player rankings."""
-    try:
+    def recalculate():
         ranked_count = db.recalculate_default_rankings()
-        return jsonify({
+        timings = db.last_recalculation.get('timings_ms', {})
+        return {
             'success': True,
-            'output': f'Recalculated rankings for {ranked_count} players.'
-        })
+            'output': f"Recalculated rankings for {ranked_count} players in {timings.get('total', 0)} ms.",
+            'timings_ms': timings
+        }
+
+    try:
+        return jsonify(single_flight.do('recalculate-player-rankings', recalculate))
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
+@app.route('/api/rankings/status')
+def get_ranking_status():
+    """Get requested/completed ranking generations of the deferred recalculation scheduler."""
+    return jsonify(db.get_ranking_status())
+
+@app.route('/api/system/read-cache')
+def get_read_cache_stats():
+    """Get hit/miss/eviction counters of the generation-stamped read cache."""
+    return jsonify(db.get_read_cache_stats())
+
+@app.route('/api/rankings/wait')
+def wait_for_rankings():
+    """Block until a ranking generation has been recalculated (or the timeout passes)."""
+    generation = request.args.get('generation', type=int)
+    timeout = min(max(request.args.get('timeout', 10.0, type=float), 0.0), 30.0)
+    completed = db.wait_for_rankings(generation, timeout=timeout)
+    status = db.get_ranking_status()
+    status['completed'] = completed
+    return jsonify(status)
+
 @app.route('/api/settings/import-big-boards', methods=['POST'])
 def import_big_boards():
     """Import external big board text files and normalize rankings"""
@@ -385,21 +673,12 @@ def import_big_boards():
 
 @app.route('/api/settings/import-consensus-board', methods=['POST'])
 def import_consensus_board():
-    """Scrape and import consensus board data"""
-    try:
-        players = scrape_consensus_big_board_2026()
-        if not players:
-            return jsonify({'success': False, 'error': 'No players found from consensus source.'}), 502
-
-        result = db.import_consensus_board(players)
-        status_code = 200 if result.get('success') else 400
-        return jsonify(result), status_code
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+    """Start a background job that scrapes and imports consensus board data"""
+    return _job_started(jobs.submit('import-consensus-board', IMPORT_JOB_STAGES, _import_consensus_board_job, key='import-consensus-board'))
 
 @app.route('/api/settings/import-nflmock-board-url', methods=['POST'])
 def import_nflmock_board_url():
-    """Scrape and import an NFLMockDraftDatabase big board URL."""
+    """Start a background job that scrapes and imports an NFLMockDraftDatabase big board URL."""
     data = request.get_json() or {}
     board_url = (data.get('url') or '').strip()
     custom_board_name = (data.get('board_name') or '').strip()
@@ -407,30 +686,37 @@ def import_nflmock_board_url():
         return jsonify({'success': False, 'error': 'Board URL is required.'}), 400
 
     try:
-        scraped = scrape_nflmockdraftdatabase_big_board(board_url)
-        players = scraped.get('players') or []
-        scraped_name = scraped.get('board_name') or 'Imported NFLMockDraftDatabase Board'
-        board_name = custom_board_name or scraped_name
-
-        if not players:
-            return jsonify({'success': False, 'error': 'No players found from the provided board URL.'}), 502
-
-        result = db.import_nflmock_url_board(players, board_name)
-        status_code = 200 if result.get('success') else 400
-        return jsonify(result), status_code
+        board_url = validate_nflmock_board_url(board_url)
     except ValueError as e:
         return jsonify({'success': False, 'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+
+    job = jobs.submit(
+        'import-nflmock-board-url', IMPORT_JOB_STAGES, _import_nflmock_board_job, board_url, custom_board_name,
+        key=f'import-nflmock-board-url:{board_url}'
+    )
+    return _job_started(job)
+
+@app.route('/api/settings/crawl-nflmock-boards', methods=['POST'])
+def crawl_nflmock_boards():
+    """Start a background job that imports every board listed on the NFLMockDraftDatabase big boards index."""
+    return _job_started(jobs.submit('crawl-nflmock-boards', IMPORT_JOB_STAGES, _crawl_nflmock_boards_job, key='crawl-nflmock-boards'))
 
 @app.route('/api/settings/merge-player-duplicates', methods=['POST'])
 def merge_player_duplicates():
-    """Merge duplicate players created from name variants (suffix/punctuation/casing)."""
-    result = db.merge_player_name_duplicates()
+    """Merge duplicate players created from name variants (suffix/punctuation/casing).
+
+    With {"dry_run": true} the planned merge groups are returned and nothing is changed.
+    """
+    data = request.get_json(silent=True) or {}
+    if data.get('dry_run'):
+        result = db.merge_player_name_duplicates(dry_run=True)
+    else:
+        result = single_flight.do('merge-player-duplicates', db.merge_player_name_duplicates)
     status_code = 200 if result.get('success') else 400
     return jsonify(result), status_code
 
 @app.route('/api/settings/rank-boards')
+@conditional_get
 def get_rank_boards():
     """Get board rank settings including weights and primary board"""
     boards = db.get_rank_boards_config()
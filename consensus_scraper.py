@@ -1,10 +1,13 @@
 import json
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from html import unescape
-from urllib.parse import urlparse
+from urllib.parse import urljoin, urlparse
 import requests
 from bs4 import BeautifulSoup
+from http_cache import OfflineCacheMiss, cached_get
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
@@ -12,7 +15,7 @@ CONSENSUS_URL = 'https://www.nflmockdraftdatabase.com/big-boards/2026/consensus-
 BIG_BOARDS_INDEX_URL = 'https://www.nflmockdraftdatabase.com/big-boards/2026'
 
 
-def create_session():
+def create_session(pool_size=10):
     session = requests.Session()
     retry_strategy = Retry(
         total=4,
@@ -20,7 +23,7 @@ def create_session():
         status_forcelist=[429, 500, 502, 503, 504],
         allowed_methods=["HEAD", "GET", "OPTIONS"]
     )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=pool_size, pool_maxsize=pool_size)
     session.mount('http://', adapter)
     session.mount('https://', adapter)
     return session
@@ -211,31 +214,67 @@ def _extract_entries_from_text(html):
     return entries
 
 
-def scrape_consensus_big_board_2026(url=CONSENSUS_URL):
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
-                      '(KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.9',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1'
-    }
+_REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                  '(KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+
+class HostRateLimiter:
+    """Spaces out requests to the same host by at least min_interval seconds (thread-safe)."""
+
+    def __init__(self, min_interval=0.5):
+        self.min_interval = max(0.0, float(min_interval))
+        self._lock = threading.Lock()
+        self._next_slot = {}
 
-    session = create_session()
+    def wait(self, url):
+        host = (urlparse(url).netloc or '').lower()
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def fetch_board_html(url, session=None, rate_limiter=None):
+    """Download a board page through the HTTP cache, retrying transient failures with a growing delay.
+
+    An unchanged page costs a conditional request answered with 304; in offline mode the
+    cached copy is replayed without touching the network.
+    """
+    session = session or create_session()
     response = None
 
     for attempt in range(4):
         try:
             if attempt > 0:
                 time.sleep(1.5 * attempt)
-            response = session.get(url, headers=headers, timeout=35, allow_redirects=True)
-            response.raise_for_status()
+            if rate_limiter is not None:
+                rate_limiter.wait(url)
+            response = cached_get(session, url, headers=_REQUEST_HEADERS, timeout=35, allow_redirects=True)
             break
+        except OfflineCacheMiss:
+            raise
+        except requests.HTTPError as e:
+            status_code = e.response.status_code if e.response is not None else None
+            # Client errors (missing/removed boards) will not fix themselves on retry
+            if attempt == 3 or (status_code is not None and 400 <= status_code < 500 and status_code != 429):
+                raise
         except requests.RequestException:
             if attempt == 3:
                 raise
 
-    html = response.text if response is not None else ''
+    return response.text if response is not None else ''
+
+
+def parse_board_entries(html):
+    """Extract ranked player entries from board HTML, trying each page layout in turn."""
     soup = BeautifulSoup(html, 'html.parser')
 
     entries = _extract_entries_from_react_props(soup)
@@ -275,85 +314,121 @@ def scrape_consensus_big_board_2026(url=CONSENSUS_URL):
     return normalized
 
 
-def scrape_nflmockdraftdatabase_big_board(url):
+def validate_nflmock_board_url(url):
     parsed_url = (url or '').strip()
     if not parsed_url:
         raise ValueError('A board URL is required.')
 
     if 'nflmockdraftdatabase.com' not in parsed_url.lower() or '/big-boards/' not in parsed_url.lower():
         raise ValueError('URL must be an NFLMockDraftDatabase big board link.')
+    return parsed_url
 
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
-                      '(KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.9',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1'
-    }
-
-    session = create_session()
-    response = None
-
-    for attempt in range(4):
-        try:
-            if attempt > 0:
-                time.sleep(1.5 * attempt)
-            response = session.get(parsed_url, headers=headers, timeout=35, allow_redirects=True)
-            response.raise_for_status()
-            break
-        except requests.RequestException:
-            if attempt == 3:
-                raise
 
-    html = response.text if response is not None else ''
-    soup = BeautifulSoup(html, 'html.parser')
-    board_name = _extract_board_name(soup)
+def parse_board_name(html, url):
+    board_name = _extract_board_name(BeautifulSoup(html, 'html.parser'))
     if board_name == 'Imported NFLMockDraftDatabase Board':
         try:
-            slug = (urlparse(parsed_url).path or '').rstrip('/').split('/')[-1]
+            slug = (urlparse(url).path or '').rstrip('/').split('/')[-1]
             if slug:
                 pretty_slug = _normalize_name(slug.replace('-', ' ')).title()
                 board_name = pretty_slug
         except Exception:
             pass
+    return board_name
 
-    entries = _extract_entries_from_react_props(soup)
-    if len(entries) < 20:
-        entries = _extract_entries_from_table(soup)
-    if len(entries) < 20:
-        entries = _extract_entries_from_json_blobs(html)
-    if len(entries) < 20:
-        entries = _extract_entries_from_text(html)
 
-    normalized = []
+def scrape_consensus_big_board_2026(url=CONSENSUS_URL):
+    return parse_board_entries(fetch_board_html(url))
+
+
+def scrape_nflmockdraftdatabase_big_board(url):
+    parsed_url = validate_nflmock_board_url(url)
+    html = fetch_board_html(parsed_url)
+    return {
+        'board_name': parse_board_name(html, parsed_url),
+        'players': parse_board_entries(html),
+        'source_url': parsed_url
+    }
+
+
+def discover_board_urls(index_html, index_url=BIG_BOARDS_INDEX_URL):
+    """List the board pages linked from the big-boards index (consensus board excluded)."""
+    index_path = (urlparse(index_url).path or '').rstrip('/')
+    consensus_path = (urlparse(CONSENSUS_URL).path or '').rstrip('/')
+    board_path_pattern = re.compile(re.escape(index_path) + r'/[A-Za-z0-9][A-Za-z0-9_-]*$')
+
+    candidates = [node.get('href') or '' for node in BeautifulSoup(index_html, 'html.parser').find_all('a', href=True)]
+    # Boards rendered client-side only appear as paths inside the embedded React props
+    candidates.extend(re.findall(re.escape(index_path) + r'/[A-Za-z0-9][A-Za-z0-9_-]*', unescape(index_html)))
+
+    urls = []
     seen = set()
-    for entry in entries:
-        rank = entry.get('rank')
-        name = _normalize_name(entry.get('name'))
-        if rank is None or not name:
+    for candidate in candidates:
+        absolute = urljoin(index_url, candidate.strip())
+        parsed = urlparse(absolute)
+        path = (parsed.path or '').rstrip('/')
+        if not board_path_pattern.search(path) or path == consensus_path:
             continue
-
-        try:
-            rank_value = int(float(rank))
-        except Exception:
+        normalized = f'{parsed.scheme}://{parsed.netloc}{path}'
+        if normalized in seen:
             continue
+        seen.add(normalized)
+        urls.append(normalized)
+    return urls
+
+
+def crawl_nflmockdraftdatabase_big_boards(index_url=BIG_BOARDS_INDEX_URL, max_workers=4, per_host_interval=0.5,
+                                          max_boards=None, progress=None, should_stop=None):
+    """Discover every board on the index page, fetch them concurrently and parse them in parallel.
+
+    Fetches share a bounded pool of sessions and a per-host rate limiter. progress, when given,
+    is called with the stage name ('fetch', then 'parse'); should_stop lets a caller abandon the
+    crawl between pages. Returns {'boards': [...], 'failed': [{'url', 'error'}], 'index_url'} where
+    each board has the same shape as scrape_nflmockdraftdatabase_big_board's result.
+    """
+    max_workers = max(1, int(max_workers))
+    rate_limiter = HostRateLimiter(per_host_interval)
+    sessions = threading.local()
+
+    def worker_session():
+        if not hasattr(sessions, 'session'):
+            sessions.session = create_session(pool_size=max_workers)
+        return sessions.session
+
+    if progress:
+        progress('fetch')
+    index_html = fetch_board_html(index_url, session=worker_session(), rate_limiter=rate_limiter)
+    board_urls = discover_board_urls(index_html, index_url)
+    if max_boards is not None:
+        board_urls = board_urls[:max(0, int(max_boards))]
+
+    def fetch(url):
+        if should_stop and should_stop():
+            return url, None, 'Crawl stopped before this board was fetched.'
+        try:
+            return url, fetch_board_html(url, session=worker_session(), rate_limiter=rate_limiter), None
+        except requests.RequestException as e:
+            return url, None, str(e)
 
-        key = name.lower()
-        if key in seen:
-            continue
-        seen.add(key)
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='board-crawl') as pool:
+        fetched = list(pool.map(fetch, board_urls))
 
-        normalized.append({
-            'rank': rank_value,
-            'name': name,
-            'position': _normalize_name(entry.get('position', '')),
-            'school': _normalize_name(entry.get('school', ''))
-        })
+        if progress:
+            progress('parse')
+
+        def parse(page):
+            url, html, error = page
+            if error is not None:
+                return {'url': url, 'error': error}
+            players = parse_board_entries(html)
+            if not players:
+                return {'url': url, 'error': 'No players found on board page.'}
+            return {'board_name': parse_board_name(html, url), 'players': players, 'source_url': url}
+
+        parsed = list(pool.map(parse, fetched))
 
-    normalized.sort(key=lambda row: (row['rank'], row['name']))
     return {
-        'board_name': board_name,
-        'players': normalized,
-        'source_url': parsed_url
+        'index_url': index_url,
+        'boards': [board for board in parsed if 'error' not in board],
+        'failed': [board for board in parsed if 'error' in board]
     }
@@ -1,16 +1,400 @@
 ﻿import sqlite3
+import base64
+import functools
+import hashlib
+import html
 import json
+import random
 import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
 
+from identity_resolver import IdentityResolver
+from rank_scheduler import RankRecalcScheduler
+
+#Match markers used inside FTS snippets; replaced with <mark> tags after HTML escaping
+_SNIPPET_OPEN = '\x02'
+_SNIPPET_CLOSE = '\x03'
+
+#bm25 column weights for players_fts: name, school, notes, games_watched
+_SEARCH_RELEVANCE_SQL = 'bm25(players_fts, 10.0, 5.0, 1.0, 1.0)'
+
+#Spacing between big_board_entries.rank_order keys; inserts and moves take the midpoint of two neighbours
+_BOARD_KEY_GAP = 1024
+
+#Duplicate merges fill blank text fields from the lowest-id duplicate and keep the lowest rank values
+_MERGE_TEXT_FIELDS = ('position', 'positional_rank', 'school', 'height', 'weight', 'jersey_number', 'player_url', 'stats', 'notes', 'games_watched', 'grade', 'grade_secondary', 'scout_date')
+_MERGE_RANK_FIELDS = ('rank', 'tankathon_rank', 'weighted_avg_rank')
+
+#Player columns an import with enrich='overwrite' (Tankathon) replaces from each entry's details
+_IMPORT_DETAIL_COLUMNS = ('tankathon_rank', 'position', 'positional_rank', 'school', 'height', 'weight', 'jersey_number', 'player_url', 'stats')
+
+
+#Grade systems sort poker chips, then numerical, then alphabet, then draft rounds; ungraded last
+_POKER_CHIP_ORDER = {'purple': 0, 'black': 1, 'blue': 2, 'green': 3, 'red': 4, 'white': 5}
+_ALPHA_GRADE_ORDER = {
+        grade: index
+        for index, grade in enumerate(('A+', 'A', 'A-', 'B+', 'B', 'B-', 'C+', 'C', 'C-', 'D+', 'D', 'D-', 'F+', 'F', 'F-'))
+}
+_ROUND_GRADE_ORDER = {
+        f'{phase}-round {draft_round}': draft_round * 10 + offset
+        for draft_round in range(1, 8)
+        for offset, phase in enumerate(('early', 'mid', 'late'))
+}
+_UNGRADED_PRIORITY = (9, 999)
+
+
+def _grade_priority(grade):
+        """(system, ordinal) sort priority of a grade string; lower sorts first"""
+        if not grade:
+                return _UNGRADED_PRIORITY
+        grade = grade.strip()
+        grade_lower = grade.lower()
+
+        if grade_lower.startswith('poker chip - '):
+                chip = grade_lower.replace('poker chip - ', '').strip()
+                return (0, _POKER_CHIP_ORDER.get(chip, 99))
+
+        # Numerical system: 100-0, higher is better
+        if grade_lower.startswith('numerical - '):
+                numeric_text = grade_lower.replace('numerical - ', '').strip()
+                try:
+                        numeric_grade = max(0, min(100, int(numeric_text)))
+                except ValueError:
+                        return _UNGRADED_PRIORITY
+                return (1, 100 - numeric_grade)
+
+        if grade_lower.startswith('alphabet - '):
+                alpha = grade.replace('Alphabet - ', '').strip().upper()
+                if alpha in _ALPHA_GRADE_ORDER:
+                        return (2, _ALPHA_GRADE_ORDER[alpha])
+                return _UNGRADED_PRIORITY
+
+        if grade_lower == 'udfa (undrafted free agent)' or grade_lower == 'udfa':
+                return (3, 100)
+
+        if grade_lower in _ROUND_GRADE_ORDER:
+                return (3, _ROUND_GRADE_ORDER[grade_lower])
+
+        return _UNGRADED_PRIORITY
+
+
+def _grade_sort_key(grade):
+        """_grade_priority packed into the integer stored in players.grade_sort_key"""
+        system, ordinal = _grade_priority(grade)
+        return system * 1000 + ordinal
+
+
+def _serialized_write(method):
+        """Run a bulk write method while holding the instance's (re-entrant) writer lock"""
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+                with self._writer_lock:
+                        return method(self, *args, **kwargs)
+        return wrapper
+
+
+class _PooledConnection:
+        """Thin proxy over a pooled sqlite3 connection; close() hands it back to the pool."""
+
+        def __init__(self, pool, raw_conn):
+                self._pool = pool
+                self._conn = raw_conn
+
+        def __getattr__(self, name):
+                if self._conn is None:
+                        raise sqlite3.ProgrammingError('Cannot operate on a closed database.')
+                return getattr(self._conn, name)
+
+        def commit(self):
+                if self._conn is None:
+                        raise sqlite3.ProgrammingError('Cannot operate on a closed database.')
+                wrote = self._conn.in_transaction
+                self._conn.commit()
+                if wrote:
+                        self._pool.bump_generation()
+
+        def close(self):
+                if self._conn is None:
+                        return
+                raw_conn, self._conn = self._conn, None
+                self._pool.release(raw_conn)
+
+
+class _ConnectionPool:
+        """Keeps long-lived SQLite connections around instead of reconnecting per call.
+
+        Connections are opened with check_same_thread=False so a connection released by
+        one waitress worker can be reused by another; a connection is only ever used by
+        one thread at a time because it is handed out exclusively until released.
+        """
+
+        def __init__(self, db_name, max_idle=8, busy_timeout_ms=5000, cache_size_kib=16384,
+                     mmap_size=67108864, synchronous='NORMAL'):
+                self.db_name = db_name
+                self.max_idle = max(1, int(max_idle))
+                self.busy_timeout_ms = max(0, int(busy_timeout_ms))
+                self.cache_size_kib = int(cache_size_kib)
+                self.mmap_size = max(0, int(mmap_size))
+                self.synchronous = (synchronous or 'NORMAL').upper()
+                if self.synchronous not in {'OFF', 'NORMAL', 'FULL', 'EXTRA'}:
+                        self.synchronous = 'NORMAL'
+
+                self._idle = []
+                self._lock = threading.Lock()
+                self._closed = False
+                self.generation = 0
+
+        def bump_generation(self):
+                """Advance the data generation; called after every commit that wrote something"""
+                with self._lock:
+                        self.generation += 1
+                        return self.generation
+
+        def _open(self):
+                conn = sqlite3.connect(
+                        self.db_name,
+                        timeout=self.busy_timeout_ms / 1000.0,
+                        check_same_thread=False
+                )
+                conn.execute(f'PRAGMA busy_timeout = {self.busy_timeout_ms}')
+                conn.execute('PRAGMA journal_mode = WAL')
+                conn.execute(f'PRAGMA synchronous = {self.synchronous}')
+                conn.execute(f'PRAGMA cache_size = -{abs(self.cache_size_kib)}')
+                conn.execute(f'PRAGMA mmap_size = {self.mmap_size}')
+                conn.execute('PRAGMA temp_store = MEMORY')
+                return conn
+
+        def acquire(self):
+                with self._lock:
+                        if self._closed:
+                                raise sqlite3.ProgrammingError('Connection pool is closed.')
+                        raw_conn = self._idle.pop() if self._idle else None
+
+                if raw_conn is None:
+                        raw_conn = self._open()
+                return _PooledConnection(self, raw_conn)
+
+        def release(self, raw_conn):
+                try:
+                        if raw_conn.in_transaction:
+                                raw_conn.rollback()
+                except sqlite3.Error:
+                        raw_conn.close()
+                        return
+
+                with self._lock:
+                        if not self._closed and len(self._idle) < self.max_idle:
+                                self._idle.append(raw_conn)
+                                return
+
+                raw_conn.close()
+
+        def close_all(self):
+                with self._lock:
+                        self._closed = True
+                        idle, self._idle = self._idle, []
+
+                for raw_conn in idle:
+                        try:
+                                raw_conn.close()
+                        except sqlite3.Error:
+                                pass
+
+
+class _ReadCache:
+        """LRU of read results stamped with the data generation they were computed at.
+
+        An entry is only served while the pool generation still matches its stamp, so any
+        committed write invalidates every cached result at once.
+        """
+
+        def __init__(self, max_entries=256):
+                self.max_entries = max(0, int(max_entries))
+                self._entries = OrderedDict()
+                self._lock = threading.Lock()
+                self.hits = 0
+                self.misses = 0
+                self.evictions = 0
+
+        def get(self, key, generation):
+                with self._lock:
+                        entry = self._entries.get(key)
+                        if entry is not None and entry[0] == generation:
+                                self._entries.move_to_end(key)
+                                self.hits += 1
+                                return True, entry[1]
+                        self.misses += 1
+                        return False, None
+
+        def put(self, key, generation, value):
+                if not self.max_entries:
+                        return
+                with self._lock:
+                        current = self._entries.get(key)
+                        if current is not None and current[0] > generation:
+                                return
+                        self._entries[key] = (generation, value)
+                        self._entries.move_to_end(key)
+                        while len(self._entries) > self.max_entries:
+                                self._entries.popitem(last=False)
+                                self.evictions += 1
+
+        def clear(self):
+                with self._lock:
+                        self._entries.clear()
+
+        def stats(self):
+                with self._lock:
+                        lookups = self.hits + self.misses
+                        return {
+                                'entries': len(self._entries),
+                                'max_entries': self.max_entries,
+                                'hits': self.hits,
+                                'misses': self.misses,
+                                'evictions': self.evictions,
+                                'hit_ratio': round(self.hits / lookups, 4) if lookups else None
+                        }
+
+
+class _ImportTimings:
+        """Wall time spent per import pipeline stage, in milliseconds"""
+
+        def __init__(self):
+                self._seconds = OrderedDict()
+
+        def add(self, name, seconds):
+                self._seconds[name] = self._seconds.get(name, 0.0) + seconds
+
+        def seconds(self, name):
+                return self._seconds.get(name, 0.0)
+
+        @contextmanager
+        def stage(self, name):
+                started = time.perf_counter()
+                try:
+                        yield
+                finally:
+                        self.add(name, time.perf_counter() - started)
+
+        def timed(self, name, iterable):
+                """Yield from iterable, charging the time spent producing items to the named stage"""
+                iterator = iter(iterable)
+                while True:
+                        started = time.perf_counter()
+                        try:
+                                item = next(iterator)
+                        except StopIteration:
+                                self.add(name, time.perf_counter() - started)
+                                return
+                        self.add(name, time.perf_counter() - started)
+                        yield item
+
+        def as_dict(self):
+                timings = {name: round(seconds * 1000, 2) for name, seconds in self._seconds.items()}
+                timings['total'] = round(sum(self._seconds.values()) * 1000, 2)
+                return timings
+
+
 class ScoutDatabase:
-        def __init__(self, db_name='scout_database.db'):
+        def __init__(self, db_name='scout_database.db', pool_size=8, busy_timeout_ms=5000,
+                     cache_size_kib=16384, mmap_size=67108864, synchronous='NORMAL',
+                     defer_rank_recalculation=False, rank_recalc_debounce_seconds=0.25, read_cache_size=256):
                 self.db_name = db_name
+                self.last_recalculation = {}
+                self._players_column_names = None
+                self._read_cache = _ReadCache(read_cache_size)
+                #Serializes imports, merges and rank recalculations (the scheduler runs under it too)
+                self._writer_lock = threading.RLock()
+                self._pool = _ConnectionPool(
+                        db_name,
+                        max_idle=pool_size,
+                        busy_timeout_ms=busy_timeout_ms,
+                        cache_size_kib=cache_size_kib,
+                        mmap_size=mmap_size,
+                        synchronous=synchronous
+                )
+                self._rank_scheduler = RankRecalcScheduler(
+                        self.recalculate_changed_rankings,
+                        deferred=defer_rank_recalculation,
+                        debounce_seconds=rank_recalc_debounce_seconds,
+                        run_lock=self._writer_lock
+                )
                 self.init_database()
 
         def get_connection(self):
-                """Create connection to the database"""
-                return sqlite3.connect(self.db_name)
+                """Borrow a pooled connection to the database (WAL mode; close() returns it to the pool)"""
+                return self._pool.acquire()
+
+        def close(self):
+                """Stop the rank scheduler and close every pooled connection"""
+                self._rank_scheduler.stop()
+                self._pool.close_all()
+
+        def request_rank_recalculation(self):
+                """Schedule an incremental rank recalculation and return its ranking generation.
+
+                With defer_rank_recalculation=True requests are debounced and coalesced on a
+                background thread; otherwise the recalculation runs before this returns.
+                """
+                return self._rank_scheduler.request()
+
+        def wait_for_rankings(self, generation=None, timeout=None):
+                """Wait until the given (default: latest) ranking generation has been applied"""
+                if generation is None:
+                        return self._rank_scheduler.flush(timeout=timeout)
+                return self._rank_scheduler.wait(generation, timeout=timeout)
+
+        def get_ranking_status(self):
+                return self._rank_scheduler.status()
+
+        @property
+        def data_generation(self):
+                """Counter bumped by every committed write made through this instance"""
+                return self._pool.generation
+
+        def _cached_read(self, key, compute):
+                """Serve compute() from the read cache while the data generation is unchanged.
+
+                The generation is captured before computing, so a write that commits meanwhile
+                leaves the entry stamped with an already stale generation. Callers get a copy
+                (one level deep) and can modify it freely.
+                """
+                generation = self._pool.generation
+                hit, value = self._read_cache.get(key, generation)
+                if not hit:
+                        value = compute()
+                        self._read_cache.put(key, generation, value)
+                return self._copy_cached(value)
+
+        @staticmethod
+        def _copy_cached(value):
+                if isinstance(value, list):
+                        return [dict(item) if isinstance(item, dict) else item for item in value]
+                if isinstance(value, dict):
+                        return dict(value)
+                return value
+
+        def _read_with_cursor(self, select, *args):
+                """Run select(cursor, *args) on a borrowed connection"""
+                conn = self.get_connection()
+                try:
+                        return select(conn.cursor(), *args)
+                finally:
+                        conn.close()
+
+        def get_read_cache_stats(self):
+                stats = self._read_cache.stats()
+                stats['data_generation'] = self._pool.generation
+                return stats
+
+        def invalidate_read_cache(self):
+                """Drop cached reads, e.g. after the database file was changed by another process"""
+                self._pool.bump_generation()
+                self._read_cache.clear()
 
         def init_database(self):
                 """Initalize the database with required tables"""
@@ -51,6 +435,13 @@ class ScoutDatabase:
                         cursor.execute('ALTER TABLE players ADD COLUMN tankathon_rank INTEGER')
                 if 'weighted_avg_rank' not in existing_columns:
                         cursor.execute('ALTER TABLE players ADD COLUMN weighted_avg_rank REAL')
+                if 'effective_rank' not in existing_columns:
+                        cursor.execute('ALTER TABLE players ADD COLUMN effective_rank REAL')
+                if 'normalized_name' not in existing_columns:
+                        cursor.execute('ALTER TABLE players ADD COLUMN normalized_name TEXT')
+                if 'grade_sort_key' not in existing_columns:
+                        #Rows inserted without a grade default to the ungraded key
+                        cursor.execute(f'ALTER TABLE players ADD COLUMN grade_sort_key INTEGER DEFAULT {_grade_sort_key(None)}')
 
                 cursor.execute('''
                         CREATE TABLE IF NOT EXISTS rank_boards (
@@ -63,6 +454,9 @@ class ScoutDatabase:
                                 created_at TEXT
                         )
                 ''')
+                cursor.execute('PRAGMA table_info(rank_boards)')
+                if 'content_hash' not in [row[1] for row in cursor.fetchall()]:
+                        cursor.execute('ALTER TABLE rank_boards ADD COLUMN content_hash TEXT')
 
                 cursor.execute('''
                         CREATE TABLE IF NOT EXISTS player_board_ranks (
@@ -80,6 +474,14 @@ class ScoutDatabase:
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_player_board_ranks_player_id ON player_board_ranks(player_id)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_player_board_ranks_board_rank ON player_board_ranks(board_id, board_rank)')
 
+                #A board whose ranks were deleted outside an import no longer matches its fingerprint
+                cursor.execute('''
+                        CREATE TRIGGER IF NOT EXISTS player_board_ranks_ad_content_hash AFTER DELETE ON player_board_ranks
+                        BEGIN
+                                UPDATE rank_boards SET content_hash = NULL WHERE id = old.board_id AND content_hash IS NOT NULL;
+                        END
+                ''')
+
                 cursor.execute('''
                         INSERT OR IGNORE INTO rank_boards (board_key, board_name, source_type, weight, is_primary, created_at)
                         VALUES ('tankathon', 'Tankathon Big Board', 'tankathon', 1.0, 0, ?)
@@ -121,10 +523,181 @@ class ScoutDatabase:
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_players_scouted_rank ON players(scouted, rank)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_players_school ON players(school)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_big_board_entries_board_rank ON big_board_entries(board_id, rank_order)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_players_effective_rank_name ON players(effective_rank, name)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_players_normalized_name ON players(normalized_name, id)')
+                #Board sorts are driven from big_board_entries, so a players-side grade index would never be used
+                cursor.execute('DROP INDEX IF EXISTS idx_players_grade_sort_key')
+
+                #normalized_name is written together with the name; rows from older databases or raw SQL are filled here
+                cursor.execute('DROP TRIGGER IF EXISTS players_normalized_name_au')
+                self._backfill_normalized_names(cursor)
+
+                #grade_sort_key is written together with the grade; rows from older databases or raw SQL are filled here
+                cursor.execute('DROP TRIGGER IF EXISTS players_grade_sort_key_au')
+                self._backfill_grade_sort_keys(cursor)
+
+                #One row per listed position ("EDGE/LB" -> EDGE primary, LB), synced by triggers
+                self._ensure_player_positions(cursor)
+
+                #Full-text index over the searchable text columns (external content, synced by triggers)
+                self.fts_enabled = self._ensure_players_fts(cursor)
+
+                #Confirmed alternate spellings (normalized) of a player's name, consulted when resolving imports
+                cursor.execute('''
+                        CREATE TABLE IF NOT EXISTS player_aliases (
+                                alias TEXT PRIMARY KEY,
+                                player_id INTEGER NOT NULL,
+                                source TEXT NOT NULL DEFAULT 'manual',
+                                score REAL,
+                                created_at TEXT,
+                                FOREIGN KEY(player_id) REFERENCES players(id) ON DELETE CASCADE
+                        )
+                ''')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_player_aliases_player_id ON player_aliases(player_id)')
+
+                #Uncorroborated approximate matches, kept until a user confirms (add_player_alias) or dismisses them
+                cursor.execute('''
+                        CREATE TABLE IF NOT EXISTS player_alias_suggestions (
+                                alias TEXT NOT NULL,
+                                player_id INTEGER NOT NULL,
+                                name TEXT NOT NULL,
+                                score REAL,
+                                created_at TEXT,
+                                PRIMARY KEY(alias, player_id),
+                                FOREIGN KEY(player_id) REFERENCES players(id) ON DELETE CASCADE
+                        )
+                ''')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_player_alias_suggestions_player_id ON player_alias_suggestions(player_id)')
+
+                #Players whose effective rank may have changed since the last recalculation
+                cursor.execute('''
+                        CREATE TABLE IF NOT EXISTS rank_recalc_queue (
+                                player_id INTEGER PRIMARY KEY,
+                                previous_position TEXT
+                        )
+                ''')
 
                 conn.commit()
                 conn.close()
 
+        @staticmethod
+        def _ensure_player_positions(cursor):
+                """Create the player_positions junction table, its sync triggers and backfill it once"""
+                cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'player_positions'")
+                exists = cursor.fetchone() is not None
+
+                cursor.execute('''
+                        CREATE TABLE IF NOT EXISTS player_positions (
+                                player_id INTEGER NOT NULL,
+                                position TEXT NOT NULL,
+                                is_primary INTEGER NOT NULL DEFAULT 0,
+                                PRIMARY KEY(player_id, position),
+                                FOREIGN KEY(player_id) REFERENCES players(id) ON DELETE CASCADE
+                        ) WITHOUT ROWID
+                ''')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_player_positions_position ON player_positions(position, is_primary, player_id)')
+
+                #Slash-separated position text becomes a JSON array so triggers can split it without a CTE
+                split_positions = '''
+                        INSERT OR IGNORE INTO player_positions (player_id, position, is_primary)
+                        SELECT {player}.id, UPPER(TRIM(parts.value)), CASE WHEN parts.key = 0 THEN 1 ELSE 0 END
+                        FROM json_each('["' || REPLACE(REPLACE(REPLACE({player}.position, '\\', '\\\\'), '"', '\\"'), '/', '","') || '"]') AS parts
+                        WHERE TRIM(parts.value) != ''
+                '''
+
+                cursor.execute(f'''
+                        CREATE TRIGGER IF NOT EXISTS players_positions_ai AFTER INSERT ON players
+                        WHEN new.position IS NOT NULL AND new.position != '' BEGIN
+                                {split_positions.format(player='new')};
+                        END
+                ''')
+                cursor.execute(f'''
+                        CREATE TRIGGER IF NOT EXISTS players_positions_au AFTER UPDATE OF position ON players BEGIN
+                                DELETE FROM player_positions WHERE player_id = old.id;
+                                {split_positions.format(player='new')}
+                                  AND new.position IS NOT NULL AND new.position != '';
+                        END
+                ''')
+                cursor.execute('''
+                        CREATE TRIGGER IF NOT EXISTS players_positions_ad AFTER DELETE ON players BEGIN
+                                DELETE FROM player_positions WHERE player_id = old.id;
+                        END
+                ''')
+
+                if not exists:
+                        cursor.execute(
+                                split_positions.format(player='players').replace('FROM json_each', 'FROM players, json_each', 1)
+                                + " AND players.position IS NOT NULL AND players.position != ''"
+                        )
+
+        @staticmethod
+        def _ensure_players_fts(cursor):
+                """Create the players_fts FTS5 index and its sync triggers. Returns False when FTS5 is unavailable."""
+                cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'players_fts'")
+                exists = cursor.fetchone() is not None
+
+                try:
+                        if exists:
+                                cursor.execute('SELECT rowid FROM players_fts LIMIT 0')
+                        else:
+                                cursor.execute('''
+                                        CREATE VIRTUAL TABLE players_fts USING fts5(
+                                                name, school, notes, games_watched,
+                                                content='players',
+                                                content_rowid='id',
+                                                tokenize='unicode61 remove_diacritics 2',
+                                                prefix='2 3'
+                                        )
+                                ''')
+                except sqlite3.OperationalError:
+                        return False
+
+                cursor.execute('''
+                        CREATE TRIGGER IF NOT EXISTS players_fts_ai AFTER INSERT ON players BEGIN
+                                INSERT INTO players_fts (rowid, name, school, notes, games_watched)
+                                VALUES (new.id, new.name, new.school, new.notes, new.games_watched);
+                        END
+                ''')
+                cursor.execute('''
+                        CREATE TRIGGER IF NOT EXISTS players_fts_ad AFTER DELETE ON players BEGIN
+                                INSERT INTO players_fts (players_fts, rowid, name, school, notes, games_watched)
+                                VALUES ('delete', old.id, old.name, old.school, old.notes, old.games_watched);
+                        END
+                ''')
+                cursor.execute('''
+                        CREATE TRIGGER IF NOT EXISTS players_fts_au AFTER UPDATE OF name, school, notes, games_watched ON players BEGIN
+                                INSERT INTO players_fts (players_fts, rowid, name, school, notes, games_watched)
+                                VALUES ('delete', old.id, old.name, old.school, old.notes, old.games_watched);
+                                INSERT INTO players_fts (rowid, name, school, notes, games_watched)
+                                VALUES (new.id, new.name, new.school, new.notes, new.games_watched);
+                        END
+                ''')
+
+                if not exists:
+                        cursor.execute("INSERT INTO players_fts (players_fts) VALUES ('rebuild')")
+                return True
+
+        @staticmethod
+        def _build_fts_query(term, column=None):
+                """Turn free text into an FTS5 MATCH expression: every token must match as a prefix.
+
+                Tokens are quoted so user input can never be parsed as FTS5 syntax. Returns None when
+                the text contains no searchable tokens.
+                """
+                tokens = re.findall(r'[^\W_]+', term or '')
+                if not tokens:
+                        return None
+                prefix = f'{column} : ' if column else ''
+                return ' AND '.join(f'{prefix}"{token}"*' for token in tokens)
+
+        @staticmethod
+        def _format_search_snippet(snippet):
+                """HTML-escape an FTS snippet and turn its match markers into <mark> tags"""
+                if not snippet or _SNIPPET_OPEN not in snippet:
+                        return None
+                escaped = html.escape(snippet)
+                return escaped.replace(_SNIPPET_OPEN, '<mark>').replace(_SNIPPET_CLOSE, '</mark>')
+
         @staticmethod
         def _slugify_board_key(name):
                 cleaned = re.sub(r'[^a-z0-9]+', '_', (name or '').lower()).strip('_')
@@ -133,9 +706,11 @@ class ScoutDatabase:
                 return cleaned[:70]
 
         def _get_or_create_rank_board(self, cursor, board_key, board_name, source_type='imported', weight=1.0, is_primary=0):
-                cursor.execute('SELECT id FROM rank_boards WHERE board_key = ?', (board_key,))
+                cursor.execute('SELECT id, weight, is_primary FROM rank_boards WHERE board_key = ?', (board_key,))
                 existing = cursor.fetchone()
                 if existing:
+                        if float(existing[1] or 0.0) != float(weight) or int(existing[2] or 0) != int(is_primary):
+                                self._mark_rankings_dirty(cursor, board_ids=[existing[0]])
                         cursor.execute('''
                                 UPDATE rank_boards
                                 SET board_name = ?, source_type = ?, weight = ?, is_primary = ?
@@ -155,79 +730,873 @@ class ScoutDatabase:
                 if existing:
                         return existing[0]
 
-                cursor.execute('INSERT INTO players (name) VALUES (?)', (player_name,))
-                return cursor.lastrowid
+                return self._insert_player_by_name(cursor, player_name)
 
-        def _upsert_board_rank_entries(self, cursor, board_key, board_name, entries, source_type='imported', weight=1.0, is_primary=0):
-                board_id = self._get_or_create_rank_board(
-                        cursor,
-                        board_key=board_key,
-                        board_name=board_name,
-                        source_type=source_type,
-                        weight=weight,
-                        is_primary=is_primary
+        def _insert_player_by_name(self, cursor, player_name, position=None, school=None):
+                cursor.execute(
+                        'INSERT INTO players (name, normalized_name, position, school, grade_sort_key) VALUES (?, ?, ?, ?, ?)',
+                        (player_name, self._normalize_player_name(player_name), position, school, _grade_sort_key(None))
                 )
+                return cursor.lastrowid
 
-                cursor.execute('DELETE FROM player_board_ranks WHERE board_id = ?', (board_id,))
+        def _backfill_normalized_names(self, cursor):
+                """Fill normalized_name for rows inserted outside the helpers (raw SQL, older databases). Returns rows updated."""
+                cursor.execute('SELECT id, name FROM players WHERE normalized_name IS NULL')
+                updates = [(self._normalize_player_name(name), player_id) for player_id, name in cursor.fetchall()]
+                if updates:
+                        cursor.executemany('UPDATE players SET normalized_name = ? WHERE id = ?', updates)
+                return len(updates)
 
-                cursor.execute('SELECT id, name FROM players')
-                existing_players = cursor.fetchall()
-                normalized_lookup = {}
-                for existing_player_id, existing_name in existing_players:
-                        normalized_name = self._normalize_player_name(existing_name)
-                        if normalized_name and normalized_name not in normalized_lookup:
-                                normalized_lookup[normalized_name] = existing_player_id
+        def _backfill_grade_sort_keys(self, cursor):
+                """Fill grade_sort_key for rows inserted outside the helpers (raw SQL, older databases). Returns rows updated."""
+                cursor.execute('SELECT id, grade FROM players WHERE grade_sort_key IS NULL')
+                updates = [(_grade_sort_key(grade), player_id) for player_id, grade in cursor.fetchall()]
+                if updates:
+                        cursor.executemany('UPDATE players SET grade_sort_key = ? WHERE id = ?', updates)
+                return len(updates)
 
-                matched_count = 0
-                new_player_count = 0
-                seen_player_ids = set()
+        @staticmethod
+        def _content_fingerprint(value):
+                return hashlib.sha1(json.dumps(value, sort_keys=True, separators=(',', ':')).encode('utf-8')).hexdigest()
+
+        def _find_unchanged_rank_board(self, cursor, board_key, content_hash, board_name, source_type='imported', weight=1.0, is_primary=0):
+                """Return a board result when the stored board already matches this import, else None"""
+                cursor.execute('''
+                        SELECT id FROM rank_boards
+                        WHERE board_key = ? AND content_hash = ? AND board_name = ? AND source_type = ?
+                          AND weight = ? AND is_primary = ?
+                ''', (board_key, content_hash, board_name, source_type, float(weight), int(is_primary)))
+                existing = cursor.fetchone()
+                if not existing:
+                        return None
+
+                cursor.execute('SELECT COUNT(*) FROM player_board_ranks WHERE board_id = ?', (existing[0],))
+                return {
+                        'board_id': existing[0],
+                        'matched_count': cursor.fetchone()[0],
+                        'new_player_count': 0,
+                        'unchanged': True,
+                        'added': 0,
+                        'moved': 0,
+                        'dropped': 0
+                }
+
+        def _run_import_pipeline(self, boards, progress=None, recalculate=True):
+                """Import rank boards through the shared stages: parse, normalize, resolve, enrich, write, recalc.
+
+                boards is an iterable of board specs: dicts with board_key, board_name, source_type,
+                weight, is_primary, enrich and entries. entries may be any iterable (a generator is
+                consumed lazily) of {'name', 'rank'} dicts. With enrich='fill_blank' their
+                'position'/'school' fill blank player fields. With enrich='overwrite' their 'details'
+                dict overwrites the _IMPORT_DETAIL_COLUMNS. Every stage is set-based or batched with
+                executemany, and boards whose fingerprint matches the stored one are skipped before
+                resolution. progress, when given, is called with each stage name from 'normalize' on.
+
+                Returns {'boards': [per-board result], 'players_total_ranked', 'ranking_generation',
+                'timings_ms'}. Boards without usable entries come back with empty=True and are not written.
+                """
+                timings = _ImportTimings()
+                conn = self.get_connection()
+                cursor = conn.cursor()
+                try:
+                        if progress:
+                                progress('normalize')
+                        self._create_board_import_stage(cursor)
+                        started = time.perf_counter()
+                        planned_boards = self._stage_import_entries(cursor, boards, timings)
+                        #Parsing happens lazily while entries are consumed; keep it out of the normalize time
+                        timings.add('normalize', time.perf_counter() - started - timings.seconds('parse'))
+
+                        if progress:
+                                progress('resolve')
+                        with timings.stage('resolve'):
+                                self._skip_unchanged_boards(cursor, planned_boards)
+                                self._backfill_normalized_names(cursor)
+                                self._resolve_board_import_stage(cursor)
+                                approximate_matches, alias_suggestions = self._resolve_stage_approximately(cursor)
+                                new_player_counts = self._insert_unresolved_stage_players(cursor)
+                                for planned in planned_boards:
+                                        if planned['result'] is None:
+                                                planned['new_player_count'] = new_player_counts.get(planned['board_index'], 0)
+
+                        if progress:
+                                progress('enrich')
+                        with timings.stage('enrich'):
+                                self._enrich_staged_players(cursor)
+
+                        if progress:
+                                progress('write')
+                        with timings.stage('write'):
+                                cursor.execute('''
+                                        INSERT OR IGNORE INTO board_import_ranks (board_index, player_id, board_rank)
+                                        SELECT board_index, player_id, board_rank FROM board_import_stage ORDER BY ord
+                                ''')
+                                for planned in planned_boards:
+                                        if planned['result'] is None and not planned['empty']:
+                                                planned['result'] = self._write_staged_board(cursor, planned)
+
+                                cursor.execute('SELECT COUNT(*) FROM players')
+                                ranked_count = cursor.fetchone()[0]
+                                rankings_dirty = self._rankings_dirty(cursor)
+                                conn.commit()
+                finally:
+                        conn.close()
+
+                with timings.stage('recalc'):
+                        ranking_generation = self.request_rank_recalculation() if recalculate and rankings_dirty else None
+
+                board_results = []
+                for planned in planned_boards:
+                        result = planned['result'] or {
+                                'board_id': None, 'matched_count': 0, 'new_player_count': 0,
+                                'unchanged': False, 'added': 0, 'moved': 0, 'dropped': 0
+                        }
+                        board_results.append(dict(
+                                result,
+                                board_key=planned['spec']['board_key'],
+                                board_name=planned['spec']['board_name'],
+                                weight=planned['spec']['weight'],
+                                entries=planned['entries'],
+                                empty=planned['empty']
+                        ))
+
+                return {
+                        'boards': board_results,
+                        'players_total_ranked': ranked_count,
+                        'ranking_generation': ranking_generation,
+                        'approximate_matches': approximate_matches,
+                        'alias_suggestions': alias_suggestions,
+                        'timings_ms': timings.as_dict()
+                }
+
+        def _stage_import_entries(self, cursor, boards, timings, batch_size=500):
+                """Normalize every board's entries into board_import_stage in executemany batches"""
+                planned_boards = []
+                batch = []
+                ord_counter = 0
+                for board_index, spec in enumerate(boards):
+                        fill_blank = spec.get('enrich') == 'fill_blank'
+                        fingerprint = hashlib.sha1()
+                        entry_count = 0
+                        for entry in timings.timed('parse', spec.get('entries') or []):
+                                name = (entry.get('name') or '').strip()
+                                rank_value = entry.get('rank')
+                                if not name or rank_value is None:
+                                        continue
+                                try:
+                                        rank_value = float(rank_value)
+                                except (TypeError, ValueError):
+                                        continue
+
+                                normalized_name = self._normalize_player_name(name)
+                                position = (entry.get('position') or '').strip() if fill_blank else ''
+                                school = (entry.get('school') or '').strip() if fill_blank else ''
+                                details = entry.get('details')
+                                details_json = json.dumps(details, sort_keys=True) if details is not None else None
+                                fingerprint.update(json.dumps([rank_value, normalized_name, position, school, details_json]).encode('utf-8'))
+
+                                #Names that normalize to nothing only match (and create) themselves
+                                identity_key = normalized_name if normalized_name else f'={name}'
+                                batch.append((ord_counter, board_index, name, normalized_name, identity_key, rank_value, position, school, details_json))
+                                ord_counter += 1
+                                entry_count += 1
+                                if len(batch) >= batch_size:
+                                        self._insert_stage_batch(cursor, batch)
+                                        batch = []
+
+                        planned_boards.append({
+                                'board_index': board_index,
+                                'spec': spec,
+                                'entries': entry_count,
+                                'empty': entry_count == 0,
+                                'content_hash': fingerprint.hexdigest(),
+                                'new_player_count': 0,
+                                'result': None
+                        })
+
+                if batch:
+                        self._insert_stage_batch(cursor, batch)
+                return planned_boards
 
-                for entry in entries:
-                        player_name = (entry.get('name') or '').strip()
-                        rank_value = entry.get('rank')
-                        if not player_name or rank_value is None:
+        @staticmethod
+        def _insert_stage_batch(cursor, rows):
+                cursor.executemany('''
+                        INSERT INTO board_import_stage
+                        (ord, board_index, name, normalized_name, identity_key, board_rank, position, school, details)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', rows)
+
+        def _skip_unchanged_boards(self, cursor, planned_boards):
+                """Drop staged rows of boards whose fingerprint and settings match the stored board"""
+                for planned in planned_boards:
+                        if planned['empty']:
                                 continue
+                        spec = planned['spec']
+                        if spec['is_primary']:
+                                cursor.execute('SELECT 1 FROM rank_boards WHERE is_primary = 1 AND board_key != ?', (spec['board_key'],))
+                                if cursor.fetchone():
+                                        continue
+                        unchanged = self._find_unchanged_rank_board(
+                                cursor, spec['board_key'], planned['content_hash'], spec['board_name'],
+                                source_type=spec['source_type'], weight=spec['weight'], is_primary=spec['is_primary']
+                        )
+                        if unchanged:
+                                planned['result'] = unchanged
+                                cursor.execute('DELETE FROM board_import_stage WHERE board_index = ?', (planned['board_index'],))
 
-                        cursor.execute('SELECT id FROM players WHERE name = ?', (player_name,))
-                        existing_player = cursor.fetchone()
-                        if existing_player:
-                                player_id = existing_player[0]
-                        else:
-                                normalized_name = self._normalize_player_name(player_name)
-                                player_id = normalized_lookup.get(normalized_name)
-                                if not player_id:
-                                        player_id = self._ensure_player_exists_by_name(cursor, player_name)
-                                        new_player_count += 1
-                                        if normalized_name:
-                                                normalized_lookup[normalized_name] = player_id
-
-                        if player_id in seen_player_ids:
+        @staticmethod
+        def _create_board_import_stage(cursor):
+                cursor.execute('''
+                        CREATE TEMP TABLE IF NOT EXISTS board_import_stage (
+                                ord INTEGER PRIMARY KEY,
+                                board_index INTEGER NOT NULL,
+                                name TEXT NOT NULL,
+                                normalized_name TEXT NOT NULL,
+                                identity_key TEXT NOT NULL,
+                                board_rank REAL NOT NULL,
+                                position TEXT NOT NULL DEFAULT '',
+                                school TEXT NOT NULL DEFAULT '',
+                                details TEXT,
+                                player_id INTEGER
+                        )
+                ''')
+                cursor.execute('CREATE INDEX IF NOT EXISTS temp.idx_board_import_stage_identity ON board_import_stage(identity_key, ord)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS temp.idx_board_import_stage_player ON board_import_stage(player_id, ord)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS temp.idx_board_import_stage_board ON board_import_stage(board_index)')
+                cursor.execute('''
+                        CREATE TEMP TABLE IF NOT EXISTS board_import_ranks (
+                                board_index INTEGER NOT NULL,
+                                player_id INTEGER NOT NULL,
+                                board_rank REAL NOT NULL,
+                                PRIMARY KEY (board_index, player_id)
+                        )
+                ''')
+                cursor.execute('DELETE FROM board_import_stage')
+                cursor.execute('DELETE FROM board_import_ranks')
+
+        @staticmethod
+        def _resolve_board_import_stage(cursor):
+                """Match unresolved staged names to players: exact name, then the normalized-name index, then aliases"""
+                cursor.execute('''
+                        UPDATE board_import_stage
+                        SET player_id = (SELECT p.id FROM players p WHERE p.name = board_import_stage.name)
+                        WHERE player_id IS NULL
+                ''')
+                cursor.execute('''
+                        UPDATE board_import_stage
+                        SET player_id = (
+                                SELECT MIN(p.id) FROM players p WHERE p.normalized_name = board_import_stage.normalized_name
+                        )
+                        WHERE player_id IS NULL AND normalized_name != ''
+                ''')
+                cursor.execute('''
+                        UPDATE board_import_stage
+                        SET player_id = (
+                                SELECT a.player_id FROM player_aliases a
+                                JOIN players p ON p.id = a.player_id
+                                WHERE a.alias = board_import_stage.normalized_name
+                        )
+                        WHERE player_id IS NULL AND normalized_name != ''
+                ''')
+
+        def _resolve_stage_approximately(self, cursor):
+                """Match still-unresolved staged identities with IdentityResolver.
+
+                Only corroborated matches (school, or position plus an identical surname) are applied
+                and remembered in player_aliases. Other hits are stored in player_alias_suggestions
+                for a user to confirm, and the staged name goes on to create its own player. A
+                candidate already holding a spot on the same board is never matched again, so two
+                distinct prospects with similar names on one board stay apart.
+
+                Returns (matches, suggestions), each a list of {'name', 'player_id', 'score'}.
+                """
+                cursor.execute('''
+                        SELECT identity_key, board_index, name, normalized_name, position, school, details
+                        FROM board_import_stage
+                        WHERE player_id IS NULL AND normalized_name != ''
+                        ORDER BY ord
+                ''')
+                pending = OrderedDict()
+                for identity_key, board_index, name, normalized_name, position, school, details_json in cursor.fetchall():
+                        identity = pending.get(identity_key)
+                        if identity is None:
+                                details = json.loads(details_json) if details_json else {}
+                                identity = pending[identity_key] = {
+                                        'name': name,
+                                        'normalized_name': normalized_name,
+                                        'position': position or details.get('position') or '',
+                                        'school': school or details.get('school') or '',
+                                        'boards': set()
+                                }
+                        identity['boards'].add(board_index)
+                if not pending:
+                        return [], []
+
+                cursor.execute('SELECT board_index, player_id FROM board_import_stage WHERE player_id IS NOT NULL')
+                taken = {}
+                for board_index, player_id in cursor.fetchall():
+                        taken.setdefault(board_index, set()).add(player_id)
+
+                cursor.execute("SELECT id, normalized_name, position, school FROM players WHERE normalized_name != ''")
+                resolver = IdentityResolver(cursor.fetchall())
+
+                matches = []
+                suggestions = []
+                for identity_key, identity in pending.items():
+                        match = resolver.match(identity['normalized_name'], identity['position'], identity['school'])
+                        if match is None:
                                 continue
-                        seen_player_ids.add(player_id)
+                        if not match.corroborated:
+                                suggestions.append((identity, match))
+                                continue
+                        if any(match.player_id in taken.get(board_index, ()) for board_index in identity['boards']):
+                                continue
+                        for board_index in identity['boards']:
+                                taken.setdefault(board_index, set()).add(match.player_id)
+                        matches.append((identity_key, identity, match))
+
+                created_at = datetime.now().isoformat()
+                if matches:
+                        cursor.executemany(
+                                'UPDATE board_import_stage SET player_id = ? WHERE identity_key = ? AND player_id IS NULL',
+                                [(match.player_id, identity_key) for identity_key, _, match in matches]
+                        )
+                        cursor.executemany('''
+                                INSERT OR IGNORE INTO player_aliases (alias, player_id, source, score, created_at)
+                                VALUES (?, ?, 'approximate', ?, ?)
+                        ''', [(identity['normalized_name'], match.player_id, match.score, created_at) for _, identity, match in matches])
+                if suggestions:
+                        cursor.executemany('''
+                                INSERT OR REPLACE INTO player_alias_suggestions (alias, player_id, name, score, created_at)
+                                VALUES (?, ?, ?, ?, ?)
+                        ''', [(identity['normalized_name'], match.player_id, identity['name'], match.score, created_at) for identity, match in suggestions])
+
+                return (
+                        [{'name': identity['name'], 'player_id': match.player_id, 'score': match.score} for _, identity, match in matches],
+                        [{'name': identity['name'], 'player_id': match.player_id, 'score': match.score} for identity, match in suggestions]
+                )
 
-                        cursor.execute('''
-                                INSERT INTO player_board_ranks (player_id, board_id, board_rank)
-                                VALUES (?, ?, ?)
-                        ''', (player_id, board_id, float(rank_value)))
-                        matched_count += 1
+        def _insert_unresolved_stage_players(self, cursor):
+                """Create one player per unresolved identity, named after its first occurrence.
+
+                Returns {board_index: players created} for the board each identity first appeared on.
+                """
+                first_unresolved_sql = '''
+                        FROM board_import_stage s
+                        WHERE s.player_id IS NULL
+                          AND s.ord = (
+                                SELECT MIN(s2.ord) FROM board_import_stage s2
+                                WHERE s2.player_id IS NULL AND s2.identity_key = s.identity_key
+                          )
+                '''
+                cursor.execute(f'SELECT s.board_index, COUNT(*) {first_unresolved_sql} GROUP BY s.board_index')
+                new_player_counts = dict(cursor.fetchall())
+                if new_player_counts:
+                        cursor.execute(f'''
+                                INSERT INTO players (name, normalized_name, grade_sort_key)
+                                SELECT s.name, s.normalized_name, ? {first_unresolved_sql}
+                                ORDER BY s.ord
+                        ''', (_grade_sort_key(None),))
+                        self._resolve_board_import_stage(cursor)
+                return new_player_counts
+
+        @staticmethod
+        def _enrich_staged_players(cursor):
+                """Apply staged player fields: fill blank position/school, or overwrite detail columns"""
+                cursor.execute('''
+                        INSERT OR IGNORE INTO rank_recalc_queue (player_id, previous_position)
+                        SELECT p.id, p.position
+                        FROM players p
+                        WHERE (p.position IS NULL OR p.position = '')
+                          AND p.id IN (SELECT player_id FROM board_import_stage WHERE position != '')
+                ''')
+                cursor.execute('''
+                        UPDATE players
+                        SET position = CASE
+                                WHEN position IS NULL OR position = '' THEN COALESCE((
+                                        SELECT s.position FROM board_import_stage s
+                                        WHERE s.player_id = players.id AND s.position != '' ORDER BY s.ord LIMIT 1
+                                ), position)
+                                ELSE position
+                        END,
+                        school = CASE
+                                WHEN school IS NULL OR school = '' THEN COALESCE((
+                                        SELECT s.school FROM board_import_stage s
+                                        WHERE s.player_id = players.id AND s.school != '' ORDER BY s.ord LIMIT 1
+                                ), school)
+                                ELSE school
+                        END
+                        WHERE id IN (SELECT player_id FROM board_import_stage WHERE position != '' OR school != '')
+                          AND (position IS NULL OR position = '' OR school IS NULL OR school = '')
+                ''')
+
+                cursor.execute('SELECT player_id, board_rank, details FROM board_import_stage WHERE details IS NOT NULL ORDER BY ord')
+                overwrites = {}
+                for player_id, board_rank, details_json in cursor.fetchall():
+                        if player_id not in overwrites:
+                                overwrites[player_id] = (board_rank, json.loads(details_json))
+                if not overwrites:
+                        return
+
+                cursor.executemany('''
+                        INSERT OR IGNORE INTO rank_recalc_queue (player_id, previous_position)
+                        SELECT id, position FROM players
+                        WHERE id = ? AND (tankathon_rank IS NOT ? OR position IS NOT ?)
+                ''', [
+                        (player_id, details.get('tankathon_rank'), details.get('position'))
+                        for player_id, (_, details) in overwrites.items()
+                ])
+                assignments = ', '.join(f'{column} = ?' for column in _IMPORT_DETAIL_COLUMNS)
+                cursor.executemany(
+                        f'UPDATE players SET rank = COALESCE(rank, ?), {assignments} WHERE id = ?',
+                        [
+                                (board_rank, *[details.get(column) for column in _IMPORT_DETAIL_COLUMNS], player_id)
+                                for player_id, (board_rank, details) in overwrites.items()
+                        ]
+                )
+
+        def _write_staged_board(self, cursor, planned):
+                """Apply one staged board as a set-based diff against its stored ranks and record its fingerprint.
+
+                Players whose board rank was added, moved or dropped are queued in rank_recalc_queue;
+                the counts come back as the change summary.
+                """
+                spec = planned['spec']
+                board_index = planned['board_index']
+                if spec['is_primary']:
+                        cursor.execute('SELECT id FROM rank_boards WHERE is_primary = 1 AND board_key != ?', (spec['board_key'],))
+                        self._mark_rankings_dirty(cursor, board_ids=[row[0] for row in cursor.fetchall()])
+                        cursor.execute('UPDATE rank_boards SET is_primary = 0 WHERE board_key != ?', (spec['board_key'],))
+
+                board_id = self._get_or_create_rank_board(
+                        cursor,
+                        board_key=spec['board_key'],
+                        board_name=spec['board_name'],
+                        source_type=spec['source_type'],
+                        weight=spec['weight'],
+                        is_primary=spec['is_primary']
+                )
+
+                cursor.execute('''
+                        INSERT OR IGNORE INTO rank_recalc_queue (player_id, previous_position)
+                        SELECT p.id, p.position
+                        FROM players p
+                        WHERE p.id IN (
+                                SELECT pbr.player_id FROM player_board_ranks pbr
+                                WHERE pbr.board_id = ?
+                                  AND pbr.player_id NOT IN (SELECT player_id FROM board_import_ranks WHERE board_index = ?)
+                                UNION
+                                SELECT i.player_id FROM board_import_ranks i
+                                LEFT JOIN player_board_ranks pbr ON pbr.board_id = ? AND pbr.player_id = i.player_id
+                                WHERE i.board_index = ? AND (pbr.board_rank IS NULL OR pbr.board_rank != i.board_rank)
+                        )
+                ''', (board_id, board_index, board_id, board_index))
+
+                cursor.execute('''
+                        DELETE FROM player_board_ranks
+                        WHERE board_id = ? AND player_id NOT IN (SELECT player_id FROM board_import_ranks WHERE board_index = ?)
+                ''', (board_id, board_index))
+                dropped_count = cursor.rowcount
+                cursor.execute('''
+                        UPDATE player_board_ranks
+                        SET board_rank = (
+                                SELECT i.board_rank FROM board_import_ranks i
+                                WHERE i.board_index = ? AND i.player_id = player_board_ranks.player_id
+                        )
+                        WHERE board_id = ?
+                          AND player_id IN (
+                                SELECT i.player_id FROM board_import_ranks i
+                                WHERE i.board_index = ? AND i.board_rank != player_board_ranks.board_rank
+                          )
+                ''', (board_index, board_id, board_index))
+                moved_count = cursor.rowcount
+                cursor.execute('''
+                        INSERT INTO player_board_ranks (player_id, board_id, board_rank)
+                        SELECT i.player_id, ?, i.board_rank
+                        FROM board_import_ranks i
+                        WHERE i.board_index = ?
+                          AND NOT EXISTS (
+                                SELECT 1 FROM player_board_ranks pbr WHERE pbr.board_id = ? AND pbr.player_id = i.player_id
+                          )
+                ''', (board_id, board_index, board_id))
+                added_count = cursor.rowcount
+                cursor.execute('UPDATE rank_boards SET content_hash = ? WHERE id = ?', (planned['content_hash'], board_id))
+
+                cursor.execute('SELECT COUNT(*) FROM board_import_ranks WHERE board_index = ?', (board_index,))
+                matched_count = cursor.fetchone()[0]
 
                 return {
                         'board_id': board_id,
                         'matched_count': matched_count,
-                        'new_player_count': new_player_count
+                        'new_player_count': planned['new_player_count'],
+                        'unchanged': False,
+                        'added': added_count,
+                        'moved': moved_count,
+                        'dropped': dropped_count
+                }
+
+        @staticmethod
+        def _change_summary(board_result):
+                return {key: board_result[key] for key in ('added', 'moved', 'dropped')}
+
+        @staticmethod
+        def _rankings_dirty(cursor):
+                """True when rank_recalc_queue holds players whose rankings need recalculating"""
+                cursor.execute('SELECT EXISTS (SELECT 1 FROM rank_recalc_queue)')
+                return bool(cursor.fetchone()[0])
+
+        @_serialized_write
+        def recalculate_default_rankings(self, mode='sql'):
+                """Recalculate displayed rankings using primary board first, then weighted average, then Tankathon fallback.
+
+                mode='sql' computes ranks and positional ranks inside SQLite with window functions in a
+                single transaction; mode='python' runs the original row-by-row implementation.
+                Timings for the last run are kept in self.last_recalculation.
+                """
+                started = time.perf_counter()
+                conn = self.get_connection()
+                cursor = conn.cursor()
+
+                try:
+                        cursor.execute('BEGIN IMMEDIATE')
+                        if mode == 'python':
+                                ranked_count = self._recalculate_default_rankings_python(cursor)
+                                ranked_at = time.perf_counter()
+                                positional_count, position_count = self._calculate_positional_ranks_python(cursor)
+                        else:
+                                mode = 'sql'
+                                ranked_count = self._recalculate_default_rankings_sql(cursor)
+                                ranked_at = time.perf_counter()
+                                positional_count, position_count = self._calculate_positional_ranks_sql(cursor)
+                        positional_at = time.perf_counter()
+                        conn.commit()
+                finally:
+                        conn.close()
+
+                finished = time.perf_counter()
+                self.last_recalculation = {
+                        'mode': mode,
+                        'players_ranked': ranked_count,
+                        'positional_rank_updates': positional_count,
+                        'positions': position_count,
+                        'timings_ms': {
+                                'rankings': round((ranked_at - started) * 1000, 2),
+                                'positional_ranks': round((positional_at - ranked_at) * 1000, 2),
+                                'commit': round((finished - positional_at) * 1000, 2),
+                                'total': round((finished - started) * 1000, 2)
+                        }
                 }
+                print(f"Recalculated rankings for {ranked_count} players ({mode}) in {self.last_recalculation['timings_ms']['total']} ms")
+                return ranked_count
 
-        def recalculate_default_rankings(self):
-                """Recalculate displayed rankings using primary board first, then weighted average, then Tankathon fallback."""
+        def _mark_rankings_dirty(self, cursor, player_ids=None, board_ids=None):
+                """Queue players for the next incremental recalculation.
+
+                Call this before changing a player's position so the queue keeps the position
+                their current positional rank was computed from.
+                """
+                for player_id in player_ids or []:
+                        cursor.execute('''
+                                INSERT OR IGNORE INTO rank_recalc_queue (player_id, previous_position)
+                                SELECT id, position FROM players WHERE id = ?
+                        ''', (player_id,))
+
+                for board_id in board_ids or []:
+                        cursor.execute('''
+                                INSERT OR IGNORE INTO rank_recalc_queue (player_id, previous_position)
+                                SELECT p.id, p.position
+                                FROM player_board_ranks pbr
+                                JOIN players p ON p.id = pbr.player_id
+                                WHERE pbr.board_id = ?
+                        ''', (board_id,))
+
+        @_serialized_write
+        def recalculate_changed_rankings(self, full_rebuild_ratio=0.25):
+                """Recalculate rankings only for players queued in rank_recalc_queue.
+
+                Only the rank range between each changed player's old and new position is
+                rewritten, and positional ranks are recomputed only for the positions those
+                players belong to. Falls back to a full recalculate_default_rankings() when
+                ranks are not a dense 1..N sequence (e.g. after players were deleted) or when
+                more than full_rebuild_ratio of all players are queued.
+                """
+                started = time.perf_counter()
                 conn = self.get_connection()
                 cursor = conn.cursor()
 
+                try:
+                        cursor.execute('BEGIN IMMEDIATE')
+                        cursor.execute('''
+                                INSERT OR IGNORE INTO rank_recalc_queue (player_id, previous_position)
+                                SELECT id, position FROM players WHERE effective_rank IS NULL OR rank IS NULL
+                        ''')
+
+                        cursor.execute('SELECT COUNT(*) FROM rank_recalc_queue')
+                        dirty_count = cursor.fetchone()[0]
+                        cursor.execute('SELECT COUNT(*) FROM players')
+                        player_count = cursor.fetchone()[0]
+                        #Players that were never ranked (no effective_rank yet) are placed as if appended
+                        cursor.execute('''
+                                SELECT COUNT(rank), COUNT(DISTINCT rank), MAX(rank)
+                                FROM players
+                                WHERE effective_rank IS NOT NULL
+                        ''')
+                        ranked_count, distinct_rank_count, max_rank = cursor.fetchone()
+                        cursor.execute('''
+                                SELECT COUNT(*)
+                                FROM rank_recalc_queue q
+                                LEFT JOIN players p ON p.id = q.player_id
+                                WHERE p.id IS NULL
+                        ''')
+                        deleted_count = cursor.fetchone()[0]
+
+                        if dirty_count == 0:
+                                conn.commit()
+                                self.last_recalculation = {
+                                        'mode': 'incremental',
+                                        'players_ranked': player_count,
+                                        'dirty_players': 0,
+                                        'rank_rows_written': 0,
+                                        'positional_rank_updates': 0,
+                                        'timings_ms': {'total': round((time.perf_counter() - started) * 1000, 2)}
+                                }
+                                return player_count
+
+                        dense_ranks = (
+                                deleted_count == 0
+                                and ranked_count == distinct_rank_count
+                                and (max_rank or 0) == ranked_count
+                        )
+                        if not dense_ranks or dirty_count > max(1, player_count * full_rebuild_ratio):
+                                conn.rollback()
+                                conn.close()
+                                conn = None
+                                return self.recalculate_default_rankings()
+
+                        rank_rows_written = self._apply_incremental_rankings(cursor, player_count)
+                        ranked_at = time.perf_counter()
+                        positional_count = self._apply_incremental_positional_ranks(cursor)
+                        cursor.execute('DELETE FROM rank_recalc_queue')
+                        conn.commit()
+                finally:
+                        if conn is not None:
+                                conn.close()
+
+                finished = time.perf_counter()
+                self.last_recalculation = {
+                        'mode': 'incremental',
+                        'players_ranked': player_count,
+                        'dirty_players': dirty_count,
+                        'rank_rows_written': rank_rows_written,
+                        'positional_rank_updates': positional_count,
+                        'timings_ms': {
+                                'rankings': round((ranked_at - started) * 1000, 2),
+                                'positional_ranks': round((finished - ranked_at) * 1000, 2),
+                                'total': round((finished - started) * 1000, 2)
+                        }
+                }
+                return player_count
+
+        def _apply_incremental_rankings(self, cursor, player_count):
+                cursor.execute('''
+                        CREATE TEMP TABLE IF NOT EXISTS rank_dirty (
+                                player_id INTEGER PRIMARY KEY,
+                                name TEXT,
+                                old_rank INTEGER,
+                                weighted_avg_rank REAL,
+                                effective_rank REAL
+                        )
+                ''')
+                cursor.execute('DELETE FROM rank_dirty')
+                cursor.execute(f'''
+                        INSERT INTO rank_dirty (player_id, name, old_rank, weighted_avg_rank, effective_rank)
+                        SELECT e.player_id,
+                               e.name,
+                               CASE WHEN p.effective_rank IS NULL OR p.rank IS NULL THEN ? ELSE p.rank END,
+                               e.weighted_avg_rank,
+                               e.effective_rank
+                        FROM ({self._effective_rank_select_sql(dirty_only=True)}) e
+                        JOIN players p ON p.id = e.player_id
+                ''', (player_count,))
+
+                cursor.execute('''
+                        UPDATE players
+                        SET weighted_avg_rank = (SELECT d.weighted_avg_rank FROM rank_dirty d WHERE d.player_id = players.id),
+                            effective_rank = (SELECT d.effective_rank FROM rank_dirty d WHERE d.player_id = players.id)
+                        WHERE id IN (
+                                SELECT d.player_id
+                                FROM rank_dirty d
+                                JOIN players p ON p.id = d.player_id
+                                WHERE p.weighted_avg_rank IS NOT d.weighted_avg_rank
+                                   OR p.effective_rank IS NOT d.effective_rank
+                        )
+                ''')
+
+                #New dense position of each changed player under (effective_rank, name) ordering
+                cursor.execute('''
+                        SELECT MIN(MIN(old_rank, new_rank)), MAX(MAX(old_rank, new_rank))
+                        FROM (
+                                SELECT d.old_rank,
+                                       1 + (
+                                               SELECT COUNT(*)
+                                               FROM players p
+                                               WHERE (p.effective_rank, p.name) < (d.effective_rank, d.name)
+                                       ) AS new_rank
+                                FROM rank_dirty d
+                        )
+                ''')
+                low_rank, high_rank = cursor.fetchone()
+                if low_rank is None:
+                        return 0
+
+                #Only the window between the lowest and highest moved position can change
+                cursor.execute('''
+                        CREATE TEMP TABLE IF NOT EXISTS rank_window (
+                                player_id INTEGER PRIMARY KEY,
+                                new_rank INTEGER NOT NULL
+                        )
+                ''')
+                cursor.execute('DELETE FROM rank_window')
+                cursor.execute('''
+                        INSERT INTO rank_window (player_id, new_rank)
+                        SELECT id, ? - 1 + ROW_NUMBER() OVER (ORDER BY effective_rank, name)
+                        FROM (
+                                SELECT id, effective_rank, name
+                                FROM players
+                                ORDER BY effective_rank, name
+                                LIMIT ? OFFSET ?
+                        )
+                ''', (low_rank, high_rank - low_rank + 1, low_rank - 1))
+                cursor.execute('''
+                        UPDATE players
+                        SET rank = (SELECT w.new_rank FROM rank_window w WHERE w.player_id = players.id)
+                        WHERE id IN (
+                                SELECT w.player_id
+                                FROM rank_window w
+                                JOIN players p ON p.id = w.player_id
+                                WHERE p.rank IS NOT w.new_rank
+                        )
+                ''')
+                return cursor.rowcount
+
+        def _apply_incremental_positional_ranks(self, cursor):
+                #Overall moves never reorder players within an untouched position, so only the
+                #positions changed players left or joined need renumbering
+                cursor.execute('''
+                        CREATE TEMP TABLE IF NOT EXISTS positional_rank_dirty (
+                                primary_position TEXT PRIMARY KEY
+                        )
+                ''')
+                cursor.execute('DELETE FROM positional_rank_dirty')
+                cursor.execute('''
+                        INSERT OR IGNORE INTO positional_rank_dirty (primary_position)
+                        SELECT UPPER(TRIM(SUBSTR(q.previous_position, 1, INSTR(q.previous_position || '/', '/') - 1)))
+                        FROM rank_recalc_queue q
+                        WHERE q.previous_position IS NOT NULL AND q.previous_position != ''
+                        UNION ALL
+                        SELECT pp.position
+                        FROM rank_recalc_queue q
+                        JOIN player_positions pp ON pp.player_id = q.player_id AND pp.is_primary = 1
+                ''')
+
+                self._create_positional_rank_recalc_table(cursor)
+                cursor.execute('''
+                        INSERT INTO positional_rank_recalc (player_id, primary_position, positional_rank)
+                        SELECT id,
+                               primary_position,
+                               CAST(ROW_NUMBER() OVER (PARTITION BY primary_position ORDER BY rank, id) AS TEXT)
+                        FROM (
+                                SELECT p.id, p.rank, pp.position AS primary_position
+                                FROM player_positions pp
+                                JOIN players p ON p.id = pp.player_id
+                                WHERE pp.is_primary = 1
+                                  AND pp.position IN (SELECT primary_position FROM positional_rank_dirty)
+                        )
+                ''')
+                return self._write_positional_rank_recalc(cursor)
+
+        def _recalculate_default_rankings_sql(self, cursor):
+                cursor.execute('''
+                        CREATE TEMP TABLE IF NOT EXISTS rank_recalc (
+                                player_id INTEGER PRIMARY KEY,
+                                new_rank INTEGER NOT NULL,
+                                weighted_avg_rank REAL,
+                                effective_rank REAL
+                        )
+                ''')
+                cursor.execute('DELETE FROM rank_recalc')
+
+                cursor.execute(f'''
+                        INSERT INTO rank_recalc (player_id, new_rank, weighted_avg_rank, effective_rank)
+                        SELECT player_id,
+                               ROW_NUMBER() OVER (ORDER BY effective_rank, name),
+                               weighted_avg_rank,
+                               effective_rank
+                        FROM ({self._effective_rank_select_sql()})
+                ''')
+                ranked_count = cursor.rowcount
+
+                cursor.execute('''
+                        UPDATE players
+                        SET rank = (SELECT r.new_rank FROM rank_recalc r WHERE r.player_id = players.id),
+                            weighted_avg_rank = (SELECT r.weighted_avg_rank FROM rank_recalc r WHERE r.player_id = players.id),
+                            effective_rank = (SELECT r.effective_rank FROM rank_recalc r WHERE r.player_id = players.id)
+                        WHERE id IN (
+                                SELECT r.player_id
+                                FROM rank_recalc r
+                                JOIN players p ON p.id = r.player_id
+                                WHERE p.rank IS NOT r.new_rank
+                                   OR p.weighted_avg_rank IS NOT r.weighted_avg_rank
+                                   OR p.effective_rank IS NOT r.effective_rank
+                        )
+                ''')
+                cursor.execute('DELETE FROM rank_recalc_queue')
+                return ranked_count
+
+        @staticmethod
+        def _effective_rank_select_sql(dirty_only=False):
+                """SELECT yielding (player_id, name, weighted_avg_rank, effective_rank) per player.
+
+                Same precedence as the Python path: primary board rank, then weighted average
+                over boards with a positive weight, then Tankathon rank, else 999999.
+                dirty_only restricts the result to players in rank_recalc_queue.
+                """
+                rank_filter = 'AND pbr.player_id IN (SELECT player_id FROM rank_recalc_queue)' if dirty_only else ''
+                player_filter = 'WHERE p.id IN (SELECT player_id FROM rank_recalc_queue)' if dirty_only else ''
+                return f'''
+                        WITH primary_board AS (
+                                SELECT id FROM rank_boards WHERE is_primary = 1 ORDER BY id LIMIT 1
+                        ),
+                        primary_ranks AS (
+                                SELECT pbr.player_id, pbr.board_rank
+                                FROM player_board_ranks pbr
+                                JOIN primary_board pb ON pb.id = pbr.board_id
+                                WHERE 1=1 {rank_filter}
+                        ),
+                        weighted AS (
+                                SELECT pbr.player_id,
+                                       SUM(pbr.board_rank * rb.weight) / SUM(rb.weight) AS weighted_avg_rank
+                                FROM player_board_ranks pbr
+                                JOIN rank_boards rb ON rb.id = pbr.board_id
+                                WHERE rb.weight > 0 {rank_filter}
+                                GROUP BY pbr.player_id
+                        )
+                        SELECT p.id AS player_id,
+                               COALESCE(p.name, '') AS name,
+                               w.weighted_avg_rank AS weighted_avg_rank,
+                               COALESCE(pr.board_rank, w.weighted_avg_rank, CAST(p.tankathon_rank AS REAL), 999999.0) AS effective_rank
+                        FROM players p
+                        LEFT JOIN primary_ranks pr ON pr.player_id = p.id
+                        LEFT JOIN weighted w ON w.player_id = p.id
+                        {player_filter}
+                '''
+
+        def _recalculate_default_rankings_python(self, cursor):
                 cursor.execute('''
                         SELECT id, board_key, weight, is_primary
                         FROM rank_boards
                 ''')
                 board_rows = cursor.fetchall()
-                board_key_by_id = {row[0]: row[1] for row in board_rows}
                 board_weight_by_id = {row[0]: float(row[2] or 0.0) for row in board_rows}
                 primary_board_id = next((row[0] for row in board_rows if row[3] == 1), None)
 
@@ -286,105 +1655,158 @@ class ScoutDatabase:
 
                 player_sort_rows.sort(key=lambda row: (row[2], row[1]))
 
-                for index, (player_id, _, _, weighted_rank) in enumerate(player_sort_rows, start=1):
+                for index, (player_id, _, sort_rank, weighted_rank) in enumerate(player_sort_rows, start=1):
                         cursor.execute('''
                                 UPDATE players
-                                SET rank = ?, weighted_avg_rank = ?
+                                SET rank = ?, weighted_avg_rank = ?, effective_rank = ?
                                 WHERE id = ?
-                        ''', (index, weighted_rank, player_id))
-
-                conn.commit()
-                conn.close()
+                        ''', (index, weighted_rank, sort_rank, player_id))
 
-                self.calculate_positional_ranks()
+                cursor.execute('DELETE FROM rank_recalc_queue')
                 return len(player_sort_rows)
         
-        def import_players_from_json (self, json_file='nfl_big_board.json', recalculate_rankings=True):
-                """Import players from the JSON generated from Tankathon Webscraper"""
+        @_serialized_write
+        def import_players_from_json (self, json_file='nfl_big_board.json', recalculate_rankings=True, progress=None):
+                """Import players from the JSON generated from Tankathon Webscraper
+
+                Runs through _run_import_pipeline: Tankathon detail fields overwrite the matched players
+                and the ranks become the 'tankathon' board. A file identical to the last imported one
+                is skipped without writing or recalculating. progress, when given, is called with each
+                pipeline stage name.
+                """
                 try:
                         with open(json_file, 'r', encoding ='utf-8') as f:
                                 players = json.load(f)
 
-                        conn = self.get_connection()
-                        cursor = conn.cursor()
-
-                        imported = 0
-                        board_entries = []
-                        for player in players:
-                                try:
-                                        #Get basic info
-                                        rank = int(player.get('rank', 0))
-                                        name = player.get('name', '')
-                                        position = player.get('position', '')
-                                        positional_rank = player.get('positional_rank', '')
-                                        school = player.get('school', '')
-                                        height = player.get('height', '')
-                                        weight = player.get('weight', '')
-                                        jersey_number = player.get('jersey_number', '')
-                                        player_url = player.get('player_url', '')
-
-                                        #Store additional stats as JSON
-                                        stats = {}
-                                        for key, value in player.items():
-                                                if key not in ['rank', 'name', 'position', 'positional_rank', 'school', 'height', 'weight', 'jersey_number', 'player_url']:
-                                                        stats[key] = value
-                                        stats_json = json.dumps(stats)
-
-                                        cursor.execute('''
-                                                INSERT INTO players
-                                                (rank, tankathon_rank, name, position, positional_rank, school, height, weight, jersey_number, player_url, stats)
-                                                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                                                ON CONFLICT(name) DO UPDATE SET
-                                                        tankathon_rank = excluded.tankathon_rank,
-                                                        position = excluded.position,
-                                                        positional_rank = excluded.positional_rank,
-                                                        school = excluded.school,
-                                                        height = excluded.height,
-                                                        weight = excluded.weight,
-                                                        jersey_number = excluded.jersey_number,
-                                                        player_url = excluded.player_url,
-                                                        stats = excluded.stats
-                                        ''', (rank, rank, name, position, positional_rank, school, height, weight, jersey_number, player_url, stats_json))
-
-                                        board_entries.append({'name': name, 'rank': rank})
-
-                                        imported += 1
-
-                                except Exception as e:
-                                        print(f"Error importing player {player.get('name')}: {e}")
-                                        return {'success': False, 'error': f"Error importing player {player.get('name')}: {e}", 'imported': imported}
-
-                        self._upsert_board_rank_entries(
-                                cursor,
-                                board_key='tankathon',
-                                board_name='Tankathon Big Board',
-                                entries=board_entries,
-                                source_type='tankathon',
-                                weight=1.0,
-                                is_primary=0
+                        pipeline = self._run_import_pipeline(
+                                [{
+                                        'board_key': 'tankathon',
+                                        'board_name': 'Tankathon Big Board',
+                                        'source_type': 'tankathon',
+                                        'weight': 1.0,
+                                        'is_primary': 0,
+                                        'enrich': 'overwrite',
+                                        'entries': self._iter_tankathon_entries(players)
+                                }],
+                                progress=progress,
+                                recalculate=recalculate_rankings
                         )
+                        board = pipeline['boards'][0]
+                        imported = 0 if board['unchanged'] else board['entries']
 
-                        conn.commit()
-                        conn.close()
-                        if recalculate_rankings:
-                                self.recalculate_default_rankings()
-
-                        print(f"imported {imported} players from Tankathon JSON")
+                        print(f"imported {imported} players from Tankathon JSON" + (" (unchanged, skipped)" if board['unchanged'] else ''))
                         return {
                                 'success': True,
                                 'imported': imported,
-                                'recalculated': bool(recalculate_rankings)
+                                'unchanged': board['unchanged'],
+                                'changes': self._change_summary(board),
+                                'recalculated': bool(recalculate_rankings) and not board['unchanged'],
+                                'ranking_generation': pipeline['ranking_generation'],
+                                'approximate_matches': pipeline['approximate_matches'],
+                                'alias_suggestions': pipeline['alias_suggestions'],
+                                'timings_ms': pipeline['timings_ms']
                         }
-                
+
                 except Exception as e:
                         print(f"Error importing from JSON: {e}")
                         return {'success': False, 'error': str(e), 'imported': 0}
 
-        def calculate_positional_ranks(self):
+        @staticmethod
+        def _iter_tankathon_entries(players):
+                """Yield pipeline entries from Tankathon JSON rows; unknown keys are kept as the stats JSON"""
+                for player in players:
+                        name = player.get('name', '')
+                        try:
+                                rank = int(player.get('rank', 0))
+                        except (TypeError, ValueError) as e:
+                                raise ValueError(f"Error importing player {name}: {e}")
+
+                        #Store additional stats as JSON
+                        stats = {}
+                        for key, value in player.items():
+                                if key not in ['rank', 'name', 'position', 'positional_rank', 'school', 'height', 'weight', 'jersey_number', 'player_url']:
+                                        stats[key] = value
+
+                        yield {
+                                'name': name,
+                                'rank': rank,
+                                'details': {
+                                        'tankathon_rank': rank,
+                                        'position': player.get('position', ''),
+                                        'positional_rank': player.get('positional_rank', ''),
+                                        'school': player.get('school', ''),
+                                        'height': player.get('height', ''),
+                                        'weight': player.get('weight', ''),
+                                        'jersey_number': player.get('jersey_number', ''),
+                                        'player_url': player.get('player_url', ''),
+                                        'stats': json.dumps(stats)
+                                }
+                        }
+
+
+        @_serialized_write
+        def calculate_positional_ranks(self, mode='sql'):
                 """Calculate positional ranks for players based on overall rank within each position"""
                 conn = self.get_connection()
                 cursor = conn.cursor()
 
+                if mode == 'python':
+                        updated_count, position_count = self._calculate_positional_ranks_python(cursor)
+                else:
+                        updated_count, position_count = self._calculate_positional_ranks_sql(cursor)
+                conn.commit()
+
+                print(f"Calculated positional ranks for {updated_count} players across {position_count} positions")
+                conn.close()
+                return updated_count
+
+        def _calculate_positional_ranks_sql(self, cursor):
+                #For multi-position players (e.g. EDGE/LB) use first position (player_positions.is_primary)
+                self._create_positional_rank_recalc_table(cursor)
+                cursor.execute('''
+                        INSERT INTO positional_rank_recalc (player_id, primary_position, positional_rank)
+                        SELECT p.id,
+                               pp.position,
+                               CAST(ROW_NUMBER() OVER (PARTITION BY pp.position ORDER BY p.rank, p.id) AS TEXT)
+                        FROM player_positions pp
+                        JOIN players p ON p.id = pp.player_id
+                        WHERE pp.is_primary = 1
+                ''')
+                updated_count = cursor.rowcount
+                self._write_positional_rank_recalc(cursor)
+
+                cursor.execute('SELECT COUNT(DISTINCT primary_position) FROM positional_rank_recalc')
+                position_count = cursor.fetchone()[0]
+                return updated_count, position_count
+
+        @staticmethod
+        def _create_positional_rank_recalc_table(cursor):
+                cursor.execute('''
+                        CREATE TEMP TABLE IF NOT EXISTS positional_rank_recalc (
+                                player_id INTEGER PRIMARY KEY,
+                                primary_position TEXT,
+                                positional_rank TEXT NOT NULL
+                        )
+                ''')
+                cursor.execute('DELETE FROM positional_rank_recalc')
+
+        @staticmethod
+        def _write_positional_rank_recalc(cursor):
+                cursor.execute('''
+                        UPDATE players
+                        SET positional_rank = (
+                                SELECT r.positional_rank FROM positional_rank_recalc r WHERE r.player_id = players.id
+                        )
+                        WHERE id IN (
+                                SELECT r.player_id
+                                FROM positional_rank_recalc r
+                                JOIN players p ON p.id = r.player_id
+                                WHERE p.positional_rank IS NOT r.positional_rank
+                        )
+                ''')
+                return cursor.rowcount
+
+        def _calculate_positional_ranks_python(self, cursor):
                 #Get all players ordered by rank
                 cursor.execute('SELECT id, rank, position FROM players ORDER BY rank')
                 players = cursor.fetchall()
@@ -398,7 +1820,9 @@ class ScoutDatabase:
                                 continue
 
                         #For multi-position players (e.g. EDGE/LB) use first position
-                        primary_position = position.split('/')[0].strip()
+                        primary_position = position.split('/')[0].strip().upper()
+                        if not primary_position:
+                                continue
 
                         #Increment counter for position
                         if primary_position not in position_counters:
@@ -410,11 +1834,7 @@ class ScoutDatabase:
                 
                 #Update all positional ranks
                 cursor.executemany('UPDATE players SET positional_rank = ? WHERE id = ?', updates)
-                conn.commit()
-
-                print(f"Calculated positional ranks for {len(updates)} players across {len(position_counters)} positions")
-                conn.close()
-                return len(updates)
+                return len(updates), len(position_counters)
         
         def get_all_players(self):
                 """Get all players from database"""
@@ -438,42 +1858,54 @@ class ScoutDatabase:
                 conn.close()
                 return players
         
-        def get_filtered_players(self, positions=None, max_rank=None, include_scouted=False, search_term=None, name_search=None, school=None, watch_list_only=False):
-                """Get filtered players based on criteria"""
-                conn = self.get_connection()
-                cursor = conn.cursor()
+        def _player_filter_sql(self, positions=None, max_rank=None, include_scouted=False, search_term=None, name_search=None, school=None, watch_list_only=False):
+                """Build the shared FROM/WHERE clause for player list queries.
+
+                Returns (from_where_sql, params, search_match). When a full-text filter applies,
+                players is joined to players_fts so callers can select snippet()/bm25().
+                """
+                search_match = self._build_fts_query(search_term) if search_term and self.fts_enabled else None
+                name_match = self._build_fts_query(name_search, column='name') if name_search and self.fts_enabled else None
+                match_expression = ' AND '.join(f'({expr})' for expr in (search_match, name_match) if expr)
 
                 #Base query to dynamically built based on selections
-                query = "SELECT * FROM players WHERE 1=1"
-                params = []
+                if match_expression:
+                        query = '''
+                                FROM players_fts
+                                JOIN players ON players.id = players_fts.rowid
+                                WHERE players_fts MATCH ?
+                        '''
+                        params = [match_expression]
+                else:
+                        query = "FROM players WHERE 1=1"
+                        params = []
 
-                if positions and len(positions) > 0:
-                        #Build condition to match players with multiple positions (e.g. EDGE/LB)
-                        position_conditions = []
-                        for pos in positions:
-                                position_conditions.append('position LIKE ?')
-                                params.append(f'%{pos}%')
-                        query += f' AND ({ " OR ".join(position_conditions)})'
+                position_filter = sorted({(pos or '').strip().upper() for pos in positions or []} - {''})
+                if position_filter:
+                        #Multi-position players (e.g. EDGE/LB) have one player_positions row per position
+                        placeholders = ', '.join('?' for _ in position_filter)
+                        query += f' AND players.id IN (SELECT player_id FROM player_positions WHERE position IN ({placeholders}))'
+                        params.extend(position_filter)
 
                 if max_rank:
-                        query += ' AND rank <= ?'
+                        query += ' AND players.rank <= ?'
                         params.append(max_rank)
 
-                if search_term:
-                        query += ' AND (name LIKE ? OR school LIKE ?)'
+                if search_term and not search_match:
+                        query += ' AND (players.name LIKE ? OR players.school LIKE ?)'
                         like_term = f'%{search_term}%'
                         params.extend([like_term, like_term])
 
-                if name_search:
-                        query += ' AND name LIKE ?'
+                if name_search and not name_match:
+                        query += ' AND players.name LIKE ?'
                         params.append(f'%{name_search}%')
 
                 if school:
-                        query += ' AND school = ?'
+                        query += ' AND players.school = ?'
                         params.append(school)
                 
                 if not include_scouted:
-                        query += ' AND scouted = 0'
+                        query += ' AND players.scouted = 0'
 
                 if watch_list_only:
                         query += '''
@@ -486,10 +1918,11 @@ class ScoutDatabase:
                                           AND b.position IS NULL
                                 )
                         '''
-                
-                query += ' ORDER BY rank'
 
-                cursor.execute(query, params)
+                return query, params, bool(search_match)
+
+        @staticmethod
+        def _player_rows_to_dicts(cursor):
                 columns = [description[0] for description in cursor.description]
                 players = []
 
@@ -501,72 +1934,300 @@ class ScoutDatabase:
                                         player['stats'] = json.loads(player['stats'])
                                 except Exception:
                                         player['stats'] = {}
+                        if 'notes_snippet' in player:
+                                player['notes_snippet'] = ScoutDatabase._format_search_snippet(player['notes_snippet'])
                         players.append(player)
+                return players
+
+        def get_filtered_players(self, positions=None, max_rank=None, include_scouted=False, search_term=None, name_search=None, school=None, watch_list_only=False, sort=None):
+                """Get filtered players based on criteria
+
+                search_term matches name, school, notes and games watched; name_search matches names only.
+                Both use the players_fts full-text index (token prefix matching) when FTS5 is available.
+                Search results are ordered by relevance unless sort='rank', and carry a highlighted
+                notes_snippet when the notes matched.
+                """
+                conn = self.get_connection()
+                cursor = conn.cursor()
+
+                filter_sql, params, search_match = self._player_filter_sql(
+                        positions, max_rank, include_scouted, search_term, name_search, school, watch_list_only
+                )
+                query = f'SELECT players.*{self._snippet_select_sql(filter_sql)} {filter_sql}'
+
+                if search_match and sort != 'rank':
+                        query += f' ORDER BY {_SEARCH_RELEVANCE_SQL}, players.rank'
+                else:
+                        query += ' ORDER BY players.rank'
+
+                cursor.execute(query, params)
+                players = self._player_rows_to_dicts(cursor)
 
                 conn.close()
                 return players
-        
 
-        def get_player_by_id(self, player_id):
-                """Get a specific player by ID"""
+        @staticmethod
+        def _snippet_select_sql(filter_sql):
+                if 'players_fts' not in filter_sql:
+                        return ''
+                return f", snippet(players_fts, 2, '{_SNIPPET_OPEN}', '{_SNIPPET_CLOSE}', '...', 16) AS notes_snippet"
+
+        def get_players_page(self, positions=None, max_rank=None, include_scouted=False, search_term=None, name_search=None, school=None, watch_list_only=False, sort=None, fields=None, limit=50, cursor=None):
+                """Get one page of filtered players plus the total match count.
+
+                Pages are keyset-paginated on (rank, id); relevance-sorted search pages use an offset
+                cursor instead. limit=None returns every match. fields limits the selected columns
+                (id is always included).
+                Returns {'players': [...], 'next_cursor': str or None, 'total': int}.
+                Raises ValueError for unknown fields or a malformed cursor.
+                """
+                if limit is not None:
+                        limit = max(1, min(int(limit), 500))
+                selected = self._resolve_player_fields(fields)
+                position_state = self._decode_page_cursor(cursor)
+
+                conn = self.get_connection()
+                db_cursor = conn.cursor()
+
+                filter_sql, params, search_match = self._player_filter_sql(
+                        positions, max_rank, include_scouted, search_term, name_search, school, watch_list_only
+                )
+                select_sql = ', '.join(f'players.{column}' for column in selected)
+                if not fields or 'notes_snippet' in fields:
+                        select_sql += self._snippet_select_sql(filter_sql)
+
+                db_cursor.execute(f'SELECT COUNT(*) {filter_sql}', params)
+                total = db_cursor.fetchone()[0]
+
+                by_relevance = search_match and sort != 'rank'
+                query = f'SELECT {select_sql}, players.rank AS _page_rank, players.id AS _page_id {filter_sql}'
+                page_params = list(params)
+                if by_relevance:
+                        offset = position_state.get('o', 0)
+                        query += f' ORDER BY {_SEARCH_RELEVANCE_SQL}, players.rank, players.id LIMIT ? OFFSET ?'
+                        page_params.extend([-1 if limit is None else limit + 1, offset])
+                else:
+                        if 'i' in position_state:
+                                #NULL ranks sort first, so a NULL-rank cursor continues through the NULLs then all ranked rows
+                                if position_state.get('r') is None:
+                                        query += ' AND ((players.rank IS NULL AND players.id > ?) OR players.rank IS NOT NULL)'
+                                        page_params.append(position_state['i'])
+                                else:
+                                        query += ' AND (players.rank > ? OR (players.rank = ? AND players.id > ?))'
+                                        page_params.extend([position_state['r'], position_state['r'], position_state['i']])
+                        query += ' ORDER BY players.rank, players.id LIMIT ?'
+                        page_params.append(-1 if limit is None else limit + 1)
+
+                db_cursor.execute(query, page_params)
+                players = self._player_rows_to_dicts(db_cursor)
+                conn.close()
+
+                next_cursor = None
+                if limit is not None and len(players) > limit:
+                        players = players[:limit]
+                        last = players[-1]
+                        if by_relevance:
+                                next_cursor = self._encode_page_cursor({'o': position_state.get('o', 0) + limit})
+                        else:
+                                next_cursor = self._encode_page_cursor({'r': last['_page_rank'], 'i': last['_page_id']})
+                for player in players:
+                        player.pop('_page_rank', None)
+                        player.pop('_page_id', None)
+
+                return {'players': players, 'next_cursor': next_cursor, 'total': total}
+
+        def sample_random_players(self, n=1, positions=None, max_rank=None, include_scouted=False, watch_list_only=False, fields=None, rounds=3):
+                """Pick up to n distinct random eligible players inside SQLite.
+
+                Random ids are drawn from the players rowid range and checked against the filters in
+                one primary-key IN lookup per round, so a spin touches only the drawn rows instead of
+                scanning and sorting every eligible player. Draws that hit deleted or ineligible ids
+                are rejected, which keeps the sample uniform. When the filters are too selective for
+                that to fill n within a few rounds, the remaining picks come from the eligible ids
+                (ids only, unsorted). Returns a list in random order.
+                """
+                n = max(1, min(int(n), 100))
+                selected = self._resolve_player_fields(fields)
+
                 conn = self.get_connection()
                 cursor = conn.cursor()
 
-                cursor.execute('SELECT * FROM players WHERE id = ?', (player_id,))
-                columns = [description[0] for description in cursor.description]
-                row = cursor.fetchone()
-                if not row:
+                filter_sql, params, _ = self._player_filter_sql(
+                        positions, max_rank, include_scouted, watch_list_only=watch_list_only
+                )
+                #Separate subqueries so each bound is a single rowid seek (MIN and MAX together scan)
+                cursor.execute('SELECT (SELECT MIN(id) FROM players), (SELECT MAX(id) FROM players)')
+                low_id, high_id = cursor.fetchone()
+                if low_id is None:
                         conn.close()
-                        return None
+                        return []
+
+                sampled_ids = []
+                for _ in range(rounds):
+                        draw_count = min(max(4 * (n - len(sampled_ids)), 32), high_id - low_id + 1)
+                        drawn = random.sample(range(low_id, high_id + 1), draw_count)
+                        #Driven from the drawn ids so each check is a rowid seek, not a scan of an index on the filters
+                        cursor.execute(f'''
+                                SELECT drawn.value FROM json_each(?) AS drawn
+                                WHERE EXISTS (SELECT 1 {filter_sql} AND players.id = drawn.value)
+                        ''', [json.dumps(drawn)] + params)
+                        eligible = {row[0] for row in cursor.fetchall()} - set(sampled_ids)
+                        #Keep the draw order so the pick among eligible ids stays random
+                        sampled_ids.extend([player_id for player_id in drawn if player_id in eligible][:n - len(sampled_ids)])
+                        if len(sampled_ids) >= n:
+                                break
 
-                player = dict(zip(columns, row))
-                #Parse JSON Stats
-                if player.get('stats'):
-                        try:
-                                player['stats'] = json.loads(player['stats'])
-                        except Exception:
-                                player['stats'] = {}
+                if len(sampled_ids) < n:
+                        cursor.execute(f'SELECT players.id {filter_sql}', params)
+                        already_sampled = set(sampled_ids)
+                        remaining = [row[0] for row in cursor.fetchall() if row[0] not in already_sampled]
+                        sampled_ids.extend(random.sample(remaining, min(n - len(sampled_ids), len(remaining))))
 
-                cursor.execute('''
-                        SELECT e.rank_order
-                        FROM big_board_entries e
-                        JOIN big_boards b ON b.id = e.board_id
-                        WHERE e.player_id = ?
-                          AND b.board_type = 'overall'
-                          AND b.position IS NULL
-                        LIMIT 1
-                ''', (player_id,))
-                personal_rank_row = cursor.fetchone()
-                player['personal_big_board_rank'] = personal_rank_row[0] if personal_rank_row else None
+                players = []
+                if sampled_ids:
+                        select_sql = ', '.join(f'players.{column}' for column in selected)
+                        placeholders = ', '.join('?' for _ in sampled_ids)
+                        cursor.execute(f'SELECT {select_sql} FROM players WHERE players.id IN ({placeholders})', sampled_ids)
+                        players = self._player_rows_to_dicts(cursor)
+                conn.close()
 
-                cursor.execute('''
-                        SELECT MIN(e.rank_order)
-                        FROM big_board_entries e
-                        JOIN big_boards b ON b.id = e.board_id
-                        WHERE e.player_id = ?
-                          AND b.board_type = 'position'
-                ''', (player_id,))
-                personal_pos_rank_row = cursor.fetchone()
-                player['personal_pos_rank'] = personal_pos_rank_row[0] if personal_pos_rank_row and personal_pos_rank_row[0] is not None else None
+                random.shuffle(players)
+                return players
 
-                cursor.execute('''
-                        SELECT e.rank_order
-                        FROM big_board_entries e
-                        JOIN big_boards b ON b.id = e.board_id
-                        WHERE e.player_id = ?
-                          AND b.board_type = 'watchlist'
-                          AND b.position IS NULL
-                        LIMIT 1
-                ''', (player_id,))
-                watchlist_rank_row = cursor.fetchone()
-                player['watchlist_rank'] = watchlist_rank_row[0] if watchlist_rank_row else None
-                player['in_watch_list'] = bool(watchlist_rank_row)
+        def _resolve_player_fields(self, fields):
+                """Validate a fields= projection against the players columns (id is always included)"""
+                columns = self._player_columns()
+                if not fields:
+                        return list(columns)
+                unknown = [field for field in fields if field not in columns and field != 'notes_snippet']
+                if unknown:
+                        raise ValueError(f"Unknown field: {unknown[0]}")
+                return ['id'] + [field for field in dict.fromkeys(fields) if field in columns and field != 'id']
+
+        def _player_columns(self):
+                if self._players_column_names is None:
+                        conn = self.get_connection()
+                        cursor = conn.cursor()
+                        cursor.execute('PRAGMA table_info(players)')
+                        self._players_column_names = [row[1] for row in cursor.fetchall()]
+                        conn.close()
+                return self._players_column_names
 
-                player['board_ranks'] = self.get_player_board_ranks(player_id, conn=conn)
-                player['weighted_average_rank'] = player.get('weighted_avg_rank')
+        @staticmethod
+        def _encode_page_cursor(state):
+                payload = json.dumps(state, separators=(',', ':')).encode('utf-8')
+                return base64.urlsafe_b64encode(payload).decode('ascii').rstrip('=')
+
+        @staticmethod
+        def _decode_page_cursor(cursor_text):
+                if not cursor_text:
+                        return {}
+                try:
+                        padded = cursor_text + '=' * (-len(cursor_text) % 4)
+                        state = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+                except Exception:
+                        raise ValueError('Invalid cursor.')
+                if not isinstance(state, dict):
+                        raise ValueError('Invalid cursor.')
+
+                def is_int(value):
+                        return isinstance(value, int) and not isinstance(value, bool)
+
+                #A cursor that decodes but carries the wrong types is as invalid as one that does not decode
+                if 'r' in state and state['r'] is not None and not (is_int(state['r']) or isinstance(state['r'], float)):
+                        raise ValueError('Invalid cursor.')
+                if 'i' in state and not is_int(state['i']):
+                        raise ValueError('Invalid cursor.')
+                if 'o' in state and not (is_int(state['o']) and state['o'] >= 0):
+                        raise ValueError('Invalid cursor.')
+                return state
+        
+
+        def get_player_by_id(self, player_id):
+                """Get a specific player by ID"""
+                players = self.get_players_by_ids([player_id])
+                return players[0] if players else None
+
+        def get_players_by_ids(self, player_ids):
+                """Get full detail records for many players in one query (request order, missing ids skipped)"""
+                ordered_ids = [int(player_id) for player_id in dict.fromkeys(player_ids)]
+                if not ordered_ids:
+                        return []
+
+                #rank_order holds sparse ordering keys; positions are counted from them
+                board_position_sql = '''
+                        SELECT COUNT(*)
+                        FROM big_board_entries other
+                        WHERE other.board_id = e.board_id
+                          AND (other.rank_order < e.rank_order OR (other.rank_order = e.rank_order AND other.id <= e.id))
+                '''
+                placeholders = ', '.join('?' for _ in ordered_ids)
 
+                conn = self.get_connection()
+                cursor = conn.cursor()
+                cursor.execute(f'''
+                        SELECT p.*,
+                               (
+                                        SELECT ({board_position_sql})
+                                        FROM big_board_entries e
+                                        JOIN big_boards b ON b.id = e.board_id
+                                        WHERE e.player_id = p.id
+                                          AND b.board_type = 'overall'
+                                          AND b.position IS NULL
+                                        LIMIT 1
+                               ) AS personal_big_board_rank,
+                               (
+                                        SELECT MIN(({board_position_sql}))
+                                        FROM big_board_entries e
+                                        JOIN big_boards b ON b.id = e.board_id
+                                        WHERE e.player_id = p.id
+                                          AND b.board_type = 'position'
+                               ) AS personal_pos_rank,
+                               (
+                                        SELECT ({board_position_sql})
+                                        FROM big_board_entries e
+                                        JOIN big_boards b ON b.id = e.board_id
+                                        WHERE e.player_id = p.id
+                                          AND b.board_type = 'watchlist'
+                                          AND b.position IS NULL
+                                        LIMIT 1
+                               ) AS watchlist_rank,
+                               (
+                                        SELECT json_group_array(json_array(
+                                                b.board_key, b.board_name, b.source_type, b.weight, b.is_primary, pbr.board_rank
+                                        ))
+                                        FROM player_board_ranks pbr
+                                        JOIN rank_boards b ON b.id = pbr.board_id
+                                        WHERE pbr.player_id = p.id
+                               ) AS board_ranks_json
+                        FROM players p
+                        WHERE p.id IN ({placeholders})
+                ''', ordered_ids)
+                players_by_id = {player['id']: player for player in self._player_rows_to_dicts(cursor)}
                 conn.close()
-                return player
+
+                players = []
+                for player_id in ordered_ids:
+                        player = players_by_id.get(player_id)
+                        if not player:
+                                continue
+                        board_rows = json.loads(player.pop('board_ranks_json') or '[]')
+                        board_rows.sort(key=lambda row: (-row[4], row[5], row[1]))
+                        player['board_ranks'] = [
+                                {
+                                        'board_key': row[0],
+                                        'board_name': row[1],
+                                        'source_type': row[2],
+                                        'weight': row[3],
+                                        'is_primary': bool(row[4]),
+                                        'rank': row[5]
+                                }
+                                for row in board_rows
+                        ]
+                        player['in_watch_list'] = player['watchlist_rank'] is not None
+                        player['weighted_average_rank'] = player.get('weighted_avg_rank')
+                        players.append(player)
+                return players
 
         def mark_as_scouted(self, player_id):
                 """Mark a player as being scouted"""
@@ -585,17 +2246,6 @@ class ScoutDatabase:
                         (watch_list_board_id, player_id)
                 )
 
-                cursor.execute(
-                        'SELECT player_id FROM big_board_entries WHERE board_id = ? ORDER BY rank_order ASC, id ASC',
-                        (watch_list_board_id,)
-                )
-                remaining = [row[0] for row in cursor.fetchall()]
-                for index, pid in enumerate(remaining, start=1):
-                        cursor.execute(
-                                'UPDATE big_board_entries SET rank_order = ? WHERE board_id = ? AND player_id = ?',
-                                (index, watch_list_board_id, pid)
-                        )
-
                 conn.commit()
                 conn.close()
         
@@ -655,9 +2305,9 @@ class ScoutDatabase:
                 else:
                         cursor.execute('''
                                 UPDATE players
-                                SET grade = ?
+                                SET grade = ?, grade_sort_key = ?
                                 WHERE ID = ?
-                        ''', (grade, player_id))
+                        ''', (grade, _grade_sort_key(grade), player_id))
 
                 conn.commit()
                 conn.close()
@@ -674,6 +2324,11 @@ class ScoutDatabase:
                         if not isinstance(parsed_stats, dict):
                                 raise ValueError('Stats JSON must be an object (key/value pairs).')
 
+                cursor.execute('''
+                        INSERT OR IGNORE INTO rank_recalc_queue (player_id, previous_position)
+                        SELECT id, position FROM players WHERE id = ? AND position IS NOT ?
+                ''', (player_id, (profile_data.get('position') or '').strip()))
+
                 cursor.execute('''
                         UPDATE players
                         SET
@@ -698,11 +2353,16 @@ class ScoutDatabase:
 
                 conn.commit()
                 conn.close()
+                return {'success': True, 'ranking_generation': self.request_rank_recalculation()}
 
         def get_rank_boards_config(self):
-                conn = self.get_connection()
-                cursor = conn.cursor()
+                return self._cached_read(
+                        ('rank_boards_config',),
+                        lambda: self._read_with_cursor(self._select_rank_boards_config)
+                )
 
+        @staticmethod
+        def _select_rank_boards_config(cursor):
                 cursor.execute('''
                         SELECT b.id, b.board_key, b.board_name, b.source_type, b.weight, b.is_primary,
                                COUNT(pbr.id) AS player_count
@@ -713,7 +2373,6 @@ class ScoutDatabase:
                 ''')
 
                 rows = cursor.fetchall()
-                conn.close()
 
                 return [
                         {
@@ -728,6 +2387,7 @@ class ScoutDatabase:
                         for row in rows
                 ]
 
+        @_serialized_write
         def update_rank_board_weights(self, board_updates):
                 if not isinstance(board_updates, list):
                         return {'success': False, 'error': 'board_updates must be a list.'}
@@ -753,6 +2413,11 @@ class ScoutDatabase:
                         if weight < 0:
                                 weight = 0.0
 
+                        cursor.execute('SELECT id FROM rank_boards WHERE board_key = ? AND weight != ?', (board_key, weight))
+                        changed_board = cursor.fetchone()
+                        if changed_board:
+                                self._mark_rankings_dirty(cursor, board_ids=[changed_board[0]])
+
                         cursor.execute('''
                                 UPDATE rank_boards
                                 SET weight = ?
@@ -760,15 +2425,20 @@ class ScoutDatabase:
                         ''', (weight, board_key))
 
                 if target_primary_key:
+                        cursor.execute('''
+                                SELECT id FROM rank_boards
+                                WHERE (is_primary = 1 AND board_key != ?) OR (is_primary = 0 AND board_key = ?)
+                        ''', (target_primary_key, target_primary_key))
+                        self._mark_rankings_dirty(cursor, board_ids=[row[0] for row in cursor.fetchall()])
                         cursor.execute('UPDATE rank_boards SET is_primary = 0')
                         cursor.execute('UPDATE rank_boards SET is_primary = 1 WHERE board_key = ?', (target_primary_key,))
 
                 conn.commit()
                 conn.close()
 
-                self.recalculate_default_rankings()
-                return {'success': True}
+                return {'success': True, 'ranking_generation': self.request_rank_recalculation()}
 
+        @_serialized_write
         def remove_rank_board(self, board_key):
                 board_key = (board_key or '').strip()
                 if not board_key:
@@ -781,31 +2451,32 @@ class ScoutDatabase:
                 conn = self.get_connection()
                 cursor = conn.cursor()
 
-                cursor.execute('SELECT board_key, source_type, is_primary FROM rank_boards WHERE board_key = ?', (board_key,))
+                cursor.execute('SELECT id, source_type, is_primary FROM rank_boards WHERE board_key = ?', (board_key,))
                 board_row = cursor.fetchone()
                 if not board_row:
                         conn.close()
                         return {'success': False, 'error': 'Board not found.'}
 
-                _, source_type, is_primary = board_row
+                board_id, source_type, is_primary = board_row
                 if source_type != 'imported':
                         conn.close()
                         return {'success': False, 'error': 'Only imported boards can be removed.'}
 
+                self._mark_rankings_dirty(cursor, board_ids=[board_id])
                 cursor.execute('DELETE FROM rank_boards WHERE board_key = ?', (board_key,))
 
                 if is_primary:
-                        cursor.execute('SELECT board_key FROM rank_boards ORDER BY board_name ASC LIMIT 1')
+                        cursor.execute('SELECT id, board_key FROM rank_boards ORDER BY board_name ASC LIMIT 1')
                         fallback = cursor.fetchone()
                         if fallback:
+                                self._mark_rankings_dirty(cursor, board_ids=[fallback[0]])
                                 cursor.execute('UPDATE rank_boards SET is_primary = 0')
-                                cursor.execute('UPDATE rank_boards SET is_primary = 1 WHERE board_key = ?', (fallback[0],))
+                                cursor.execute('UPDATE rank_boards SET is_primary = 1 WHERE board_key = ?', (fallback[1],))
 
                 conn.commit()
                 conn.close()
 
-                self.recalculate_default_rankings()
-                return {'success': True}
+                return {'success': True, 'ranking_generation': self.request_rank_recalculation()}
 
         def get_player_board_ranks(self, player_id, conn=None):
                 owns_conn = conn is None
@@ -837,50 +2508,133 @@ class ScoutDatabase:
                         for row in rows
                 ]
 
-        def get_all_positions(self):
-                """Get list of all unique positions"""
+        def get_player_aliases(self, player_id):
+                """Alternate name spellings recorded for a player, plus pending suggestions awaiting confirmation"""
                 conn = self.get_connection()
-                cursor= conn.cursor()
+                cursor = conn.cursor()
+                cursor.execute('''
+                        SELECT alias, source, score, created_at
+                        FROM player_aliases
+                        WHERE player_id = ?
+                        ORDER BY alias
+                ''', (player_id,))
+                aliases = [
+                        {'alias': row[0], 'source': row[1], 'score': row[2], 'created_at': row[3]}
+                        for row in cursor.fetchall()
+                ]
+                cursor.execute('''
+                        SELECT alias, name, score, created_at
+                        FROM player_alias_suggestions
+                        WHERE player_id = ?
+                        ORDER BY score DESC, alias
+                ''', (player_id,))
+                suggestions = [
+                        {'alias': row[0], 'name': row[1], 'score': row[2], 'created_at': row[3]}
+                        for row in cursor.fetchall()
+                ]
+                conn.close()
 
-                cursor.execute('SELECT DISTINCT position FROM players ORDER BY position')
-                all_positions = set()
+                return {'aliases': aliases, 'suggestions': suggestions}
 
-                for row in cursor.fetchall():
-                        if row[0]:
-                                if '/' in row[0]:
-                                        positions = row[0].split('/')
-                                        for pos in positions: 
-                                                all_positions.add(pos.strip())
-                                else: 
-                                        all_positions.add(row[0])
+        @_serialized_write
+        def add_player_alias(self, player_id, alias_name):
+                """Confirm that alias_name refers to player_id so later imports resolve it directly.
 
-                conn.close()
-                return sorted(list(all_positions))
+                A player created earlier under that name (e.g. from an unconfirmed suggestion) is
+                merged into player_id, and any pending suggestion for the name is cleared.
+                """
+                alias = self._normalize_player_name(alias_name)
+                if not alias:
+                        return {'success': False, 'error': 'Alias name is required.'}
 
-        def get_all_schools(self):
-                """Get list of all unique schools"""
                 conn = self.get_connection()
                 cursor = conn.cursor()
+                cursor.execute('SELECT 1 FROM players WHERE id = ?', (player_id,))
+                if cursor.fetchone() is None:
+                        conn.close()
+                        return {'success': False, 'error': 'Player not found.'}
 
-                cursor.execute('SELECT DISTINCT school FROM players WHERE school IS NOT NULL AND school != "" ORDER BY school')
-                schools = [row[0] for row in cursor.fetchall() if row[0]]
+                try:
+                        cursor.execute('BEGIN IMMEDIATE')
+                        self._backfill_normalized_names(cursor)
+                        self._create_player_merge_map(cursor)
+                        cursor.execute('''
+                                INSERT INTO player_merge_map (duplicate_id, canonical_id)
+                                SELECT id, ? FROM players WHERE normalized_name = ? AND id != ?
+                        ''', (player_id, alias, player_id))
+                        players_merged = cursor.rowcount
+                        if players_merged:
+                                self._apply_player_merge_map(cursor)
+
+                        cursor.execute('''
+                                INSERT INTO player_aliases (alias, player_id, source, score, created_at)
+                                VALUES (?, ?, 'manual', NULL, ?)
+                                ON CONFLICT(alias) DO UPDATE SET
+                                        player_id = excluded.player_id,
+                                        source = excluded.source,
+                                        score = NULL,
+                                        created_at = excluded.created_at
+                        ''', (alias, player_id, datetime.now().isoformat()))
+                        cursor.execute('DELETE FROM player_alias_suggestions WHERE alias = ?', (alias,))
+                        conn.commit()
+                except Exception as error:
+                        conn.rollback()
+                        conn.close()
+                        return {'success': False, 'error': str(error)}
+                conn.close()
 
+                result = {'success': True, 'alias': alias, 'players_merged': players_merged}
+                if players_merged:
+                        result['ranking_generation'] = self.request_rank_recalculation()
+                return result
+
+        @_serialized_write
+        def remove_player_alias(self, player_id, alias_name):
+                """Forget an alias or dismiss a pending suggestion for this player"""
+                alias = self._normalize_player_name(alias_name)
+                conn = self.get_connection()
+                cursor = conn.cursor()
+                cursor.execute('DELETE FROM player_aliases WHERE player_id = ? AND alias = ?', (player_id, alias))
+                removed = cursor.rowcount
+                cursor.execute('DELETE FROM player_alias_suggestions WHERE player_id = ? AND alias = ?', (player_id, alias))
+                removed += cursor.rowcount
+                conn.commit()
                 conn.close()
-                return schools
+
+                if not removed:
+                        return {'success': False, 'error': 'Alias not found.'}
+                return {'success': True, 'alias': alias}
+
+        def get_all_positions(self):
+                """Get list of all unique positions"""
+                return self._cached_read(('positions',), lambda: self._read_with_cursor(self._select_all_positions))
+
+        @staticmethod
+        def _select_all_positions(cursor):
+                cursor.execute('SELECT DISTINCT position FROM player_positions ORDER BY position')
+                return [row[0] for row in cursor.fetchall()]
+
+        def get_all_schools(self):
+                """Get list of all unique schools"""
+                return self._cached_read(('schools',), lambda: self._read_with_cursor(self._select_all_schools))
+
+        @staticmethod
+        def _select_all_schools(cursor):
+                cursor.execute('SELECT DISTINCT school FROM players WHERE school IS NOT NULL AND school != "" ORDER BY school')
+                return [row[0] for row in cursor.fetchall() if row[0]]
         
         def get_db_stats(self):
                 """Get database statistics"""
-                conn = self.get_connection()
-                cursor= conn.cursor()
+                return self._cached_read(('stats',), lambda: self._read_with_cursor(self._select_db_stats))
 
+        @staticmethod
+        def _select_db_stats(cursor):
                 cursor.execute('SELECT COUNT(*) FROM players')
                 total = cursor.fetchone()[0]
 
                 cursor.execute('SELECT COUNT(*) FROM players WHERE scouted = 1')
                 scouted = cursor.fetchone()[0]
 
-                conn.close()
-
                 return {
                         'total_players': total,
                         'scouted': scouted,
@@ -895,14 +2649,15 @@ class ScoutDatabase:
                 try:
                         cursor.execute('''
                                 INSERT INTO players (
-                                        rank, tankathon_rank, name, position, school, height, weight,
-                                        jersey_number, player_url, notes, grade, scouted, scout_date
+                                        rank, tankathon_rank, name, normalized_name, position, school, height, weight,
+                                        jersey_number, player_url, notes, grade, grade_sort_key, scouted, scout_date
                                 )
-                                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                         ''', (
                                 player_data.get('rank'),
                                 player_data.get('rank'),
                                 player_data.get('name'),
+                                self._normalize_player_name(player_data.get('name')),
                                 player_data.get('position'),
                                 player_data.get('school'),
                                 player_data.get('height'),
@@ -911,26 +2666,36 @@ class ScoutDatabase:
                                 player_data.get('player_url'),
                                 player_data.get('notes', ''),
                                 player_data.get('grade', ''),
+                                _grade_sort_key(player_data.get('grade', '')),
                                 1 if player_data.get('scouted') else 0,
                                 datetime.now().isoformat() if player_data.get('scouted') else None
                         ))
-                        conn.commit()
                         player_id = cursor.lastrowid
+                        self._mark_rankings_dirty(cursor, player_ids=[player_id])
+                        conn.commit()
                         conn.close()
-                        self.recalculate_default_rankings()
-                        return {'success': True, 'player_id': player_id}
+                        return {
+                                'success': True,
+                                'player_id': player_id,
+                                'ranking_generation': self.request_rank_recalculation()
+                        }
                 except sqlite3.IntegrityError as e:
                         conn.close()
                         return {'success': False, 'error': str(e)}
 
-        def _get_or_create_big_board_id(self, cursor, board_type='overall', position=None):
+        @staticmethod
+        def _find_big_board_id(cursor, board_type='overall', position=None):
                 cursor.execute(
                         'SELECT id FROM big_boards WHERE board_type = ? AND ((position IS NULL AND ? IS NULL) OR position = ?)',
                         (board_type, position, position)
                 )
-                existing = cursor.fetchone()
-                if existing:
-                        return existing[0]
+                existing = cursor.fetchone()
+                return existing[0] if existing else None
+
+        def _get_or_create_big_board_id(self, cursor, board_type='overall', position=None):
+                existing = self._find_big_board_id(cursor, board_type, position)
+                if existing is not None:
+                        return existing
 
                 cursor.execute(
                         'INSERT INTO big_boards (board_type, position) VALUES (?, ?)',
@@ -938,131 +2703,207 @@ class ScoutDatabase:
                 )
                 return cursor.lastrowid
 
-        def _grade_priority(self, grade):
-                if not grade:
-                        return (9, 999)
-                grade = grade.strip()
-                grade_lower = grade.lower()
-
-                # Poker chip system (best to worst): Purple, Black, Blue, Green, Red, White
-                poker_map = {
-                        'purple': 0,
-                        'black': 1,
-                        'blue': 2,
-                        'green': 3,
-                        'red': 4,
-                        'white': 5
-                }
-                if grade_lower.startswith('poker chip - '):
-                        chip = grade_lower.replace('poker chip - ', '').strip()
-                        return (0, poker_map.get(chip, 99))
+        def _rebalance_big_board(self, cursor, board_id):
+                """Respace a board's ordering keys to multiples of _BOARD_KEY_GAP in one statement"""
+                cursor.execute('''
+                        CREATE TEMP TABLE IF NOT EXISTS board_rebalance (
+                                entry_id INTEGER PRIMARY KEY,
+                                new_key INTEGER NOT NULL
+                        )
+                ''')
+                cursor.execute('DELETE FROM board_rebalance')
+                cursor.execute('''
+                        INSERT INTO board_rebalance (entry_id, new_key)
+                        SELECT id, ROW_NUMBER() OVER (ORDER BY rank_order, id) * ?
+                        FROM big_board_entries
+                        WHERE board_id = ?
+                ''', (_BOARD_KEY_GAP, board_id))
+                cursor.execute('''
+                        UPDATE big_board_entries
+                        SET rank_order = (SELECT r.new_key FROM board_rebalance r WHERE r.entry_id = big_board_entries.id)
+                        WHERE id IN (
+                                SELECT r.entry_id
+                                FROM board_rebalance r
+                                JOIN big_board_entries e ON e.id = r.entry_id
+                                WHERE e.rank_order != r.new_key
+                        )
+                ''')
+                return cursor.rowcount
 
-                # Numerical system: 100-0, higher is better
-                if grade_lower.startswith('numerical - '):
-                        numeric_text = grade_lower.replace('numerical - ', '').strip()
-                        try:
-                                numeric_grade = int(numeric_text)
-                                numeric_grade = max(0, min(100, numeric_grade))
-                                return (1, 100 - numeric_grade)
-                        except ValueError:
-                                return (9, 999)
-
-                # Alphabet system: A+ through F-
-                alpha_order = [
-                        'A+', 'A', 'A-',
-                        'B+', 'B', 'B-',
-                        'C+', 'C', 'C-',
-                        'D+', 'D', 'D-',
-                        'F+', 'F', 'F-'
-                ]
-                if grade_lower.startswith('alphabet - '):
-                        alpha = grade.replace('Alphabet - ', '').strip().upper()
-                        if alpha in alpha_order:
-                                return (2, alpha_order.index(alpha))
-                        return (9, 999)
-
-                if grade_lower == 'udfa (undrafted free agent)' or grade_lower == 'udfa':
-                        return (3, 100)
-
-                round_map = {
-                        'early-round 1': 10,
-                        'mid-round 1': 11,
-                        'late-round 1': 12,
-                        'early-round 2': 20,
-                        'mid-round 2': 21,
-                        'late-round 2': 22,
-                        'early-round 3': 30,
-                        'mid-round 3': 31,
-                        'late-round 3': 32,
-                        'early-round 4': 40,
-                        'mid-round 4': 41,
-                        'late-round 4': 42,
-                        'early-round 5': 50,
-                        'mid-round 5': 51,
-                        'late-round 5': 52,
-                        'early-round 6': 60,
-                        'mid-round 6': 61,
-                        'late-round 6': 62,
-                        'early-round 7': 70,
-                        'mid-round 7': 71,
-                        'late-round 7': 72
-                }
-                if grade_lower in round_map:
-                        return (3, round_map.get(grade_lower, 999))
+        def _board_key_before(self, cursor, board_id, anchor_player_id=None):
+                """Ordering key that sorts directly before anchor_player_id (or after the last entry).
+
+                Keys are spaced _BOARD_KEY_GAP apart, so this is normally the midpoint of two
+                neighbours and no other row changes; the board is respaced only once a gap runs out.
+                """
+                for _ in range(2):
+                        if anchor_player_id is None:
+                                cursor.execute('SELECT MAX(rank_order) FROM big_board_entries WHERE board_id = ?', (board_id,))
+                                last_key = cursor.fetchone()[0]
+                                return _BOARD_KEY_GAP if last_key is None else last_key + _BOARD_KEY_GAP
+
+                        cursor.execute(
+                                'SELECT id, rank_order FROM big_board_entries WHERE board_id = ? AND player_id = ?',
+                                (board_id, anchor_player_id)
+                        )
+                        anchor = cursor.fetchone()
+                        if not anchor:
+                                anchor_player_id = None
+                                continue
+                        anchor_entry_id, anchor_key = anchor
 
-                return (9, 999)
+                        cursor.execute('''
+                                SELECT rank_order
+                                FROM big_board_entries
+                                WHERE board_id = ? AND (rank_order < ? OR (rank_order = ? AND id < ?))
+                                ORDER BY rank_order DESC, id DESC
+                                LIMIT 1
+                        ''', (board_id, anchor_key, anchor_key, anchor_entry_id))
+                        previous = cursor.fetchone()
+                        if previous is None:
+                                return anchor_key - _BOARD_KEY_GAP
+                        if anchor_key - previous[0] >= 2:
+                                return (previous[0] + anchor_key) // 2
+
+                        self._rebalance_big_board(cursor, board_id)
+
+                raise RuntimeError('Could not allocate a big board ordering key.')
+
+        def _apply_big_board_order(self, cursor, board_id, ordered_player_ids):
+                """Store a full board order while rewriting as few ordering keys as possible.
+
+                Entries already in the right relative order (the longest run of increasing keys)
+                keep their keys; only the others get new keys in the gaps between them. Returns
+                the number of rows written.
+                """
+                cursor.execute(
+                        'SELECT player_id, rank_order FROM big_board_entries WHERE board_id = ? ORDER BY rank_order, id',
+                        (board_id,)
+                )
+                current_keys = dict(cursor.fetchall())
+                current_order = list(current_keys)
+
+                #Ids missing from the request keep their current relative order at the end
+                requested = [player_id for player_id in dict.fromkeys(ordered_player_ids) if player_id in current_keys]
+                requested_set = set(requested)
+                order = requested + [player_id for player_id in current_order if player_id not in requested_set]
+                keys = [current_keys[player_id] for player_id in order]
+
+                #Longest strictly increasing subsequence of keys (patience sorting)
+                tails = []
+                tail_indexes = []
+                parents = [None] * len(keys)
+                for index, key in enumerate(keys):
+                        low, high = 0, len(tails)
+                        while low < high:
+                                middle = (low + high) // 2
+                                if tails[middle] < key:
+                                        low = middle + 1
+                                else:
+                                        high = middle
+                        parents[index] = tail_indexes[low - 1] if low > 0 else None
+                        if low == len(tails):
+                                tails.append(key)
+                                tail_indexes.append(index)
+                        else:
+                                tails[low] = key
+                                tail_indexes[low] = index
+                kept = set()
+                index = tail_indexes[-1] if tail_indexes else None
+                while index is not None:
+                        kept.add(index)
+                        index = parents[index]
+
+                new_keys = list(keys)
+                index = 0
+                while index < len(order):
+                        if index in kept:
+                                index += 1
+                                continue
+                        run_end = index
+                        while run_end < len(order) and run_end not in kept:
+                                run_end += 1
+                        lower = new_keys[index - 1] if index > 0 else None
+                        upper = keys[run_end] if run_end < len(order) else None
+                        run_length = run_end - index
+                        if lower is None and upper is None:
+                                lower, upper = 0, (run_length + 1) * _BOARD_KEY_GAP
+                        elif lower is None:
+                                lower = upper - (run_length + 1) * _BOARD_KEY_GAP
+                        elif upper is None:
+                                upper = lower + (run_length + 1) * _BOARD_KEY_GAP
+                        if upper - lower <= run_length:
+                                #No room left between the neighbours: respace the whole board
+                                new_keys = [(position + 1) * _BOARD_KEY_GAP for position in range(len(order))]
+                                break
+                        step = (upper - lower) / (run_length + 1)
+                        for offset in range(run_length):
+                                new_keys[index + offset] = lower + int(step * (offset + 1))
+                        index = run_end
+
+                updates = [
+                        (new_key, board_id, player_id)
+                        for player_id, key, new_key in zip(order, keys, new_keys)
+                        if key != new_key
+                ]
+                cursor.executemany(
+                        'UPDATE big_board_entries SET rank_order = ? WHERE board_id = ? AND player_id = ?',
+                        updates
+                )
+                return len(updates)
 
         def get_big_board(self, board_type='overall', position=None):
                 """Get board entries for overall or positional board"""
+                return self._cached_read(
+                        ('big_board', board_type, position),
+                        lambda: self._load_big_board(board_type, position)
+                )
+
+        def _load_big_board(self, board_type='overall', position=None):
                 conn = self.get_connection()
                 cursor = conn.cursor()
-                board_id = self._get_or_create_big_board_id(cursor, board_type, position)
+                board_entries = self._select_big_board(cursor, board_type, position)
+                conn.close()
+                return board_entries
+
+        def _select_big_board(self, cursor, board_type='overall', position=None):
+                board_id = self._find_big_board_id(cursor, board_type, position)
+                if board_id is None:
+                        return []
 
+                #Fall back to the best consensus rank of any name variant of the player
                 cursor.execute('''
-                        SELECT e.id AS entry_id, e.rank_order, p.*, pbr.board_rank AS consensus_rank
+                        SELECT e.id AS entry_id,
+                               ROW_NUMBER() OVER (ORDER BY e.rank_order, e.id) AS rank_order,
+                               p.*,
+                               COALESCE(pbr.board_rank, (
+                                        SELECT MIN(variant_rank.board_rank)
+                                        FROM players variant
+                                        JOIN player_board_ranks variant_rank
+                                          ON variant_rank.player_id = variant.id AND variant_rank.board_id = rb.id
+                                        WHERE variant.normalized_name = p.normalized_name
+                                          AND p.normalized_name != ''
+                               )) AS consensus_rank
                         FROM big_board_entries e
                         JOIN players p ON p.id = e.player_id
                         LEFT JOIN rank_boards rb ON rb.board_key = 'consensus_2026'
                         LEFT JOIN player_board_ranks pbr ON pbr.player_id = p.id AND pbr.board_id = rb.id
                         WHERE e.board_id = ?
-                        ORDER BY e.rank_order ASC
+                        ORDER BY e.rank_order ASC, e.id ASC
                 ''', (board_id,))
                 rows = cursor.fetchall()
 
                 columns = [description[0] for description in cursor.description]
-                board_entries = [dict(zip(columns, row)) for row in rows]
-
-                cursor.execute('''
-                        SELECT p.name, pbr.board_rank
-                        FROM player_board_ranks pbr
-                        JOIN rank_boards rb ON rb.id = pbr.board_id
-                        JOIN players p ON p.id = pbr.player_id
-                        WHERE rb.board_key = 'consensus_2026'
-                ''')
-                consensus_rows = cursor.fetchall()
-                consensus_by_normalized_name = {}
-                for consensus_name, consensus_rank in consensus_rows:
-                        normalized_name = self._normalize_player_name(consensus_name)
-                        if not normalized_name:
-                                continue
-
-                        rank_value = float(consensus_rank)
-                        existing_rank = consensus_by_normalized_name.get(normalized_name)
-                        if existing_rank is None or rank_value < existing_rank:
-                                consensus_by_normalized_name[normalized_name] = rank_value
-
-                for player in board_entries:
-                        if player.get('consensus_rank') is not None:
-                                continue
-                        normalized_name = self._normalize_player_name(player.get('name'))
-                        if normalized_name in consensus_by_normalized_name:
-                                player['consensus_rank'] = consensus_by_normalized_name[normalized_name]
-
-                conn.close()
-                return board_entries
+                return [dict(zip(columns, row)) for row in rows]
 
         def add_player_to_big_board(self, player_id, board_type='overall', position=None):
-                """Add player into board using grade-first default insertion"""
+                """Add player into board using grade-first default insertion.
+
+                The player goes before the first entry (in board order) whose (grade_sort_key, rank, name)
+                sorts after theirs. The anchor is a board-order scan that stops at the first such entry, done in
+                SQL instead of loading the whole board into Python; a players-side index cannot drive it because
+                hand-reordered boards are not sorted by grade.
+                """
                 conn = self.get_connection()
                 cursor = conn.cursor()
                 board_id = self._get_or_create_big_board_id(cursor, board_type, position)
@@ -1075,41 +2916,32 @@ class ScoutDatabase:
                         conn.close()
                         return {'success': False, 'error': 'Player already exists on this board'}
 
-                cursor.execute('SELECT grade, rank, name FROM players WHERE id = ?', (player_id,))
+                cursor.execute('SELECT grade_sort_key, rank, name FROM players WHERE id = ?', (player_id,))
                 target_player = cursor.fetchone()
                 if not target_player:
                         conn.close()
                         return {'success': False, 'error': 'Player not found'}
 
-                target_priority = self._grade_priority(target_player[0])
-                target_rank = target_player[1] if target_player[1] is not None else 9999
-                target_name = target_player[2] or ''
-
                 cursor.execute('''
-                        SELECT e.player_id, e.rank_order, p.grade, p.rank, p.name
+                        SELECT e.player_id
                         FROM big_board_entries e
                         JOIN players p ON p.id = e.player_id
                         WHERE e.board_id = ?
-                        ORDER BY e.rank_order ASC
-                ''', (board_id,))
-                existing = cursor.fetchall()
-
-                insert_rank = len(existing) + 1
-                for _, rank_order, grade, rank, name in existing:
-                        priority = self._grade_priority(grade)
-                        this_rank = rank if rank is not None else 9999
-                        this_name = name or ''
-                        if (target_priority, target_rank, target_name) < (priority, this_rank, this_name):
-                                insert_rank = rank_order
-                                break
+                          AND (p.grade_sort_key, COALESCE(p.rank, 9999), COALESCE(p.name, '')) > (?, ?, ?)
+                        ORDER BY e.rank_order ASC, e.id ASC
+                        LIMIT 1
+                ''', (
+                        board_id,
+                        target_player[0],
+                        target_player[1] if target_player[1] is not None else 9999,
+                        target_player[2] or ''
+                ))
+                anchor = cursor.fetchone()
+                anchor_player_id = anchor[0] if anchor else None
 
-                cursor.execute(
-                        'UPDATE big_board_entries SET rank_order = rank_order + 1 WHERE board_id = ? AND rank_order >= ?',
-                        (board_id, insert_rank)
-                )
                 cursor.execute(
                         'INSERT INTO big_board_entries (board_id, player_id, rank_order) VALUES (?, ?, ?)',
-                        (board_id, player_id, insert_rank)
+                        (board_id, player_id, self._board_key_before(cursor, board_id, anchor_player_id))
                 )
                 conn.commit()
                 conn.close()
@@ -1120,19 +2952,136 @@ class ScoutDatabase:
                 conn = self.get_connection()
                 cursor = conn.cursor()
                 board_id = self._get_or_create_big_board_id(cursor, board_type, position)
-
-                for index, player_id in enumerate(ordered_player_ids, start=1):
-                        cursor.execute(
-                                'UPDATE big_board_entries SET rank_order = ? WHERE board_id = ? AND player_id = ?',
-                                (index, board_id, player_id)
-                        )
+                rows_written = self._apply_big_board_order(cursor, board_id, ordered_player_ids)
 
                 conn.commit()
                 conn.close()
-                return {'success': True}
+                return {'success': True, 'rows_written': rows_written}
+
+        def apply_big_board_moves(self, operations, board_type='overall', position=None):
+                """Apply compact edit operations to a board in one transaction.
+
+                Supported operations (applied in order):
+                        {'op': 'move', 'player_id': X, 'before_player_id': Y}   (or 'after_player_id'; neither = move to end)
+                        {'op': 'move_block', 'player_ids': [X, ...], 'before_player_id': Y}   (or 'after_player_id')
+                        {'op': 'swap', 'player_id': X, 'other_player_id': Y}
+                Returns only the entries whose dense position changed.
+                """
+                if not isinstance(operations, list) or not operations:
+                        return {'success': False, 'error': 'operations must be a non-empty list'}
+
+                conn = self.get_connection()
+                cursor = conn.cursor()
+
+                try:
+                        board_id = self._get_or_create_big_board_id(cursor, board_type, position)
+                        before_positions = self._big_board_positions(cursor, board_id)
+                        rows_written = 0
+
+                        for operation in operations:
+                                if not isinstance(operation, dict):
+                                        raise ValueError('Each operation must be an object.')
+                                op = operation.get('op')
+                                before_player_id = operation.get('before_player_id')
+                                after_player_id = operation.get('after_player_id')
+
+                                if op == 'move':
+                                        player_ids = [operation.get('player_id')]
+                                elif op == 'move_block':
+                                        player_ids = operation.get('player_ids')
+                                        if not isinstance(player_ids, list) or not player_ids:
+                                                raise ValueError('move_block requires a non-empty player_ids list.')
+                                elif op == 'swap':
+                                        rows_written += self._swap_board_entries(
+                                                cursor, board_id, operation.get('player_id'), operation.get('other_player_id')
+                                        )
+                                        continue
+                                else:
+                                        raise ValueError(f'Unsupported operation: {op}')
+
+                                if any(player_id is None for player_id in player_ids) or len(set(player_ids)) != len(player_ids):
+                                        raise ValueError(f'{op} requires distinct player ids.')
+                                if before_player_id is not None and after_player_id is not None:
+                                        raise ValueError('Use either before_player_id or after_player_id, not both.')
+                                if before_player_id in player_ids or after_player_id in player_ids:
+                                        raise ValueError('A player cannot be moved relative to itself.')
+                                missing = [player_id for player_id in player_ids + [before_player_id, after_player_id]
+                                           if player_id is not None and player_id not in before_positions]
+                                if missing:
+                                        raise ValueError(f'Player {missing[0]} is not on this board.')
+
+                                #Place the block one player at a time, each directly after the previous one
+                                anchor_after = after_player_id
+                                for player_id in player_ids:
+                                        if anchor_after is not None:
+                                                anchor_before = self._next_board_player(cursor, board_id, anchor_after, exclude_player_id=player_id)
+                                        else:
+                                                anchor_before = before_player_id
+                                        cursor.execute(
+                                                'UPDATE big_board_entries SET rank_order = ? WHERE board_id = ? AND player_id = ?',
+                                                (self._board_key_before(cursor, board_id, anchor_before), board_id, player_id)
+                                        )
+                                        rows_written += 1
+                                        anchor_after = player_id
+                        after_positions = self._big_board_positions(cursor, board_id)
+
+                        conn.commit()
+                except ValueError as e:
+                        conn.rollback()
+                        conn.close()
+                        return {'success': False, 'error': str(e)}
+
+                conn.close()
+                changed = [
+                        {'player_id': player_id, 'rank_order': rank_order}
+                        for player_id, rank_order in after_positions.items()
+                        if before_positions.get(player_id) != rank_order
+                ]
+                changed.sort(key=lambda row: row['rank_order'])
+                return {'success': True, 'changed': changed, 'rows_written': rows_written, 'board_size': len(after_positions)}
+
+        @staticmethod
+        def _big_board_positions(cursor, board_id):
+                cursor.execute(
+                        'SELECT player_id FROM big_board_entries WHERE board_id = ? ORDER BY rank_order, id',
+                        (board_id,)
+                )
+                return {row[0]: index for index, row in enumerate(cursor.fetchall(), start=1)}
+
+        @staticmethod
+        def _next_board_player(cursor, board_id, player_id, exclude_player_id=None):
+                """Player directly after player_id on the board (skipping exclude_player_id), or None"""
+                cursor.execute('''
+                        SELECT next_entry.player_id
+                        FROM big_board_entries anchor
+                        JOIN big_board_entries next_entry
+                          ON next_entry.board_id = anchor.board_id
+                         AND (next_entry.rank_order > anchor.rank_order
+                              OR (next_entry.rank_order = anchor.rank_order AND next_entry.id > anchor.id))
+                        WHERE anchor.board_id = ? AND anchor.player_id = ? AND next_entry.player_id IS NOT ?
+                        ORDER BY next_entry.rank_order, next_entry.id
+                        LIMIT 1
+                ''', (board_id, player_id, exclude_player_id))
+                row = cursor.fetchone()
+                return row[0] if row else None
+
+        @staticmethod
+        def _swap_board_entries(cursor, board_id, player_id, other_player_id):
+                cursor.execute(
+                        'SELECT player_id, rank_order FROM big_board_entries WHERE board_id = ? AND player_id IN (?, ?)',
+                        (board_id, player_id, other_player_id)
+                )
+                keys = dict(cursor.fetchall())
+                if player_id == other_player_id or len(keys) != 2:
+                        raise ValueError('swap requires two different players on this board.')
+                cursor.executemany(
+                        'UPDATE big_board_entries SET rank_order = ? WHERE board_id = ? AND player_id = ?',
+                        [(keys[other_player_id], board_id, player_id), (keys[player_id], board_id, other_player_id)]
+                )
+                return 2
 
         def remove_player_from_big_board(self, player_id, board_type='overall', position=None):
-                """Remove player from board and compress order"""
+                """Remove player from board; positions stay dense because they are counted from the keys"""
                 conn = self.get_connection()
                 cursor = conn.cursor()
                 board_id = self._get_or_create_big_board_id(cursor, board_type, position)
@@ -1142,17 +3091,6 @@ class ScoutDatabase:
                         (board_id, player_id)
                 )
 
-                cursor.execute(
-                        'SELECT player_id FROM big_board_entries WHERE board_id = ? ORDER BY rank_order ASC',
-                        (board_id,)
-                )
-                remaining = [row[0] for row in cursor.fetchall()]
-                for index, pid in enumerate(remaining, start=1):
-                        cursor.execute(
-                                'UPDATE big_board_entries SET rank_order = ? WHERE board_id = ? AND player_id = ?',
-                                (index, board_id, pid)
-                        )
-
                 conn.commit()
                 conn.close()
                 return {'success': True}
@@ -1164,27 +3102,13 @@ class ScoutDatabase:
                 board_id = self._get_or_create_big_board_id(cursor, board_type, position)
 
                 cursor.execute('''
-                        SELECT e.player_id, p.grade, p.rank, p.name
+                        SELECT e.player_id
                         FROM big_board_entries e
                         JOIN players p ON p.id = e.player_id
                         WHERE e.board_id = ?
+                        ORDER BY p.grade_sort_key, COALESCE(p.rank, 9999), p.name
                 ''', (board_id,))
-                entries = cursor.fetchall()
-
-                sorted_entries = sorted(
-                        entries,
-                        key=lambda row: (
-                                self._grade_priority(row[1]),
-                                row[2] if row[2] is not None else 9999,
-                                row[3] or ''
-                        )
-                )
-
-                for index, (player_id, _, _, _) in enumerate(sorted_entries, start=1):
-                        cursor.execute(
-                                'UPDATE big_board_entries SET rank_order = ? WHERE board_id = ? AND player_id = ?',
-                                (index, board_id, player_id)
-                        )
+                self._apply_big_board_order(cursor, board_id, [row[0] for row in cursor.fetchall()])
 
                 conn.commit()
                 conn.close()
@@ -1194,6 +3118,42 @@ class ScoutDatabase:
                 """Get ranked personal watch list entries."""
                 return self.get_big_board(board_type='watchlist', position=None)
 
+        def get_bootstrap_state(self, include_big_board=False):
+                """Initial UI state (stats, lookups, rank boards, watch list and optionally the
+                overall big board) read from one SQLite read transaction.
+
+                Sections still valid in the read cache are reused; the rest are read inside the
+                transaction and cached under the generation captured before it began.
+                """
+                sections = [
+                        ('stats', ('stats',), self._select_db_stats),
+                        ('positions', ('positions',), self._select_all_positions),
+                        ('schools', ('schools',), self._select_all_schools),
+                        ('rank_boards', ('rank_boards_config',), self._select_rank_boards_config),
+                        ('watch_list', ('big_board', 'watchlist', None), lambda cursor: self._select_big_board(cursor, 'watchlist')),
+                ]
+                if include_big_board:
+                        sections.append(('big_board', ('big_board', 'overall', None), lambda cursor: self._select_big_board(cursor, 'overall')))
+
+                conn = self.get_connection()
+                cursor = conn.cursor()
+                state = {}
+                try:
+                        generation = self._pool.generation
+                        cursor.execute('BEGIN')
+                        for section_name, cache_key, select in sections:
+                                hit, value = self._read_cache.get(cache_key, generation)
+                                if not hit:
+                                        value = select(cursor)
+                                        self._read_cache.put(cache_key, generation, value)
+                                state[section_name] = self._copy_cached(value)
+                        conn.rollback()
+                finally:
+                        conn.close()
+
+                state['data_generation'] = generation
+                return state
+
         def add_player_to_watch_list(self, player_id):
                 """Add player to personal watch list at the bottom."""
                 conn = self.get_connection()
@@ -1214,12 +3174,9 @@ class ScoutDatabase:
                         conn.close()
                         return {'success': False, 'error': 'Player not found.'}
 
-                cursor.execute('SELECT COALESCE(MAX(rank_order), 0) FROM big_board_entries WHERE board_id = ?', (board_id,))
-                max_rank = cursor.fetchone()[0] or 0
-
                 cursor.execute(
                         'INSERT INTO big_board_entries (board_id, player_id, rank_order) VALUES (?, ?, ?)',
-                        (board_id, player_id, max_rank + 1)
+                        (board_id, player_id, self._board_key_before(cursor, board_id))
                 )
 
                 conn.commit()
@@ -1230,8 +3187,12 @@ class ScoutDatabase:
                 """Persist drag-and-drop order for watch list."""
                 return self.reorder_big_board(ordered_player_ids, board_type='watchlist', position=None)
 
+        def apply_watch_list_moves(self, operations):
+                """Apply compact move/swap operations to the watch list."""
+                return self.apply_big_board_moves(operations, board_type='watchlist', position=None)
+
         def remove_player_from_watch_list(self, player_id):
-                """Remove player from watch list and compress ranks."""
+                """Remove player from watch list."""
                 return self.remove_player_from_big_board(player_id, board_type='watchlist', position=None)
 
         @staticmethod
@@ -1267,14 +3228,13 @@ class ScoutDatabase:
                 return normalized.strip()
 
         @staticmethod
-        def _parse_big_board_text(board_text):
-                """Parse text lines into ordered (rank, name) entries."""
-                entries = []
+        def _iter_big_board_text(board_text):
+                """Parse text lines into ordered (rank, name) entries, one at a time."""
                 if not board_text:
-                        return entries
+                        return
 
-                lines = board_text.splitlines()
-                for line in lines:
+                entry_count = 0
+                for line in board_text.splitlines():
                         raw = (line or '').strip()
                         if not raw:
                                 continue
@@ -1284,28 +3244,22 @@ class ScoutDatabase:
                                 rank_value = int(match.group(1))
                                 name = match.group(2).strip()
                         else:
-                                rank_value = len(entries) + 1
+                                rank_value = entry_count + 1
                                 name = raw
 
                         if not name:
                                 continue
 
-                        entries.append({'rank': rank_value, 'name': name})
-
-                return entries
+                        entry_count += 1
+                        yield {'rank': rank_value, 'name': name}
 
+        @_serialized_write
         def import_external_big_boards(self, boards, weighting_mode='equal'):
                 """Import multiple external boards and store each board independently."""
                 if not isinstance(boards, list) or len(boards) == 0:
                         return {'success': False, 'error': 'At least one board is required.'}
 
-                conn = self.get_connection()
-                cursor = conn.cursor()
-
-                board_summaries = []
-                unmatched_names = set()
-                total_new_players = 0
-
+                board_specs = []
                 for board in boards:
                         board_name = (board.get('name') or 'Unnamed Board').strip() if isinstance(board, dict) else 'Unnamed Board'
                         board_text = board.get('text', '') if isinstance(board, dict) else ''
@@ -1313,10 +3267,6 @@ class ScoutDatabase:
                         if not board_key.startswith('imported_'):
                                 board_key = f'imported_{board_key}'
 
-                        parsed_entries = self._parse_big_board_text(board_text)
-                        if not parsed_entries:
-                                continue
-
                         if weighting_mode == 'weighted':
                                 raw_weight = board.get('weight', 1) if isinstance(board, dict) else 1
                                 try:
@@ -1329,433 +3279,392 @@ class ScoutDatabase:
                         if board_weight <= 0:
                                 board_weight = 1.0
 
-                        normalized_entries = []
-                        for entry in parsed_entries:
-                                entry_name = (entry.get('name') or '').strip()
-                                if not entry_name:
-                                        continue
-                                normalized_entries.append({'name': entry_name, 'rank': entry.get('rank')})
-
-                        upsert_result = self._upsert_board_rank_entries(
-                                cursor,
-                                board_key=board_key,
-                                board_name=board_name,
-                                entries=normalized_entries,
-                                source_type='imported',
-                                weight=board_weight,
-                                is_primary=0
-                        )
-                        total_new_players += upsert_result['new_player_count']
-
-                        board_summaries.append({
-                                'name': board_name,
+                        board_specs.append({
                                 'board_key': board_key,
-                                'entries': len(parsed_entries),
-                                'matched': upsert_result['matched_count'],
-                                'weight': board_weight
+                                'board_name': board_name,
+                                'source_type': 'imported',
+                                'weight': board_weight,
+                                'is_primary': 0,
+                                'enrich': None,
+                                'entries': self._iter_big_board_text(board_text)
                         })
 
+                pipeline = self._run_import_pipeline(board_specs)
+                board_summaries = [
+                        {
+                                'name': board['board_name'],
+                                'board_key': board['board_key'],
+                                'entries': board['entries'],
+                                'matched': board['matched_count'],
+                                'weight': board['weight'],
+                                'unchanged': board['unchanged'],
+                                'changes': self._change_summary(board)
+                        }
+                        for board in pipeline['boards']
+                        if not board['empty']
+                ]
+
                 if not board_summaries:
-                        conn.close()
                         return {'success': False, 'error': 'No valid board entries were found in uploaded files.'}
 
-                conn.commit()
-                conn.close()
-                player_count = self.recalculate_default_rankings()
-
+                player_count = pipeline['players_total_ranked']
                 return {
                         'success': True,
                         'mode': weighting_mode,
                         'boards_processed': len(board_summaries),
+                        'boards_unchanged': sum(1 for board in board_summaries if board['unchanged']),
                         'boards': board_summaries,
                         'players_ranked_from_import': player_count,
                         'players_total_ranked': player_count,
-                        'new_players_added': total_new_players,
+                        'new_players_added': sum(board['new_player_count'] for board in pipeline['boards']),
                         'positional_rank_updates': player_count,
-                        'unmatched_count': len(unmatched_names),
-                        'unmatched_examples': sorted(list(unmatched_names))[:10]
+                        'unmatched_count': 0,
+                        'unmatched_examples': [],
+                        'ranking_generation': pipeline['ranking_generation'],
+                        'approximate_matches': pipeline['approximate_matches'],
+                        'alias_suggestions': pipeline['alias_suggestions'],
+                        'timings_ms': pipeline['timings_ms']
                 }
 
-        def import_consensus_board(self, players, board_key='consensus_2026', board_name='Consensus Big Board 2026'):
-                """Import consensus board ranks, creating missing players without overwriting Tankathon detail fields."""
-                if not isinstance(players, list) or not players:
-                        return {'success': False, 'error': 'No consensus players provided.'}
-
-                conn = self.get_connection()
-                cursor = conn.cursor()
-
-                cursor.execute('SELECT id, name, position, school FROM players')
-                existing_players = cursor.fetchall()
-                normalized_lookup = {}
-                for existing_id, existing_name, _, _ in existing_players:
-                        normalized_name = self._normalize_player_name(existing_name)
-                        if normalized_name and normalized_name not in normalized_lookup:
-                                normalized_lookup[normalized_name] = (existing_id, existing_name)
-
-                normalized_entries = []
-                for player in players:
-                        name = (player.get('name') or '').strip()
-                        rank = player.get('rank')
-                        if not name or rank is None:
-                                continue
-
-                        position = (player.get('position') or '').strip()
-                        school = (player.get('school') or '').strip()
-
-                        cursor.execute('SELECT id, name FROM players WHERE name = ?', (name,))
-                        exact_match = cursor.fetchone()
-                        canonical_name = name
-
-                        if exact_match:
-                                player_id = exact_match[0]
-                                canonical_name = exact_match[1]
-                        else:
-                                normalized_name = self._normalize_player_name(name)
-                                normalized_match = normalized_lookup.get(normalized_name)
-                                if normalized_match:
-                                        player_id = normalized_match[0]
-                                        canonical_name = normalized_match[1]
-                                else:
-                                        cursor.execute('INSERT INTO players (name, position, school) VALUES (?, ?, ?)', (name, position, school))
-                                        player_id = cursor.lastrowid
-                                        canonical_name = name
-                                        if normalized_name:
-                                                normalized_lookup[normalized_name] = (player_id, canonical_name)
-
-                        cursor.execute('''
-                                UPDATE players
-                                SET position = CASE
-                                        WHEN (position IS NULL OR position = '') AND ? != ''
-                                        THEN ? ELSE position
-                                END,
-                                school = CASE
-                                        WHEN (school IS NULL OR school = '') AND ? != ''
-                                        THEN ? ELSE school
-                                END
-                                WHERE id = ?
-                        ''', (position, position, school, school, player_id))
+        @staticmethod
+        def _scraped_board_spec(board_key, board_name, players, source_type='imported', is_primary=0):
+                """Pipeline spec for a scraped board; scraped position/school fill blank player fields"""
+                return {
+                        'board_key': board_key,
+                        'board_name': board_name,
+                        'source_type': source_type,
+                        'weight': 1.0,
+                        'is_primary': is_primary,
+                        'enrich': 'fill_blank',
+                        'entries': players
+                }
 
-                        normalized_entries.append({'name': canonical_name, 'rank': rank})
+        @_serialized_write
+        def import_consensus_board(self, players, board_key='consensus_2026', board_name='Consensus Big Board 2026', progress=None):
+                """Import consensus board ranks, creating missing players without overwriting Tankathon detail fields.
 
-                if not normalized_entries:
-                        conn.close()
-                        return {'success': False, 'error': 'No valid consensus entries found.'}
+                progress, when given, is called with each pipeline stage name.
+                """
+                if not isinstance(players, list) or not players:
+                        return {'success': False, 'error': 'No consensus players provided.'}
 
-                cursor.execute('UPDATE rank_boards SET is_primary = 0')
-                upsert_result = self._upsert_board_rank_entries(
-                        cursor,
-                        board_key=board_key,
-                        board_name=board_name,
-                        entries=normalized_entries,
-                        source_type='consensus',
-                        weight=1.0,
-                        is_primary=1
+                pipeline = self._run_import_pipeline(
+                        [self._scraped_board_spec(board_key, board_name, players, source_type='consensus', is_primary=1)],
+                        progress=progress
                 )
-
-                conn.commit()
-                conn.close()
-                ranked_count = self.recalculate_default_rankings()
+                board = pipeline['boards'][0]
+                if board['empty']:
+                        return {'success': False, 'error': 'No valid consensus entries found.'}
 
                 return {
                         'success': True,
                         'board_key': board_key,
                         'board_name': board_name,
-                        'entries_imported': upsert_result['matched_count'],
-                        'new_players_added': upsert_result['new_player_count'],
-                        'players_total_ranked': ranked_count
+                        'unchanged': board['unchanged'],
+                        'changes': self._change_summary(board),
+                        'entries_imported': board['matched_count'],
+                        'new_players_added': board['new_player_count'],
+                        'players_total_ranked': pipeline['players_total_ranked'],
+                        'ranking_generation': pipeline['ranking_generation'],
+                        'approximate_matches': pipeline['approximate_matches'],
+                        'alias_suggestions': pipeline['alias_suggestions'],
+                        'timings_ms': pipeline['timings_ms']
                 }
 
-        def import_nflmock_url_board(self, players, board_name):
-                """Import a non-consensus NFLMockDraftDatabase board by URL into selectable rank boards."""
-                if not isinstance(players, list) or not players:
-                        return {'success': False, 'error': 'No players provided from source board.'}
-
-                normalized_board_name = (board_name or '').strip() or 'Imported NFLMockDraftDatabase Board'
-                board_key = self._slugify_board_key(normalized_board_name)
+        @_serialized_write
+        def import_nflmock_url_board(self, players, board_name, progress=None):
+                """Import a non-consensus NFLMockDraftDatabase board by URL into selectable rank boards.
+
+                progress, when given, is called with each pipeline stage name.
+                """
+                result = self.import_nflmock_url_boards([{'board_name': board_name, 'players': players}], progress=progress)
+                if not result['success']:
+                        return result
+                return dict(
+                        result['boards'][0],
+                        approximate_matches=result['approximate_matches'],
+                        alias_suggestions=result['alias_suggestions']
+                )
 
-                conn = self.get_connection()
-                cursor = conn.cursor()
+        @_serialized_write
+        def import_nflmock_url_boards(self, boards, progress=None):
+                """Import several scraped NFLMockDraftDatabase boards in one transaction with one rank recalculation.
 
-                cursor.execute('SELECT id, name, position, school FROM players')
-                existing_players = cursor.fetchall()
-                normalized_lookup = {}
-                for existing_id, existing_name, _, _ in existing_players:
-                        normalized_name = self._normalize_player_name(existing_name)
-                        if normalized_name and normalized_name not in normalized_lookup:
-                                normalized_lookup[normalized_name] = (existing_id, existing_name)
+                boards is a list of {'board_name', 'players'} dicts (crawler output). Boards without
+                usable entries are reported under 'skipped' instead of failing the whole import.
+                progress, when given, is called with each pipeline stage name.
+                """
+                if not isinstance(boards, list) or not boards:
+                        return {'success': False, 'error': 'No boards provided.'}
 
-                normalized_entries = []
-                for player in players:
-                        name = (player.get('name') or '').strip()
-                        rank = player.get('rank')
-                        if not name or rank is None:
+                board_specs = []
+                skipped = []
+                for board in boards:
+                        players = board.get('players') or []
+                        normalized_board_name = (board.get('board_name') or '').strip() or 'Imported NFLMockDraftDatabase Board'
+                        if not isinstance(players, list) or not players:
+                                skipped.append({'board_name': normalized_board_name, 'error': 'No players provided from source board.'})
                                 continue
+                        board_specs.append(self._scraped_board_spec(
+                                self._slugify_board_key(normalized_board_name), normalized_board_name, players
+                        ))
 
-                        position = (player.get('position') or '').strip()
-                        school = (player.get('school') or '').strip()
-
-                        cursor.execute('SELECT id, name FROM players WHERE name = ?', (name,))
-                        exact_match = cursor.fetchone()
-                        canonical_name = name
-
-                        if exact_match:
-                                player_id = exact_match[0]
-                                canonical_name = exact_match[1]
-                        else:
-                                normalized_name = self._normalize_player_name(name)
-                                normalized_match = normalized_lookup.get(normalized_name)
-                                if normalized_match:
-                                        player_id = normalized_match[0]
-                                        canonical_name = normalized_match[1]
-                                else:
-                                        cursor.execute('INSERT INTO players (name, position, school) VALUES (?, ?, ?)', (name, position, school))
-                                        player_id = cursor.lastrowid
-                                        canonical_name = name
-                                        if normalized_name:
-                                                normalized_lookup[normalized_name] = (player_id, canonical_name)
-
-                        cursor.execute('''
-                                UPDATE players
-                                SET position = CASE
-                                        WHEN (position IS NULL OR position = '') AND ? != ''
-                                        THEN ? ELSE position
-                                END,
-                                school = CASE
-                                        WHEN (school IS NULL OR school = '') AND ? != ''
-                                        THEN ? ELSE school
-                                END
-                                WHERE id = ?
-                        ''', (position, position, school, school, player_id))
-
-                        normalized_entries.append({'name': canonical_name, 'rank': rank})
-
-                if not normalized_entries:
-                        conn.close()
-                        return {'success': False, 'error': 'No valid entries found in source board.'}
-
-                upsert_result = self._upsert_board_rank_entries(
-                        cursor,
-                        board_key=board_key,
-                        board_name=normalized_board_name,
-                        entries=normalized_entries,
-                        source_type='imported',
-                        weight=1.0,
-                        is_primary=0
-                )
+                pipeline = self._run_import_pipeline(board_specs, progress=progress) if board_specs else None
+                imported_boards = []
+                for board in (pipeline['boards'] if pipeline else []):
+                        if board['empty']:
+                                skipped.append({'board_name': board['board_name'], 'error': 'No valid entries found in source board.'})
+                                continue
+                        imported_boards.append({
+                                'success': True,
+                                'board_key': board['board_key'],
+                                'board_name': board['board_name'],
+                                'unchanged': board['unchanged'],
+                                'changes': self._change_summary(board),
+                                'entries_imported': board['matched_count'],
+                                'new_players_added': board['new_player_count'],
+                                'players_total_ranked': pipeline['players_total_ranked'],
+                                'ranking_generation': pipeline['ranking_generation']
+                        })
 
-                conn.commit()
-                conn.close()
-                ranked_count = self.recalculate_default_rankings()
+                if not imported_boards:
+                        error = skipped[0]['error'] if len(boards) == 1 else 'No valid entries found in any source board.'
+                        return {'success': False, 'error': error, 'skipped': skipped}
 
                 return {
                         'success': True,
-                        'board_key': board_key,
-                        'board_name': normalized_board_name,
-                        'entries_imported': upsert_result['matched_count'],
-                        'new_players_added': upsert_result['new_player_count'],
-                        'players_total_ranked': ranked_count
+                        'boards': imported_boards,
+                        'boards_imported': len(imported_boards),
+                        'boards_unchanged': sum(1 for board in imported_boards if board['unchanged']),
+                        'entries_imported': sum(board['entries_imported'] for board in imported_boards),
+                        'skipped': skipped,
+                        'players_total_ranked': pipeline['players_total_ranked'],
+                        'ranking_generation': pipeline['ranking_generation'],
+                        'approximate_matches': pipeline['approximate_matches'],
+                        'alias_suggestions': pipeline['alias_suggestions'],
+                        'timings_ms': pipeline['timings_ms']
                 }
 
-        def merge_player_name_duplicates(self):
-                """Merge duplicate players that normalize to the same name and rewire references."""
+        @_serialized_write
+        def merge_player_name_duplicates(self, dry_run=False):
+                """Merge duplicate players that normalize to the same name and rewire references.
+
+                Builds a temp duplicate_id -> canonical_id map (the canonical player is the one with the
+                most filled-in fields, then the one whose name is already normalized, then the lowest id)
+                and applies the merge as a handful of set-based statements in one transaction. With
+                dry_run=True the planned groups are returned and nothing is written.
+                """
                 conn = self.get_connection()
                 cursor = conn.cursor()
 
-                def value_score(player_row):
-                        score = 0
-                        if player_row.get('scouted'):
-                                score += 5
-                        for key in ['position', 'school', 'height', 'weight', 'player_url', 'stats', 'notes', 'games_watched', 'grade', 'grade_secondary']:
-                                if (player_row.get(key) or '').strip():
-                                        score += 1
-                        return score
-
-                def choose_rank_value(current_value, incoming_value):
-                        current_num = None
-                        incoming_num = None
-                        try:
-                                current_num = float(current_value) if current_value is not None else None
-                        except Exception:
-                                current_num = None
-                        try:
-                                incoming_num = float(incoming_value) if incoming_value is not None else None
-                        except Exception:
-                                incoming_num = None
-
-                        if incoming_num is None:
-                                return current_value
-                        if current_num is None:
-                                return incoming_value
-                        return incoming_value if incoming_num < current_num else current_value
-
                 try:
-                        cursor.execute('SELECT * FROM players')
-                        columns = [description[0] for description in cursor.description]
-                        players = [dict(zip(columns, row)) for row in cursor.fetchall()]
-
-                        groups = {}
-                        for player in players:
-                                normalized_name = self._normalize_player_name(player.get('name'))
-                                if not normalized_name:
-                                        continue
-                                groups.setdefault(normalized_name, []).append(player)
+                        cursor.execute('BEGIN IMMEDIATE')
+                        self._backfill_normalized_names(cursor)
+                        self._build_player_merge_map(cursor)
 
-                        duplicate_groups = [group for group in groups.values() if len(group) > 1]
-                        if not duplicate_groups:
+                        cursor.execute('''
+                                SELECT m.canonical_id, c.name, c.normalized_name, m.duplicate_id, d.name
+                                FROM player_merge_map m
+                                JOIN players c ON c.id = m.canonical_id
+                                JOIN players d ON d.id = m.duplicate_id
+                                ORDER BY c.normalized_name, m.duplicate_id
+                        ''')
+                        groups = OrderedDict()
+                        for canonical_id, canonical_name, normalized_name, duplicate_id, duplicate_name in cursor.fetchall():
+                                group = groups.setdefault(canonical_id, {
+                                        'normalized_name': normalized_name,
+                                        'canonical': {'id': canonical_id, 'name': canonical_name},
+                                        'duplicates': []
+                                })
+                                group['duplicates'].append({'id': duplicate_id, 'name': duplicate_name})
+                        players_removed = sum(len(group['duplicates']) for group in groups.values())
+
+                        if not groups or dry_run:
+                                conn.rollback()
                                 conn.close()
+                                if not groups:
+                                        return {
+                                                'success': True,
+                                                'dry_run': bool(dry_run),
+                                                'groups_merged': 0,
+                                                'players_removed': 0,
+                                                'groups': [],
+                                                'output': 'No duplicate player name variants found.'
+                                        }
                                 return {
                                         'success': True,
-                                        'groups_merged': 0,
-                                        'players_removed': 0,
-                                        'output': 'No duplicate player name variants found.'
+                                        'dry_run': True,
+                                        'groups_merged': len(groups),
+                                        'players_removed': players_removed,
+                                        'groups': list(groups.values()),
+                                        'output': f'Would merge {players_removed} duplicate players across {len(groups)} normalized-name groups.'
                                 }
 
-                        merged_groups = 0
-                        players_removed = 0
-
-                        text_fields = ['position', 'positional_rank', 'school', 'height', 'weight', 'jersey_number', 'player_url', 'stats', 'notes', 'games_watched', 'grade', 'grade_secondary', 'scout_date']
-
-                        for group in duplicate_groups:
-                                canonical = sorted(
-                                        group,
-                                        key=lambda row: (
-                                                -value_score(row),
-                                                0 if row.get('name') == self._normalize_player_name(row.get('name')) else 1,
-                                                row.get('id')
-                                        )
-                                )[0]
-                                canonical_id = canonical['id']
-
-                                for duplicate in group:
-                                        duplicate_id = duplicate['id']
-                                        if duplicate_id == canonical_id:
-                                                continue
-
-                                        for field in text_fields:
-                                                canonical_value = (canonical.get(field) or '').strip()
-                                                duplicate_value = (duplicate.get(field) or '').strip()
-                                                if not canonical_value and duplicate_value:
-                                                        canonical[field] = duplicate_value
-
-                                        canonical['rank'] = choose_rank_value(canonical.get('rank'), duplicate.get('rank'))
-                                        canonical['tankathon_rank'] = choose_rank_value(canonical.get('tankathon_rank'), duplicate.get('tankathon_rank'))
-                                        canonical['weighted_avg_rank'] = choose_rank_value(canonical.get('weighted_avg_rank'), duplicate.get('weighted_avg_rank'))
-                                        canonical['scouted'] = 1 if canonical.get('scouted') or duplicate.get('scouted') else 0
-
-                                        cursor.execute('SELECT board_id, rank_order FROM big_board_entries WHERE player_id = ?', (duplicate_id,))
-                                        duplicate_board_entries = cursor.fetchall()
-                                        for board_id, rank_order in duplicate_board_entries:
-                                                cursor.execute(
-                                                        'SELECT id FROM big_board_entries WHERE board_id = ? AND player_id = ?',
-                                                        (board_id, canonical_id)
-                                                )
-                                                existing_entry = cursor.fetchone()
-                                                if existing_entry:
-                                                        cursor.execute('DELETE FROM big_board_entries WHERE board_id = ? AND player_id = ?', (board_id, duplicate_id))
-                                                else:
-                                                        cursor.execute(
-                                                                'UPDATE big_board_entries SET player_id = ? WHERE board_id = ? AND player_id = ?',
-                                                                (canonical_id, board_id, duplicate_id)
-                                                        )
-
-                                        cursor.execute('SELECT board_id, board_rank FROM player_board_ranks WHERE player_id = ?', (duplicate_id,))
-                                        duplicate_board_ranks = cursor.fetchall()
-                                        for board_id, duplicate_board_rank in duplicate_board_ranks:
-                                                cursor.execute(
-                                                        'SELECT id, board_rank FROM player_board_ranks WHERE board_id = ? AND player_id = ?',
-                                                        (board_id, canonical_id)
-                                                )
-                                                existing_rank = cursor.fetchone()
-                                                if existing_rank:
-                                                        existing_rank_id, existing_rank_value = existing_rank
-                                                        merged_rank = min(float(existing_rank_value), float(duplicate_board_rank))
-                                                        cursor.execute(
-                                                                'UPDATE player_board_ranks SET board_rank = ? WHERE id = ?',
-                                                                (merged_rank, existing_rank_id)
-                                                        )
-                                                        cursor.execute(
-                                                                'DELETE FROM player_board_ranks WHERE board_id = ? AND player_id = ?',
-                                                                (board_id, duplicate_id)
-                                                        )
-                                                else:
-                                                        cursor.execute(
-                                                                'UPDATE player_board_ranks SET player_id = ? WHERE board_id = ? AND player_id = ?',
-                                                                (canonical_id, board_id, duplicate_id)
-                                                        )
-
-                                        cursor.execute('DELETE FROM players WHERE id = ?', (duplicate_id,))
-                                        players_removed += 1
-
-                                cursor.execute('''
-                                        UPDATE players
-                                        SET rank = ?,
-                                            position = ?,
-                                            positional_rank = ?,
-                                            school = ?,
-                                            height = ?,
-                                            weight = ?,
-                                            jersey_number = ?,
-                                            player_url = ?,
-                                            stats = ?,
-                                            scouted = ?,
-                                            notes = ?,
-                                            games_watched = ?,
-                                            grade = ?,
-                                            grade_secondary = ?,
-                                            scout_date = ?,
-                                            tankathon_rank = ?,
-                                            weighted_avg_rank = ?
-                                        WHERE id = ?
-                                ''', (
-                                        canonical.get('rank'),
-                                        canonical.get('position'),
-                                        canonical.get('positional_rank'),
-                                        canonical.get('school'),
-                                        canonical.get('height'),
-                                        canonical.get('weight'),
-                                        canonical.get('jersey_number'),
-                                        canonical.get('player_url'),
-                                        canonical.get('stats'),
-                                        canonical.get('scouted'),
-                                        canonical.get('notes'),
-                                        canonical.get('games_watched'),
-                                        canonical.get('grade'),
-                                        canonical.get('grade_secondary'),
-                                        canonical.get('scout_date'),
-                                        canonical.get('tankathon_rank'),
-                                        canonical.get('weighted_avg_rank'),
-                                        canonical_id
-                                ))
-
-                                merged_groups += 1
-
-                        cursor.execute('SELECT id FROM big_boards')
-                        board_ids = [row[0] for row in cursor.fetchall()]
-                        for board_id in board_ids:
-                                cursor.execute(
-                                        'SELECT id FROM big_board_entries WHERE board_id = ? ORDER BY rank_order ASC, id ASC',
-                                        (board_id,)
-                                )
-                                entry_ids = [row[0] for row in cursor.fetchall()]
-                                for index, entry_id in enumerate(entry_ids, start=1):
-                                        cursor.execute('UPDATE big_board_entries SET rank_order = ? WHERE id = ?', (index, entry_id))
+                        self._apply_player_merge_map(cursor)
 
+                        cursor.execute('SELECT COUNT(*) FROM players')
+                        ranked_count = cursor.fetchone()[0]
                         conn.commit()
                         conn.close()
-                        ranked_count = self.recalculate_default_rankings()
+                        ranking_generation = self.request_rank_recalculation()
 
                         return {
                                 'success': True,
-                                'groups_merged': merged_groups,
+                                'dry_run': False,
+                                'groups_merged': len(groups),
                                 'players_removed': players_removed,
+                                'groups': list(groups.values()),
                                 'players_total_ranked': ranked_count,
-                                'output': f'Merged {players_removed} duplicate players across {merged_groups} normalized-name groups.'
+                                'ranking_generation': ranking_generation,
+                                'output': f'Merged {players_removed} duplicate players across {len(groups)} normalized-name groups.'
                         }
                 except Exception as error:
                         conn.rollback()
                         conn.close()
                         return {'success': False, 'error': str(error)}
 
+        @staticmethod
+        def _create_player_merge_map(cursor):
+                cursor.execute('''
+                        CREATE TEMP TABLE IF NOT EXISTS player_merge_map (
+                                duplicate_id INTEGER PRIMARY KEY,
+                                canonical_id INTEGER NOT NULL
+                        )
+                ''')
+                cursor.execute('CREATE INDEX IF NOT EXISTS temp.idx_player_merge_map_canonical ON player_merge_map(canonical_id, duplicate_id)')
+                cursor.execute('DELETE FROM player_merge_map')
+
+        @staticmethod
+        def _build_player_merge_map(cursor):
+                """Fill the player_merge_map temp table with duplicate_id -> canonical_id for every duplicate group"""
+                ScoutDatabase._create_player_merge_map(cursor)
+
+                filled_fields = ' + '.join(
+                        f"(TRIM(COALESCE({field}, '')) != '')"
+                        for field in ('position', 'school', 'height', 'weight', 'player_url', 'stats', 'notes', 'games_watched', 'grade', 'grade_secondary')
+                )
+                cursor.execute(f'''
+                        INSERT INTO player_merge_map (duplicate_id, canonical_id)
+                        SELECT id, canonical_id
+                        FROM (
+                                SELECT id, FIRST_VALUE(id) OVER (
+                                        PARTITION BY normalized_name
+                                        ORDER BY (CASE WHEN scouted THEN 5 ELSE 0 END) + {filled_fields} DESC,
+                                                 CASE WHEN name = normalized_name THEN 0 ELSE 1 END,
+                                                 id
+                                ) AS canonical_id
+                                FROM players
+                                WHERE normalized_name IN (
+                                        SELECT normalized_name
+                                        FROM players
+                                        WHERE normalized_name != ''
+                                        GROUP BY normalized_name
+                                        HAVING COUNT(*) > 1
+                                )
+                        )
+                        WHERE id != canonical_id
+                ''')
+
+        @staticmethod
+        def _apply_player_merge_map(cursor):
+                """Fold every mapped duplicate into its canonical player and delete the duplicates"""
+                merged_text = ',\n'.join(
+                        f'''{field} = CASE WHEN TRIM(COALESCE({field}, '')) != '' THEN {field} ELSE COALESCE((
+                                SELECT TRIM(d.{field}) FROM player_merge_map m JOIN players d ON d.id = m.duplicate_id
+                                WHERE m.canonical_id = players.id AND TRIM(COALESCE(d.{field}, '')) != ''
+                                ORDER BY m.duplicate_id LIMIT 1
+                        ), {field}) END'''
+                        for field in _MERGE_TEXT_FIELDS
+                )
+                merged_ranks = ',\n'.join(
+                        f'''{field} = (
+                                SELECT CASE WHEN players.{field} IS NULL OR MIN(d.{field}) < players.{field} THEN MIN(d.{field}) ELSE players.{field} END
+                                FROM player_merge_map m JOIN players d ON d.id = m.duplicate_id
+                                WHERE m.canonical_id = players.id
+                        )'''
+                        for field in _MERGE_RANK_FIELDS
+                )
+
+                #Queue everyone involved (duplicates keep their position so their positional group is recomputed)
+                cursor.execute('''
+                        INSERT OR IGNORE INTO rank_recalc_queue (player_id, previous_position)
+                        SELECT id, position FROM players
+                        WHERE id IN (SELECT duplicate_id FROM player_merge_map UNION SELECT canonical_id FROM player_merge_map)
+                ''')
+
+                cursor.execute(f'''
+                        UPDATE players
+                        SET {merged_text},
+                            {merged_ranks},
+                            scouted = CASE WHEN scouted OR EXISTS (
+                                    SELECT 1 FROM player_merge_map m JOIN players d ON d.id = m.duplicate_id
+                                    WHERE m.canonical_id = players.id AND d.scouted
+                            ) THEN 1 ELSE 0 END
+                        WHERE id IN (SELECT canonical_id FROM player_merge_map)
+                ''')
+                #A canonical player can inherit a duplicate's grade, so its sort key is rewritten with it
+                cursor.execute('SELECT id, grade FROM players WHERE id IN (SELECT canonical_id FROM player_merge_map)')
+                cursor.executemany(
+                        'UPDATE players SET grade_sort_key = ? WHERE id = ?',
+                        [(_grade_sort_key(grade), player_id) for player_id, grade in cursor.fetchall()]
+                )
+
+                #Board ranks: the group's best rank per board survives and is moved onto the canonical player
+                cursor.execute('''
+                        DELETE FROM player_board_ranks
+                        WHERE id IN (
+                                SELECT id FROM (
+                                        SELECT pbr.id, ROW_NUMBER() OVER (
+                                                PARTITION BY pbr.board_id, COALESCE(m.canonical_id, pbr.player_id)
+                                                ORDER BY pbr.board_rank, m.duplicate_id IS NOT NULL, pbr.player_id
+                                        ) AS keep_order
+                                        FROM player_board_ranks pbr
+                                        LEFT JOIN player_merge_map m ON m.duplicate_id = pbr.player_id
+                                        WHERE pbr.player_id IN (SELECT duplicate_id FROM player_merge_map UNION SELECT canonical_id FROM player_merge_map)
+                                )
+                                WHERE keep_order > 1
+                        )
+                ''')
+                cursor.execute('''
+                        UPDATE player_board_ranks
+                        SET player_id = (SELECT m.canonical_id FROM player_merge_map m WHERE m.duplicate_id = player_board_ranks.player_id)
+                        WHERE player_id IN (SELECT duplicate_id FROM player_merge_map)
+                ''')
+
+                #Big board entries: the canonical player's own entry wins, otherwise the highest-placed duplicate's
+                cursor.execute('''
+                        DELETE FROM big_board_entries
+                        WHERE id IN (
+                                SELECT id FROM (
+                                        SELECT e.id, ROW_NUMBER() OVER (
+                                                PARTITION BY e.board_id, COALESCE(m.canonical_id, e.player_id)
+                                                ORDER BY m.duplicate_id IS NOT NULL, e.rank_order, e.id
+                                        ) AS keep_order
+                                        FROM big_board_entries e
+                                        LEFT JOIN player_merge_map m ON m.duplicate_id = e.player_id
+                                        WHERE e.player_id IN (SELECT duplicate_id FROM player_merge_map UNION SELECT canonical_id FROM player_merge_map)
+                                )
+                                WHERE keep_order > 1
+                        )
+                ''')
+                cursor.execute('''
+                        UPDATE big_board_entries
+                        SET player_id = (SELECT m.canonical_id FROM player_merge_map m WHERE m.duplicate_id = big_board_entries.player_id)
+                        WHERE player_id IN (SELECT duplicate_id FROM player_merge_map)
+                ''')
+
+                cursor.execute('''
+                        UPDATE OR REPLACE player_aliases
+                        SET player_id = (SELECT m.canonical_id FROM player_merge_map m WHERE m.duplicate_id = player_aliases.player_id)
+                        WHERE player_id IN (SELECT duplicate_id FROM player_merge_map)
+                ''')
+                cursor.execute('''
+                        UPDATE OR REPLACE player_alias_suggestions
+                        SET player_id = (SELECT m.canonical_id FROM player_merge_map m WHERE m.duplicate_id = player_alias_suggestions.player_id)
+                        WHERE player_id IN (SELECT duplicate_id FROM player_merge_map)
+                ''')
+                cursor.execute('DELETE FROM players WHERE id IN (SELECT duplicate_id FROM player_merge_map)')
+
         def export_big_board_text(self, scope='overall', position=None):
                 """Export rankings in '#. player name' format."""
                 conn = self.get_connection()
@@ -6,6 +6,7 @@ It uses the ESPN API to fetch team logos.
 """
 
 import requests
+from http_cache import cached_get
 import json
 import urllib3
 import re
@@ -22,12 +23,13 @@ def school_to_logo_filename(school_name):
     slug = re.sub(r'[^a-z0-9-]', '', slug)
     return slug
 
-def get_school_logos(schools):
+def get_school_logos(schools, should_stop=None):
     """
     Download logos for the given schools from ESPN
     
     Args:
         schools: List of school names
+        should_stop: Optional callable; downloading stops early once it returns True
     """
     logos_dir = Path('static/logos')
     logos_dir.mkdir(parents=True, exist_ok=True)
@@ -37,8 +39,7 @@ def get_school_logos(schools):
     
     print("Fetching team data from ESPN...")
     try:
-        response = requests.get(espn_cfb_teams_url, timeout=10, verify=False)
-        response.raise_for_status()
+        response = cached_get(requests, espn_cfb_teams_url, timeout=10, verify=False)
         teams_data = response.json()
     except Exception as e:
         print(f"Error fetching teams data: {e}")
@@ -92,6 +93,10 @@ def get_school_logos(schools):
     failed = []
     
     for school in schools:
+        if should_stop and should_stop():
+            print("Logo refresh stopped early")
+            break
+
         if not school:
             continue
             
@@ -0,0 +1,172 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+HTTP_CACHE_DIR_ENV = 'SCOUT_HTTP_CACHE_DIR'
+HTTP_CACHE_OFFLINE_ENV = 'SCOUT_HTTP_OFFLINE'
+
+
+class OfflineCacheMiss(requests.RequestException):
+    """Raised in offline mode when a URL has never been cached."""
+
+
+class CachedResponse:
+    """Response body served either fresh from the network or from the on-disk cache."""
+
+    def __init__(self, url, status_code, content, headers=None, encoding=None, from_cache=False, revalidated=False):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.encoding = encoding
+        # from_cache: the body was not downloaded; revalidated: the server confirmed it with a 304
+        self.from_cache = from_cache
+        self.revalidated = revalidated
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class HttpCache:
+    """Stores GET response bodies on disk with their ETag/Last-Modified validators.
+
+    Each URL maps to <sha1>.body plus <sha1>.json metadata, written atomically so
+    concurrent crawler threads never observe a half-written entry. In offline mode
+    nothing is requested: cached bodies are replayed and uncached URLs raise
+    OfflineCacheMiss.
+    """
+
+    def __init__(self, cache_dir=None, offline=None):
+        if cache_dir is None:
+            cache_dir = os.environ.get(HTTP_CACHE_DIR_ENV) or Path.cwd() / '.http_cache'
+        if offline is None:
+            offline = os.environ.get(HTTP_CACHE_OFFLINE_ENV, '').lower() in {'1', 'true', 'yes'}
+        self.cache_dir = Path(cache_dir)
+        self.offline = bool(offline)
+        self._lock = threading.Lock()
+        self.stats = {'fetched': 0, 'revalidated': 0, 'replayed': 0}
+
+    def _paths(self, url):
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return self.cache_dir / f'{key}.json', self.cache_dir / f'{key}.body'
+
+    def load(self, url):
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        return meta, body
+
+    def store(self, url, response):
+        meta = {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'content_type': response.headers.get('Content-Type'),
+            'encoding': response.encoding,
+            'fetched_at': time.time()
+        }
+        meta_path, body_path = self._paths(url)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._write_atomic(body_path, response.content)
+            self._write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+        except OSError as e:
+            print(f"Could not write HTTP cache entry for {url}: {e}")
+
+    def _write_atomic(self, path, data):
+        fd, temp_path = tempfile.mkstemp(dir=str(self.cache_dir), prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except OSError:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def get(self, session, url, headers=None, **kwargs):
+        """GET url through the cache. Raises requests exceptions like session.get would."""
+        cached = self.load(url)
+        if self.offline:
+            if cached is None:
+                raise OfflineCacheMiss(f'{url} is not in the offline HTTP cache.')
+            self._count('replayed')
+            meta, body = cached
+            return CachedResponse(url, 200, body, {'Content-Type': meta.get('content_type') or ''},
+                                  meta.get('encoding'), from_cache=True)
+
+        request_headers = dict(headers or {})
+        if cached is not None:
+            meta = cached[0]
+            if meta.get('etag'):
+                request_headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                request_headers['If-Modified-Since'] = meta['last_modified']
+
+        response = session.get(url, headers=request_headers, **kwargs)
+        if response.status_code == 304 and cached is not None:
+            self._count('revalidated')
+            meta, body = cached
+            return CachedResponse(url, 200, body, response.headers, meta.get('encoding'),
+                                  from_cache=True, revalidated=True)
+
+        response.raise_for_status()
+        self._count('fetched')
+        encoding = response.encoding
+        if encoding is None or (encoding.lower() == 'iso-8859-1' and not _declares_charset(response)):
+            # requests falls back to latin-1 for text/* without a charset; keep its sniffed guess instead
+            encoding = response.apparent_encoding
+        response.encoding = encoding
+        self.store(url, response)
+        return CachedResponse(url, response.status_code, response.content, response.headers, encoding)
+
+
+def _declares_charset(response):
+    return bool(re.search(r'charset=', response.headers.get('Content-Type') or '', flags=re.I))
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache():
+    """Process-wide cache configured from SCOUT_HTTP_CACHE_DIR / SCOUT_HTTP_OFFLINE."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = HttpCache()
+        return _default_cache
+
+
+def set_default_cache(cache):
+    global _default_cache
+    with _default_cache_lock:
+        _default_cache = cache
+
+
+def cached_get(session, url, headers=None, cache=None, **kwargs):
+    """GET through the given cache (default: the process-wide one); session may be any object with .get()."""
+    return (cache or get_default_cache()).get(session, url, headers=headers, **kwargs)
@@ -0,0 +1,201 @@
+import functools
+import re
+from collections import defaultdict, namedtuple
+
+# Common first-name short forms, compared in their long form
+NICKNAMES = {
+    'alex': 'alexander', 'andy': 'andrew', 'ben': 'benjamin', 'bill': 'william', 'bob': 'robert',
+    'cam': 'cameron', 'chris': 'christopher', 'dan': 'daniel', 'danny': 'daniel', 'dave': 'david',
+    'drew': 'andrew', 'ed': 'edward', 'eli': 'elijah', 'gabe': 'gabriel', 'greg': 'gregory',
+    'jake': 'jacob', 'jim': 'james', 'jimmy': 'james', 'joe': 'joseph', 'jon': 'jonathan',
+    'josh': 'joshua', 'ken': 'kenneth', 'matt': 'matthew', 'mike': 'michael', 'nate': 'nathan',
+    'nick': 'nicholas', 'pat': 'patrick', 'rob': 'robert', 'sam': 'samuel', 'steve': 'steven',
+    'tom': 'thomas', 'tony': 'anthony', 'will': 'william', 'zach': 'zachary', 'zack': 'zachary'
+}
+
+_SOUNDEX_CODES = {
+    **dict.fromkeys('bfpv', '1'), **dict.fromkeys('cgjkqsxz', '2'), **dict.fromkeys('dt', '3'),
+    'l': '4', **dict.fromkeys('mn', '5'), 'r': '6'
+}
+
+
+@functools.lru_cache(maxsize=8192)
+def soundex(word):
+    """American Soundex code of a word ('' for words without letters)."""
+    letters = re.sub(r'[^a-z]', '', (word or '').lower())
+    if not letters:
+        return ''
+    code = letters[0].upper()
+    previous = _SOUNDEX_CODES.get(letters[0], '')
+    for letter in letters[1:]:
+        digit = _SOUNDEX_CODES.get(letter, '')
+        if digit and digit != previous:
+            code += digit
+            if len(code) == 4:
+                break
+        if letter not in 'hw':
+            previous = digit
+    return code.ljust(4, '0')
+
+
+def jaro_winkler(a, b, prefix_scale=0.1):
+    """Jaro-Winkler similarity in [0, 1]."""
+    if a == b:
+        return 1.0
+    len_a, len_b = len(a), len(b)
+    if not len_a or not len_b:
+        return 0.0
+
+    window = max(0, max(len_a, len_b) // 2 - 1)
+    matched_b = [False] * len_b
+    a_matches = []
+    for i, char in enumerate(a):
+        for j in range(max(0, i - window), min(len_b, i + window + 1)):
+            if not matched_b[j] and b[j] == char:
+                matched_b[j] = True
+                a_matches.append(char)
+                break
+    if not a_matches:
+        return 0.0
+
+    b_matches = [b[j] for j in range(len_b) if matched_b[j]]
+    transpositions = sum(1 for x, y in zip(a_matches, b_matches) if x != y) / 2
+    matches = len(a_matches)
+    jaro = (matches / len_a + matches / len_b + (matches - transpositions) / matches) / 3
+
+    prefix = 0
+    for x, y in zip(a[:4], b[:4]):
+        if x != y:
+            break
+        prefix += 1
+    return jaro + prefix * prefix_scale * (1 - jaro)
+
+
+def trigrams(text):
+    padded = f'  {text} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def trigram_similarity(a, b):
+    """Jaccard similarity of padded character trigrams in [0, 1]."""
+    grams_a, grams_b = trigrams(a), trigrams(b)
+    if not grams_a or not grams_b:
+        return 0.0
+    return len(grams_a & grams_b) / len(grams_a | grams_b)
+
+
+def _canonical_tokens(normalized_name):
+    tokens = normalized_name.split()
+    if tokens:
+        tokens[0] = NICKNAMES.get(tokens[0], tokens[0])
+    return tokens
+
+
+# corroborated: the school or position backs the match up, so it may be applied without confirmation
+NameMatch = namedtuple('NameMatch', 'player_id score corroborated')
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_school(school):
+    return re.sub(r'[^a-z0-9]+', ' ', school.lower()).strip()
+
+
+@functools.lru_cache(maxsize=256)
+def _position_tokens(position):
+    return frozenset(token for token in re.split(r'[^A-Z0-9]+', position.upper()) if token)
+
+
+class IdentityResolver:
+    """In-memory approximate matcher from incoming player names to existing player ids.
+
+    Names are expected already normalized (ScoutDatabase._normalize_player_name). Candidates
+    come from blocking keys (surname Soundex, school + surname initial, position + first-name
+    Soundex) and are scored with Jaro-Winkler blended with trigram similarity, after mapping
+    common nicknames to their long forms. A known school that differs vetoes a match, and a
+    near-tie between two candidates is treated as no match.
+
+    A match is corroborated only when the school agrees (score >= school_threshold), or the
+    position agrees and the surname is spelled identically (score >= position_threshold).
+    Near-miss surnames such as Green/Greene are usually different people, so with only a
+    position, or with nothing to compare, a hit comes back uncorroborated: a suggestion for
+    a user to confirm, never something to apply automatically.
+    """
+
+    def __init__(self, players, school_threshold=0.89, position_threshold=0.92, ambiguity_margin=0.02):
+        self.school_threshold = school_threshold
+        self.position_threshold = position_threshold
+        self.ambiguity_margin = ambiguity_margin
+        self._blocks = defaultdict(list)
+        for player_id, normalized_name, position, school in players:
+            self.add(player_id, normalized_name, position, school)
+
+    def add(self, player_id, normalized_name, position=None, school=None):
+        tokens = _canonical_tokens(normalized_name or '')
+        if not tokens:
+            return
+        # Trigrams are filled in the first time the candidate is scored
+        candidate = {
+            'id': player_id,
+            'name': ' '.join(tokens),
+            'surname': tokens[-1],
+            'trigrams': None,
+            'school': _normalize_school(school or ''),
+            'positions': _position_tokens(position or '')
+        }
+        for key in self._block_keys(tokens, candidate['school'], candidate['positions']):
+            self._blocks[key].append(candidate)
+
+    @staticmethod
+    def _block_keys(tokens, school, positions):
+        keys = [('surname', soundex(tokens[-1]))]
+        if school:
+            keys.append(('school', school, tokens[-1][:1]))
+        first_code = soundex(tokens[0])
+        keys.extend(('position', position, first_code) for position in positions)
+        return keys
+
+    def match(self, normalized_name, position=None, school=None):
+        """Return a NameMatch for the best candidate scoring at least school_threshold, or None."""
+        tokens = _canonical_tokens(normalized_name or '')
+        if not tokens:
+            return None
+        name = ' '.join(tokens)
+        name_trigrams = trigrams(name)
+        school = _normalize_school(school or '')
+        positions = _position_tokens(position or '')
+
+        seen = set()
+        scored = []
+        for key in self._block_keys(tokens, school, positions):
+            for candidate in self._blocks.get(key, ()):
+                if candidate['id'] in seen:
+                    continue
+                seen.add(candidate['id'])
+                if school and candidate['school'] and school != candidate['school']:
+                    continue
+                if abs(len(candidate['name']) - len(name)) > 4:
+                    continue
+
+                if candidate['trigrams'] is None:
+                    candidate['trigrams'] = trigrams(candidate['name'])
+                overlap = len(name_trigrams & candidate['trigrams']) / len(name_trigrams | candidate['trigrams'])
+                score = 0.85 * jaro_winkler(name, candidate['name']) + 0.15 * overlap
+                if score < self.school_threshold:
+                    continue
+                if school and school == candidate['school']:
+                    corroborated = True
+                else:
+                    corroborated = (
+                        score >= self.position_threshold
+                        and bool(positions & candidate['positions'])
+                        and tokens[-1] == candidate['surname']
+                    )
+                scored.append((score, corroborated, candidate['id']))
+
+        if not scored:
+            return None
+        scored.sort(key=lambda hit: hit[0], reverse=True)
+        if len(scored) > 1 and scored[0][0] - scored[1][0] < self.ambiguity_margin:
+            return None
+        score, corroborated, player_id = scored[0]
+        return NameMatch(player_id, round(score, 4), corroborated)
@@ -0,0 +1,257 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+class JobCancelled(Exception):
+    """Raised inside a job function when cancellation was requested."""
+
+
+class JobContext:
+    """Handle passed to a job function for reporting stages and honoring cancellation.
+
+    stage() only records progress and never raises, so it is safe to hand to code that
+    holds an open transaction; raise_if_cancelled() is called by the job between stages.
+    """
+
+    def __init__(self, runner, job_id):
+        self._runner = runner
+        self.job_id = job_id
+
+    def stage(self, name, message=None):
+        self._runner._enter_stage(self.job_id, name, message)
+
+    def progress(self, message):
+        self._runner._update(self.job_id, message=message)
+
+    @property
+    def cancel_requested(self):
+        return self._runner._is_cancel_requested(self.job_id)
+
+    def raise_if_cancelled(self):
+        if self.cancel_requested:
+            raise JobCancelled()
+
+
+class SingleFlight:
+    """Collapses concurrent calls with the same key into one execution.
+
+    The first caller runs func; callers arriving while it is in flight wait for it and
+    share its result (or its exception). Later calls start a fresh execution.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, func, *args, **kwargs):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = {'done': threading.Event(), 'result': None, 'error': None}
+                self._calls[key] = call
+
+        if not leader:
+            call['done'].wait()
+            if call['error'] is not None:
+                raise call['error']
+            return call['result']
+
+        try:
+            call['result'] = func(*args, **kwargs)
+        except Exception as e:
+            call['error'] = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call['done'].set()
+        return call['result']
+
+
+class JobRunner:
+    """Runs long operations (scraping, imports, recalculation) off the request thread.
+
+    Jobs get an id and move through named stages; callers poll status(job_id) and may
+    request cancellation, which the job honors at its next stage boundary. Finished jobs
+    are kept (up to max_finished) so late polls still see the result.
+    """
+
+    TERMINAL_STATES = ('succeeded', 'failed', 'cancelled')
+
+    def __init__(self, max_workers=2, max_finished=50):
+        self.max_finished = max(1, int(max_finished))
+        self._executor = ThreadPoolExecutor(max_workers=max(1, int(max_workers)), thread_name_prefix='job-runner')
+        self._lock = threading.Lock()
+        self._jobs = OrderedDict()
+
+    def submit(self, kind, stages, func, *args, key=None, **kwargs):
+        """Queue func(context, *args, **kwargs) and return the new job's status dict.
+
+        func returns a result dict on success; a dict with success=False marks the job failed.
+        With a key, a request made while another job with that key is still queued or
+        running attaches to it (single-flight) and gets that job's status instead.
+        """
+        job_id = uuid.uuid4().hex
+        job = {
+            'id': job_id,
+            'kind': kind,
+            'key': key,
+            'status': 'queued',
+            'stage': None,
+            'message': None,
+            'stages': [{'name': name, 'status': 'pending', 'duration_ms': None} for name in stages],
+            'result': None,
+            'error': None,
+            'cancel_requested': False,
+            'created_at': time.time(),
+            'started_at': None,
+            'finished_at': None,
+            '_stage_started': None
+        }
+        with self._lock:
+            in_flight = self._find_in_flight(key)
+            if in_flight is not None:
+                snapshot = self._snapshot(in_flight)
+                snapshot['attached'] = True
+                return snapshot
+            self._jobs[job_id] = job
+            self._prune_finished()
+            snapshot = self._snapshot(job)
+
+        self._executor.submit(self._run, job_id, func, args, kwargs)
+        return snapshot
+
+    def status(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return self._snapshot(job) if job else None
+
+    def list_jobs(self):
+        with self._lock:
+            return [self._snapshot(job) for job in reversed(self._jobs.values())]
+
+    def cancel(self, job_id):
+        """Request cancellation. Returns the job status, or None for an unknown id."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            if job['status'] not in self.TERMINAL_STATES:
+                job['cancel_requested'] = True
+            return self._snapshot(job)
+
+    def wait(self, job_id, timeout=None):
+        """Block until the job finishes. Returns its final status, or None on timeout."""
+        deadline = None if timeout is None else time.monotonic() + max(0.0, float(timeout))
+        while True:
+            snapshot = self.status(job_id)
+            if snapshot is None or snapshot['status'] in self.TERMINAL_STATES:
+                return snapshot
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(0.02)
+
+    def shutdown(self, wait=False):
+        with self._lock:
+            for job in self._jobs.values():
+                if job['status'] not in self.TERMINAL_STATES:
+                    job['cancel_requested'] = True
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, job_id, func, args, kwargs):
+        with self._lock:
+            job = self._jobs[job_id]
+            if job['cancel_requested']:
+                self._finish(job, 'cancelled')
+                return
+            job['status'] = 'running'
+            job['started_at'] = time.time()
+
+        context = JobContext(self, job_id)
+        try:
+            result = func(context, *args, **kwargs)
+        except JobCancelled:
+            with self._lock:
+                self._finish(job, 'cancelled')
+            return
+        except Exception as e:
+            print(f"Job {job['kind']} failed: {e}")
+            with self._lock:
+                job['error'] = str(e)
+                self._finish(job, 'failed')
+            return
+
+        with self._lock:
+            job['result'] = result
+            if isinstance(result, dict) and result.get('success') is False:
+                job['error'] = result.get('error') or 'Job failed.'
+                self._finish(job, 'failed')
+            else:
+                self._finish(job, 'succeeded')
+
+    def _enter_stage(self, job_id, name, message=None):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            now = time.perf_counter()
+            self._close_stage(job, now, 'done')
+            stage = next((row for row in job['stages'] if row['name'] == name), None)
+            if stage is None:
+                stage = {'name': name, 'status': 'pending', 'duration_ms': None}
+                job['stages'].append(stage)
+            stage['status'] = 'running'
+            job['stage'] = name
+            job['message'] = message
+            job['_stage_started'] = now
+
+    def _update(self, job_id, message=None):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job['message'] = message
+
+    def _is_cancel_requested(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return bool(job and job['cancel_requested'])
+
+    def _close_stage(self, job, now, status):
+        for stage in job['stages']:
+            if stage['status'] == 'running':
+                stage['status'] = status
+                if job['_stage_started'] is not None:
+                    stage['duration_ms'] = round((now - job['_stage_started']) * 1000, 2)
+        job['_stage_started'] = None
+
+    def _finish(self, job, status):
+        self._close_stage(job, time.perf_counter(), 'done' if status == 'succeeded' else status)
+        for stage in job['stages']:
+            if stage['status'] == 'pending':
+                stage['status'] = 'skipped'
+        job['status'] = status
+        job['stage'] = None
+        job['finished_at'] = time.time()
+
+    def _find_in_flight(self, key):
+        if key is None:
+            return None
+        for job in self._jobs.values():
+            if job['key'] == key and job['status'] not in self.TERMINAL_STATES and not job['cancel_requested']:
+                return job
+        return None
+
+    def _prune_finished(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job['status'] in self.TERMINAL_STATES]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
+
+    @staticmethod
+    def _snapshot(job):
+        snapshot = {key: value for key, value in job.items() if not key.startswith('_')}
+        snapshot['stages'] = [dict(stage) for stage in job['stages']]
+        return snapshot
@@ -0,0 +1,140 @@
+import threading
+import time
+
+
+class RankRecalcScheduler:
+    """Debounces and coalesces rank recalculation requests.
+
+    Every request() bumps the requested "ranking generation" and returns it. In deferred
+    mode a background thread waits until requests stop arriving for debounce_seconds
+    (or max_delay_seconds passed since the oldest pending request) and then runs a single
+    recalculation covering every generation requested so far. In synchronous mode the
+    recalculation runs inline before request() returns.
+
+    run_lock serializes recalculation runs; pass a shared re-entrant lock to also serialize
+    them with other writers.
+    """
+
+    def __init__(self, recalculate, deferred=True, debounce_seconds=0.25, max_delay_seconds=2.0, run_lock=None):
+        self._recalculate = recalculate
+        self.deferred = deferred
+        self.debounce_seconds = max(0.0, float(debounce_seconds))
+        self.max_delay_seconds = max(self.debounce_seconds, float(max_delay_seconds))
+
+        self._condition = threading.Condition()
+        self._run_lock = run_lock if run_lock is not None else threading.Lock()
+        self._requested_generation = 0
+        self._completed_generation = 0
+        self._first_pending_at = None
+        self._last_request_at = None
+        self._last_error = None
+        self._last_run_ms = None
+        self._runs = 0
+        self._worker = None
+        self._stopped = False
+
+    def request(self):
+        """Request a recalculation and return the generation that will include it."""
+        with self._condition:
+            self._requested_generation += 1
+            generation = self._requested_generation
+            now = time.monotonic()
+            if self._first_pending_at is None:
+                self._first_pending_at = now
+            self._last_request_at = now
+
+            if self.deferred:
+                self._ensure_worker()
+                self._condition.notify_all()
+                return generation
+
+        self._run_pending()
+        return generation
+
+    def wait(self, generation, timeout=None):
+        """Block until the given generation has been recalculated. Returns True when it has."""
+        deadline = None if timeout is None else time.monotonic() + max(0.0, float(timeout))
+        with self._condition:
+            while self._completed_generation < generation:
+                if generation > self._requested_generation:
+                    return False
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            return True
+
+    def flush(self, timeout=None):
+        """Wait for every generation requested so far."""
+        with self._condition:
+            generation = self._requested_generation
+        return self.wait(generation, timeout=timeout)
+
+    def status(self):
+        with self._condition:
+            return {
+                'requested_generation': self._requested_generation,
+                'completed_generation': self._completed_generation,
+                'pending': self._completed_generation < self._requested_generation,
+                'runs': self._runs,
+                'last_run_ms': self._last_run_ms,
+                'last_error': self._last_error
+            }
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+
+    def _ensure_worker(self):
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._worker = threading.Thread(target=self._worker_loop, name='rank-recalc-scheduler', daemon=True)
+        self._worker.start()
+
+    def _worker_loop(self):
+        while True:
+            with self._condition:
+                while not self._stopped and self._completed_generation >= self._requested_generation:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+
+                # Debounce: wait for a quiet period, but never past max_delay_seconds.
+                while not self._stopped:
+                    now = time.monotonic()
+                    quiet_until = self._last_request_at + self.debounce_seconds
+                    latest_start = self._first_pending_at + self.max_delay_seconds
+                    start_at = min(quiet_until, latest_start)
+                    if now >= start_at:
+                        break
+                    self._condition.wait(start_at - now)
+                if self._stopped:
+                    return
+
+            self._run_pending()
+
+    def _run_pending(self):
+        with self._run_lock:
+            with self._condition:
+                target_generation = self._requested_generation
+                if self._completed_generation >= target_generation:
+                    return
+                self._first_pending_at = None
+
+            started = time.perf_counter()
+            error = None
+            try:
+                self._recalculate()
+            except Exception as e:
+                error = str(e)
+                print(f"Rank recalculation failed: {e}")
+
+            with self._condition:
+                self._runs += 1
+                self._last_run_ms = round((time.perf_counter() - started) * 1000, 2)
+                self._last_error = error
+                self._completed_generation = max(self._completed_generation, target_generation)
+                if self._completed_generation < self._requested_generation and self._first_pending_at is None:
+                    self._first_pending_at = time.monotonic()
+                self._condition.notify_all()
@@ -7,10 +7,42 @@
         }
     }
 
+    const ETAG_CACHE_LIMIT = 100;
+    const etagCache = new Map();
+
+    function rememberEtagResponse(url, response, data) {
+        const etag = response.headers.get('ETag');
+        if (!response.ok || !etag || data === null) {
+            etagCache.delete(url);
+            return;
+        }
+
+        etagCache.delete(url);
+        etagCache.set(url, { etag, data, headers: new Headers(response.headers) });
+        while (etagCache.size > ETAG_CACHE_LIMIT) {
+            etagCache.delete(etagCache.keys().next().value);
+        }
+    }
+
     async function getJson(url) {
-        const response = await fetch(url);
+        const cached = etagCache.get(url);
+        const headers = cached ? { 'If-None-Match': cached.etag } : {};
+        const response = await fetch(url, { headers, cache: 'no-store' });
+
+        if (response.status === 304 && cached) {
+            // Unchanged since the last fetch: hand back the cached payload and its headers
+            etagCache.delete(url);
+            etagCache.set(url, cached);
+            return {
+                response: new Response(null, { status: 200, headers: cached.headers }),
+                data: cached.data,
+                notModified: true
+            };
+        }
+
         const data = await parseJsonSafe(response);
-        return { response, data };
+        rememberEtagResponse(url, response, data);
+        return { response, data, notModified: false };
     }
 
     async function postJson(url, payload) {
@@ -29,9 +61,70 @@
         return { response, data };
     }
 
+    async function waitForRankingGeneration(generation, timeoutSeconds = 10) {
+        if (!generation) {
+            return true;
+        }
+
+        const params = new URLSearchParams({ generation: String(generation), timeout: String(timeoutSeconds) });
+        const { response, data } = await getJson(`/api/rankings/wait?${params.toString()}`);
+        return Boolean(response.ok && data && data.completed);
+    }
+
+    const JOB_TERMINAL_STATES = new Set(['succeeded', 'failed', 'cancelled']);
+
+    function sleep(ms) {
+        return new Promise(resolve => setTimeout(resolve, ms));
+    }
+
+    // Poll a background job until it finishes; onProgress receives every status snapshot
+    async function waitForJob(jobId, { onProgress = null, intervalMs = 750 } = {}) {
+        while (true) {
+            const { response, data } = await getJson(`/api/jobs/${encodeURIComponent(jobId)}`);
+            if (!response.ok || !data) {
+                throw new Error((data && data.error) || `Could not read job status (${response.status}).`);
+            }
+            if (onProgress) {
+                onProgress(data);
+            }
+            if (JOB_TERMINAL_STATES.has(data.status)) {
+                return data;
+            }
+            await sleep(intervalMs);
+        }
+    }
+
+    async function cancelJob(jobId) {
+        return postNoBody(`/api/jobs/${encodeURIComponent(jobId)}/cancel`);
+    }
+
+    function describeJobProgress(job) {
+        if (!job || !job.stage) {
+            return job && job.status === 'queued' ? 'Queued...' : 'Running...';
+        }
+        const stageIndex = (job.stages || []).findIndex(stage => stage.name === job.stage);
+        const step = stageIndex >= 0 ? ` (${stageIndex + 1}/${job.stages.length})` : '';
+        return `${job.stage.charAt(0).toUpperCase()}${job.stage.slice(1)}${step}${job.message ? `: ${job.message}` : '...'}`;
+    }
+
+    async function getPlayersBatch(playerIds) {
+        const ids = Array.from(new Set((playerIds || []).map(Number).filter(Number.isInteger)));
+        if (!ids.length) {
+            return [];
+        }
+
+        const { response, data } = await getJson(`/api/players/batch?ids=${ids.join(',')}`);
+        return response.ok && Array.isArray(data) ? data : [];
+    }
+
     window.ApiClient = {
         getJson,
         postJson,
-        postNoBody
+        postNoBody,
+        waitForRankingGeneration,
+        waitForJob,
+        cancelJob,
+        describeJobProgress,
+        getPlayersBatch
     };
 })();
@@ -4,6 +4,8 @@ let selectedPositions = [];
 let selectedRank = null;
 let selectedSearchPositions = [];
 let allPlayers = [];
+let searchNextCursor = null;
+let searchLastParams = null;
 let boardRanksRevealed = false;
 let bigBoardType = 'overall';
 let currentBigBoardPosition = null;
@@ -14,8 +16,12 @@ let playerReportController = null;
 let draggedWatchListPlayerId = null;
 let watchListDropPlaceholder = null;
 let watchListLastDropIndex = null;
+let watchListRendered = false;
 const SETTINGS_STORAGE_KEY = 'scout_app_settings';
 const ACTIVE_TAB_STORAGE_KEY = 'scout_active_tab';
+const SEARCH_PAGE_SIZE = 50;
+const RANDOMIZER_STRIP_SAMPLE_SIZE = 50;
+const SEARCH_RESULT_FIELDS = 'id,name,position,school,rank,weighted_avg_rank,tankathon_rank,notes_snippet';
 const DEFAULT_APP_SETTINGS = {
     theme: 'default',
     teamCity: 'Arizona',
@@ -108,6 +114,25 @@ async function requestPostNoBody(url) {
     return { response, data };
 }
 
+async function waitForRankingGeneration(result) {
+    const generation = result?.ranking_generation;
+    if (!generation) {
+        return true;
+    }
+
+    try {
+        if (window.ApiClient?.waitForRankingGeneration) {
+            return await window.ApiClient.waitForRankingGeneration(generation);
+        }
+
+        const { data } = await requestGetJson(`/api/rankings/wait?generation=${encodeURIComponent(generation)}`);
+        return Boolean(data?.completed);
+    } catch (error) {
+        console.error('Error waiting for ranking recalculation:', error);
+        return false;
+    }
+}
+
 function openBigBoardPlayerModal(player) {
     const overlay = document.getElementById('player-report-overlay');
     const detailsSection = document.getElementById('player-details');
@@ -154,6 +179,7 @@ function initializePlayerReportController() {
         requestGetJson,
         requestPostJson,
         requestPostNoBody,
+        waitForRankingGeneration,
         showToast,
         loadStats,
         loadPositions,
@@ -169,18 +195,49 @@ document.addEventListener('DOMContentLoaded', function() {
     populateGradeDropdowns();
     syncSettingsControls();
     setupTabs();
-    loadStats();
-    loadPositions();
-    loadSchools();
-    loadRankBoardSettings();
     initializeBigBoardController();
     initializePlayerReportController();
     setupEventListeners();
 
     const savedTabId = getSavedActiveTabId();
-    switchTab(savedTabId);
+    switchTab(savedTabId, { preloaded: true });
+    bootstrapAppState(savedTabId);
 });
 
+// Load the start-up state (stats, lookups, rank boards, watch list, board) in one request
+async function bootstrapAppState(activeTabId) {
+    const includeBigBoard = activeTabId === 'bigboard-tab' && bigBoardType === 'overall';
+
+    try {
+        const { response, data } = await requestGetJson(`/api/bootstrap?big_board=${includeBigBoard}`);
+        if (!response.ok || !data) {
+            throw new Error(`Bootstrap request failed with status ${response.status}`);
+        }
+
+        applyStats(data.stats || {});
+        applyPositions(data.positions || []);
+        applySchools(data.schools || []);
+        renderRankBoardSettings(data.rank_boards || []);
+        renderWatchList(data.watch_list || []);
+        watchListRendered = true;
+        if (includeBigBoard && bigBoardController) {
+            bigBoardController.showPreloadedBigBoard(data.big_board || []);
+        }
+    } catch (error) {
+        console.error('Error loading start-up state, falling back to individual requests:', error);
+        loadStats();
+        loadPositions();
+        loadSchools();
+        loadRankBoardSettings();
+        if (activeTabId === 'bigboard-tab') {
+            loadBigBoard();
+        }
+        if (activeTabId === 'watchlist-tab') {
+            loadWatchList();
+        }
+    }
+}
+
 function setupTabs() {
     const tabButtons = document.querySelectorAll('.tab-btn');
 
@@ -192,7 +249,7 @@ function setupTabs() {
     });
 }
 
-function switchTab(tabId) {
+function switchTab(tabId, options = {}) {
     const nextTabId = document.getElementById(tabId) ? tabId : 'search-tab';
 
     document.querySelectorAll('.tab-btn').forEach(button => {
@@ -205,12 +262,15 @@ function switchTab(tabId) {
         panel.classList.toggle('hidden', !isActive);
     });
 
+    // On start-up the board and watch list arrive with the bootstrap payload
     if (nextTabId === 'bigboard-tab') {
-        loadBigBoard();
+        if (!options.preloaded) {
+            loadBigBoard();
+        }
         searchBigBoardPlayers();
     }
 
-    if (nextTabId === 'watchlist-tab') {
+    if (nextTabId === 'watchlist-tab' && !options.preloaded) {
         loadWatchList();
     }
 
@@ -277,119 +337,125 @@ function positionPlayerDetailsForCurrentSource() {
 async function loadStats() {
     try {
         const { data } = await requestGetJson('/api/stats');
-        const stats = data;
-     
-        document.getElementById('total-players').textContent = stats.total_players;
-        document.getElementById('scouted-players').textContent = stats.scouted;
-        document.getElementById('remaining-players').textContent = stats.remaining;
+        applyStats(data);
     } catch (error) {
         console.error('Error loading stats:', error);
     }
 }
 
+function applyStats(stats) {
+    document.getElementById('total-players').textContent = stats.total_players;
+    document.getElementById('scouted-players').textContent = stats.scouted;
+    document.getElementById('remaining-players').textContent = stats.remaining;
+}
+
 // Load available positions
 async function loadPositions() {
     try {
         const { data } = await requestGetJson('/api/positions');
-        const positions = data;
-
-        const randomizerContainer = document.getElementById('position-filters');
-        const searchContainer = document.getElementById('search-position-filters');
-        const boardPositionSelect = document.getElementById('bigboard-position-select');
-        const exportPositionSelect = document.getElementById('export-position-select');
-        const editPositionSelect = document.getElementById('edit-position-input');
-        randomizerContainer.innerHTML = '';
-        searchContainer.innerHTML = '';
-        boardPositionSelect.innerHTML = '';
+        applyPositions(data);
+    } catch (error) {
+        console.error('Error loading positions:', error);
+    }
+}
+
+function applyPositions(positions) {
+    const randomizerContainer = document.getElementById('position-filters');
+    const searchContainer = document.getElementById('search-position-filters');
+    const boardPositionSelect = document.getElementById('bigboard-position-select');
+    const exportPositionSelect = document.getElementById('export-position-select');
+    const editPositionSelect = document.getElementById('edit-position-input');
+    randomizerContainer.innerHTML = '';
+    searchContainer.innerHTML = '';
+    boardPositionSelect.innerHTML = '';
+    if (exportPositionSelect) {
+        exportPositionSelect.innerHTML = '<option value="">Select position for export...</option>';
+    }
+    if (editPositionSelect) {
+        editPositionSelect.innerHTML = '<option value="">Select position...</option>';
+    }
+
+    positions.forEach(position => {
+        const option = document.createElement('option');
+        option.value = position;
+        option.textContent = position;
+        boardPositionSelect.appendChild(option);
+
         if (exportPositionSelect) {
-            exportPositionSelect.innerHTML = '<option value="">Select position for export...</option>';
+            const exportOption = document.createElement('option');
+            exportOption.value = position;
+            exportOption.textContent = position;
+            exportPositionSelect.appendChild(exportOption);
         }
+
         if (editPositionSelect) {
-            editPositionSelect.innerHTML = '<option value="">Select position...</option>';
+            const editOption = document.createElement('option');
+            editOption.value = position;
+            editOption.textContent = position;
+            editPositionSelect.appendChild(editOption);
         }
+    });
 
-        positions.forEach(position => {
-            const option = document.createElement('option');
-            option.value = position;
-            option.textContent = position;
-            boardPositionSelect.appendChild(option);
-
-            if (exportPositionSelect) {
-                const exportOption = document.createElement('option');
-                exportOption.value = position;
-                exportOption.textContent = position;
-                exportPositionSelect.appendChild(exportOption);
-            }
-
-            if (editPositionSelect) {
-                const editOption = document.createElement('option');
-                editOption.value = position;
-                editOption.textContent = position;
-                editPositionSelect.appendChild(editOption);
-            }
-        });
-
-        if (editPositionSelect && currentPlayer && currentPlayer.position) {
-            const currentPosition = currentPlayer.position;
-            const hasOption = Array.from(editPositionSelect.options).some(option => option.value === currentPosition);
-            if (!hasOption) {
-                const customOption = document.createElement('option');
-                customOption.value = currentPosition;
-                customOption.textContent = currentPosition;
-                editPositionSelect.appendChild(customOption);
-            }
+    if (editPositionSelect && currentPlayer && currentPlayer.position) {
+        const currentPosition = currentPlayer.position;
+        const hasOption = Array.from(editPositionSelect.options).some(option => option.value === currentPosition);
+        if (!hasOption) {
+            const customOption = document.createElement('option');
+            customOption.value = currentPosition;
+            customOption.textContent = currentPosition;
+            editPositionSelect.appendChild(customOption);
         }
-        if (positions.length) {
-            if (currentBigBoardPosition && positions.includes(currentBigBoardPosition)) {
-                boardPositionSelect.value = currentBigBoardPosition;
-            } else {
-                currentBigBoardPosition = positions[0];
-                boardPositionSelect.value = currentBigBoardPosition;
-            }
-        } else {
-            currentBigBoardPosition = null;
-        }
-
-        positions.forEach(position => {
-            const randomizerBtn = document.createElement('button');
-            randomizerBtn.className = 'position-btn';
-            randomizerBtn.textContent = position;
-            randomizerBtn.dataset.position = position;
-            randomizerBtn.addEventListener('click', togglePosition);
-            randomizerContainer.appendChild(randomizerBtn);
-
-            const searchBtn = document.createElement('button');
-            searchBtn.className = 'position-btn';
-            searchBtn.textContent = position;
-            searchBtn.dataset.position = position;
-            searchBtn.addEventListener('click', toggleSearchPosition);
-            searchContainer.appendChild(searchBtn);
-        });
-    } catch (error) {
-        console.error('Error loading positions:', error);
     }
+    if (positions.length) {
+        if (currentBigBoardPosition && positions.includes(currentBigBoardPosition)) {
+            boardPositionSelect.value = currentBigBoardPosition;
+        } else {
+            currentBigBoardPosition = positions[0];
+            boardPositionSelect.value = currentBigBoardPosition;
+        }
+    } else {
+        currentBigBoardPosition = null;
+    }
+
+    positions.forEach(position => {
+        const randomizerBtn = document.createElement('button');
+        randomizerBtn.className = 'position-btn';
+        randomizerBtn.textContent = position;
+        randomizerBtn.dataset.position = position;
+        randomizerBtn.addEventListener('click', togglePosition);
+        randomizerContainer.appendChild(randomizerBtn);
+
+        const searchBtn = document.createElement('button');
+        searchBtn.className = 'position-btn';
+        searchBtn.textContent = position;
+        searchBtn.dataset.position = position;
+        searchBtn.addEventListener('click', toggleSearchPosition);
+        searchContainer.appendChild(searchBtn);
+    });
 }
 
 // Load available schools for searchable dropdown
 async function loadSchools() {
     try {
         const { data } = await requestGetJson('/api/schools');
-        const schools = data;
-
-        const schoolSelect = document.getElementById('school-search-input');
-        schoolSelect.innerHTML = '<option value="">All schools</option>';
-
-        schools.forEach(school => {
-            const option = document.createElement('option');
-            option.value = school;
-            option.textContent = school;
-            schoolSelect.appendChild(option);
-        });
+        applySchools(data);
     } catch (error) {
         console.error('Error loading schools:', error);
     }
 }
 
+function applySchools(schools) {
+    const schoolSelect = document.getElementById('school-search-input');
+    schoolSelect.innerHTML = '<option value="">All schools</option>';
+
+    schools.forEach(school => {
+        const option = document.createElement('option');
+        option.value = school;
+        option.textContent = school;
+        schoolSelect.appendChild(option);
+    });
+}
+
 // Setup event listeners
 function setupEventListeners() {
     const stopAppBtn = document.getElementById('stop-app-btn');
@@ -513,6 +579,7 @@ function setupEventListeners() {
     document.getElementById('recalculate-rankings-btn').addEventListener('click', recalculatePlayerRankings);
     document.getElementById('import-consensus-btn').addEventListener('click', importConsensusBoard);
     document.getElementById('import-nflmock-url-btn').addEventListener('click', openImportNflmockUrlDialog);
+    document.getElementById('crawl-nflmock-boards-btn').addEventListener('click', crawlNflmockBoards);
     document.getElementById('merge-duplicates-btn').addEventListener('click', mergeDuplicatePlayers);
     document.getElementById('board-import-files').addEventListener('change', handleBoardFilesSelected);
     document.getElementById('use-board-weights-checkbox').addEventListener('change', syncBoardWeightInputs);
@@ -649,6 +716,27 @@ async function shutdownApplication() {
     setTimeout(closeWindowWithFallback, 300);
 }
 
+// Long-running tools answer 202 with a job id; follow the job and return its result
+async function resolveJobResult(response, data, messageEl) {
+    const started = data || {};
+    if (response.status !== 202 || !started.job_id || !window.ApiClient?.waitForJob) {
+        return { response, result: started };
+    }
+
+    const job = await window.ApiClient.waitForJob(started.job_id, {
+        onProgress: (snapshot) => {
+            messageEl.textContent = window.ApiClient.describeJobProgress(snapshot);
+        }
+    });
+
+    if (job.status === 'succeeded') {
+        return { response, result: job.result || { success: true } };
+    }
+
+    const error = job.status === 'cancelled' ? 'The operation was cancelled.' : (job.error || 'Failed to run tool.');
+    return { response, result: { ...(job.result || {}), success: false, error } };
+}
+
 async function runSettingsTool(endpoint, buttonId, successMessage) {
     const button = document.getElementById(buttonId);
     const messageEl = document.getElementById('settings-tools-message');
@@ -658,8 +746,8 @@ async function runSettingsTool(endpoint, buttonId, successMessage) {
     messageEl.textContent = 'Running... this may take a minute.';
 
     try {
-        const { response, data } = await requestPostNoBody(endpoint);
-        const result = data || {};
+        const posted = await requestPostNoBody(endpoint);
+        const { response, result } = await resolveJobResult(posted.response, posted.data, messageEl);
 
         if (!response.ok || !result.success) {
             const errorLog = result.output || result.error || 'Failed to run tool.';
@@ -668,6 +756,7 @@ async function runSettingsTool(endpoint, buttonId, successMessage) {
             return;
         }
 
+        await waitForRankingGeneration(result);
         messageEl.textContent = `${successMessage}`;
         const outputText = (result.output || '').trim();
         const trimmedOutput = outputText.length > 900 ? `${outputText.slice(0, 900)}\n...` : outputText;
@@ -710,6 +799,11 @@ async function importConsensusBoard() {
     loadRankBoardSettings();
 }
 
+async function crawlNflmockBoards() {
+    await runSettingsTool('/api/settings/crawl-nflmock-boards', 'crawl-nflmock-boards-btn', 'NFLMockDraftDB boards imported.');
+    loadRankBoardSettings();
+}
+
 function openImportNflmockUrlDialog() {
     const dialog = document.getElementById('import-nflmock-url-dialog');
     const input = document.getElementById('nflmock-board-url-input');
@@ -756,11 +850,11 @@ async function importNflmockBoardByUrl() {
     message.textContent = 'Importing board from URL...';
 
     try {
-        const { response, data } = await requestPostJson('/api/settings/import-nflmock-board-url', {
+        const posted = await requestPostJson('/api/settings/import-nflmock-board-url', {
             url,
             board_name: customBoardName || null
         });
-        const result = data || {};
+        const { response, result } = await resolveJobResult(posted.response, posted.data, message);
 
         if (!response.ok || !result.success) {
             const errorText = result.error || 'Could not import board from URL.';
@@ -769,7 +863,10 @@ async function importNflmockBoardByUrl() {
             return;
         }
 
-        const successText = `Imported ${result.board_name} (${result.entries_imported} players).`;
+        await waitForRankingGeneration(result);
+        const successText = result.unchanged
+            ? `${result.board_name} is unchanged since the last import (${result.entries_imported} players).`
+            : `Imported ${result.board_name} (${result.entries_imported} players).`;
         message.textContent = successText;
         showToast('Board Imported', successText, 'success', 9000);
         closeImportNflmockUrlDialog();
@@ -792,6 +889,36 @@ async function importNflmockBoardByUrl() {
 }
 
 async function mergeDuplicatePlayers() {
+    let preview = null;
+    try {
+        const { response, data } = await requestPostJson('/api/settings/merge-player-duplicates', { dry_run: true });
+        preview = response.ok ? data : null;
+    } catch (error) {
+        console.error('Error previewing duplicate merge:', error);
+    }
+
+    if (preview?.success && !preview.players_removed) {
+        showToast('No Duplicates', preview.output || 'No duplicate player name variants found.', 'success', 5000);
+        return;
+    }
+    if (preview?.success) {
+        const examples = (preview.groups || []).slice(0, 5)
+            .map((group) => `${group.canonical.name} ← ${group.duplicates.map((duplicate) => duplicate.name).join(', ')}`)
+            .join('\n');
+        const message = `${preview.output}${examples ? `\n\n${examples}` : ''}`;
+        const confirmed = window.UIFeedback?.confirmAction
+            ? await window.UIFeedback.confirmAction({
+                title: 'Merge Duplicate Players?',
+                message,
+                confirmText: 'Merge',
+                cancelText: 'Cancel'
+            })
+            : window.confirm(message);
+        if (!confirmed) {
+            return;
+        }
+    }
+
     await runSettingsTool('/api/settings/merge-player-duplicates', 'merge-duplicates-btn', 'Duplicate player variants merged.');
     loadRankBoardSettings();
 }
@@ -954,6 +1081,7 @@ async function removeImportedRankBoard(board) {
             return;
         }
 
+        await waitForRankingGeneration(result);
         showToast('Board Removed', `${boardName} was removed.`, 'success', 5000);
         await loadRankBoardSettings();
         loadStats();
@@ -1051,6 +1179,7 @@ async function saveRankBoardSettings() {
             return;
         }
 
+        await waitForRankingGeneration(result);
         messageEl.textContent = 'Board weights updated.';
         messageEl.classList.remove('hidden');
         showToast('Board Settings Saved', 'Weights and primary default board updated.', 'success', 5000);
@@ -1185,6 +1314,7 @@ async function importAndNormalizeBigBoards() {
             return;
         }
 
+        await waitForRankingGeneration(result);
         const summary = `${result.players_ranked_from_import} players normalized from ${result.boards_processed} board(s). Unmatched names: ${result.unmatched_count}.`;
         messageEl.textContent = summary;
         showToast('Big Boards Imported', summary, 'success', 9000);
@@ -1842,10 +1972,15 @@ async function loadWatchList() {
     }
 
     try {
-        const { data } = await requestGetJson('/api/watchlist');
+        const { data, notModified } = await requestGetJson('/api/watchlist');
+        if (notModified && watchListRendered) {
+            return;
+        }
         renderWatchList(data);
+        watchListRendered = true;
     } catch (error) {
         console.error('Error loading watch list:', error);
+        watchListRendered = false;
         listEl.innerHTML = '<p class="search-empty">Error loading watch list.</p>';
     }
 }
@@ -2084,8 +2219,17 @@ async function handleWatchListDrop(event) {
         playerIds.splice(safeInsertIndex, 0, draggedIdNum);
     }
 
+    const draggedIndex = playerIds.indexOf(Number(draggedWatchListPlayerId));
+    if (draggedIndex < 0) {
+        clearWatchListDragArtifacts();
+        return;
+    }
+    const beforePlayerId = draggedIndex < playerIds.length - 1 ? playerIds[draggedIndex + 1] : null;
+
     try {
-        await requestPostJson('/api/watchlist/reorder', { player_ids: playerIds });
+        await requestPostJson('/api/watchlist/move', {
+            operations: [{ op: 'move', player_id: Number(draggedWatchListPlayerId), before_player_id: beforePlayerId }]
+        });
         await loadWatchList();
     } catch (error) {
         console.error('Error reordering watch list:', error);
@@ -2199,6 +2343,7 @@ async function addPlayerFromSettings() {
             return;
         }
 
+        await waitForRankingGeneration(result);
         messageEl.textContent = 'Player added successfully.';
         messageEl.classList.remove('hidden');
 
@@ -2329,7 +2474,7 @@ function toggleSearchPosition(event) {
 async function searchPlayers() {
     const searchBtn = document.getElementById('search-btn');
     const resultsContainer = document.getElementById('search-results');
-    const nameSearch = document.getElementById('search-input').value.trim();
+    const textSearch = document.getElementById('search-input').value.trim();
     const schoolSearch = document.getElementById('school-search-input').value.trim();
     const includeScouted = document.getElementById('search-include-scouted').checked;
 
@@ -2342,18 +2487,23 @@ async function searchPlayers() {
     try {
         const params = new URLSearchParams();
         selectedSearchPositions.forEach(pos => params.append('positions[]', pos));
-        if (nameSearch) {
-            params.append('name', nameSearch);
+        if (textSearch) {
+            params.append('search', textSearch);
         }
         if (schoolSearch) {
             params.append('school', schoolSearch);
         }
         params.append('include_scouted', includeScouted ? 'true' : 'false');
+        params.append('fields', SEARCH_RESULT_FIELDS);
+        params.append('limit', String(SEARCH_PAGE_SIZE));
+        searchLastParams = params;
 
-        const { data } = await requestGetJson(`/api/players?${params.toString()}`);
+        const { response, data } = await requestGetJson(`/api/players?${params.toString()}`);
         const players = data;
+        searchNextCursor = response.headers.get('X-Next-Cursor');
 
         renderSearchResults(players);
+        renderSearchLoadMore(Number(response.headers.get('X-Total-Count')));
 
         if (!Array.isArray(players) || players.length === 0) {
             resultsContainer.innerHTML = '<p class="search-empty">No players matched your search criteria.</p>';
@@ -2366,9 +2516,51 @@ async function searchPlayers() {
     }
 }
 
-function renderSearchResults(players) {
+async function loadMoreSearchResults() {
+    if (!searchNextCursor || !searchLastParams) {
+        return;
+    }
+
+    const params = new URLSearchParams(searchLastParams);
+    params.append('cursor', searchNextCursor);
+
+    try {
+        const { response, data } = await requestGetJson(`/api/players?${params.toString()}`);
+        if (!response.ok) {
+            throw new Error((data && data.error) || 'Could not load more players.');
+        }
+        searchNextCursor = response.headers.get('X-Next-Cursor');
+        renderSearchResults(data, { append: true });
+        renderSearchLoadMore(Number(response.headers.get('X-Total-Count')));
+    } catch (error) {
+        console.error('Error loading more search results:', error);
+        showToast('Load Failed', 'Could not load more players.', 'error', 5000);
+    }
+}
+
+function renderSearchLoadMore(total) {
     const resultsContainer = document.getElementById('search-results');
-    resultsContainer.innerHTML = '';
+    resultsContainer.querySelector('.search-load-more')?.remove();
+    if (!searchNextCursor) {
+        return;
+    }
+
+    const shown = resultsContainer.querySelectorAll('.search-result-card').length;
+    const loadMore = document.createElement('button');
+    loadMore.type = 'button';
+    loadMore.className = 'mini-btn search-load-more';
+    loadMore.textContent = Number.isFinite(total) && total > 0
+        ? `Load more (${shown} of ${total})`
+        : 'Load more';
+    loadMore.addEventListener('click', loadMoreSearchResults);
+    resultsContainer.appendChild(loadMore);
+}
+
+function renderSearchResults(players, options = {}) {
+    const resultsContainer = document.getElementById('search-results');
+    if (!options.append) {
+        resultsContainer.innerHTML = '';
+    }
 
     if (!Array.isArray(players) || players.length === 0) {
         return;
@@ -2395,6 +2587,14 @@ function renderSearchResults(players) {
         card.appendChild(name);
         card.appendChild(meta);
 
+        if (player.notes_snippet) {
+            // Server escapes the notes text; only the <mark> highlight tags are markup.
+            const snippet = document.createElement('div');
+            snippet.className = 'search-result-snippet';
+            snippet.innerHTML = player.notes_snippet;
+            card.appendChild(snippet);
+        }
+
         card.addEventListener('click', () => loadPlayerReport(player.id));
         resultsContainer.appendChild(card);
     });
@@ -2436,9 +2636,12 @@ async function randomizePlayer() {
             params.append('watch_list_only', 'true');
         }
      
-        // Fetch eligible players
-        const playersResponse = await requestGetJson(`/api/players?${params.toString()}`);
-        allPlayers = playersResponse.data || [];
+        // Sample eligible players for the animation strip (names and schools only)
+        const stripParams = new URLSearchParams(params);
+        stripParams.append('n', String(RANDOMIZER_STRIP_SAMPLE_SIZE));
+        stripParams.append('fields', 'id,name,school');
+        const playersResponse = await requestGetJson(`/api/random?${stripParams.toString()}`);
+        allPlayers = Array.isArray(playersResponse.data) ? playersResponse.data : [];
      
         if (allPlayers.length === 0) {
             showToast('No Players Found', 'No players available with current filters.', 'error', 5000);
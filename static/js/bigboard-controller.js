@@ -19,6 +19,7 @@
         let lastDropIndex = null;
         let pendingAddToBoardPlayer = null;
         let currentBigBoardPlayerIds = new Set();
+        let lastBigBoardRenderKey = null;
 
         function getBigBoardParams() {
             if (getBigBoardType() === 'position') {
@@ -84,14 +85,27 @@
                     params.append('position', getCurrentBigBoardPosition());
                 }
 
-                const { data } = await requestGetJson(`/api/bigboard?${params.toString()}`);
+                const url = `/api/bigboard?${params.toString()}`;
+                const { data, notModified } = await requestGetJson(url);
+                // Display settings change the markup too, so they are part of what was rendered
+                const renderKey = `${url}|${JSON.stringify(getAppSettings ? getAppSettings() : {})}`;
+                if (notModified && lastBigBoardRenderKey === renderKey) {
+                    return;
+                }
                 renderBigBoard(data);
+                lastBigBoardRenderKey = renderKey;
             } catch (error) {
                 console.error('Error loading big board:', error);
+                lastBigBoardRenderKey = null;
                 document.getElementById('bigboard-list').innerHTML = '<p class="search-empty">Error loading big board.</p>';
             }
         }
 
+        function showPreloadedBigBoard(entries) {
+            renderBigBoard(entries);
+            lastBigBoardRenderKey = null;
+        }
+
         function renderBigBoard(entries) {
             const title = document.getElementById('bigboard-title');
             const list = document.getElementById('bigboard-list');
@@ -341,7 +355,7 @@
                 list.appendChild(draggedEl);
             }
 
-            await persistBigBoardOrder();
+            await persistBigBoardMove(Number(draggedBoardPlayerId), draggedEl);
             refreshBigBoardVisibleRanks();
             clearBoardDragArtifacts();
         }
@@ -375,19 +389,31 @@
             });
         }
 
-        async function persistBigBoardOrder() {
-            const playerIds = Array.from(document.querySelectorAll('#bigboard-list .bigboard-item'))
-                .map(item => parseInt(item.dataset.playerId, 10));
-
-            const payload = {
+        async function postBigBoardMove(playerId, beforePlayerId) {
+            const { response, data } = await requestPostJson('/api/bigboard/move', {
                 ...getBigBoardParams(),
-                player_ids: playerIds
-            };
+                operations: [{ op: 'move', player_id: playerId, before_player_id: beforePlayerId }]
+            });
+            const result = data || {};
+            if (!response.ok || !result.success) {
+                throw new Error(result.error || 'Could not move player.');
+            }
+            return result;
+        }
+
+        async function persistBigBoardMove(playerId, draggedEl) {
+            let next = draggedEl.nextElementSibling;
+            while (next && !next.classList.contains('bigboard-item')) {
+                next = next.nextElementSibling;
+            }
+            const beforePlayerId = next ? Number(next.dataset.playerId) : null;
 
             try {
-                await requestPostJson('/api/bigboard/reorder', payload);
+                await postBigBoardMove(playerId, beforePlayerId);
             } catch (error) {
                 console.error('Error persisting big board order:', error);
+                showToast('Save Failed', 'Could not save the new board order.', 'error', 5000);
+                await loadBigBoard();
             }
         }
 
@@ -398,6 +424,7 @@
             try {
                 const params = new URLSearchParams();
                 params.append('include_scouted', 'true');
+                params.append('fields', 'id,name,position,school,rank,grade,grade_secondary,scouted');
                 if (searchTerm) {
                     params.append('name', searchTerm);
                 }
@@ -575,12 +602,14 @@
 
             const withoutPlayer = ids.filter(id => id !== playerId);
             const insertIndex = Math.max(0, Math.min(targetRank - 1, withoutPlayer.length));
-            withoutPlayer.splice(insertIndex, 0, playerId);
+            const beforePlayerId = insertIndex < withoutPlayer.length ? withoutPlayer[insertIndex] : null;
 
-            await requestPostJson('/api/bigboard/reorder', {
-                ...getBigBoardParams(),
-                player_ids: withoutPlayer
-            });
+            try {
+                await postBigBoardMove(playerId, beforePlayerId);
+            } catch (error) {
+                console.error('Error moving big board player:', error);
+                showToast('Move Failed', error.message, 'error', 5000);
+            }
 
             await loadBigBoard();
         }
@@ -632,6 +661,7 @@
             setBigBoardType,
             getBigBoardParams,
             loadBigBoard,
+            showPreloadedBigBoard,
             searchBigBoardPlayers,
             confirmAddToRank,
             confirmAddToBottom,
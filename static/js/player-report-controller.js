@@ -6,6 +6,7 @@
             requestGetJson,
             requestPostJson,
             requestPostNoBody,
+            waitForRankingGeneration,
             showToast,
             loadStats,
             loadPositions,
@@ -178,6 +179,9 @@
                     return;
                 }
 
+                if (waitForRankingGeneration) {
+                    await waitForRankingGeneration(result);
+                }
                 await loadCurrentPlayerBySource(currentPlayer.id);
                 closeEditProfileDialog();
                 showToast('Profile Saved', 'Player profile fields were updated.', 'success', 5000);
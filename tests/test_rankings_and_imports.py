@@ -1,9 +1,26 @@
+import hashlib
+import json
 import os
 import sqlite3
 import tempfile
+import threading
+import time
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 from database import ScoutDatabase
+from identity_resolver import IdentityResolver
+from jobs import JobRunner, SingleFlight
+from rank_scheduler import RankRecalcScheduler
+
+try:
+    import consensus_scraper
+    import http_cache
+except ImportError:
+    consensus_scraper = None
+    http_cache = None
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
 
 
 class RankingsAndImportsTests(unittest.TestCase):
@@ -13,6 +30,7 @@ class RankingsAndImportsTests(unittest.TestCase):
         self.db = ScoutDatabase(self.db_path)
 
     def tearDown(self):
+        self.db.close()
         self.temp_dir.cleanup()
 
     def _conn(self):
@@ -90,6 +108,205 @@ class RankingsAndImportsTests(unittest.TestCase):
         self.assertAlmostEqual(weights['Board Gamma'], 2.5)
         self.assertAlmostEqual(weights['Board Delta'], 0.5)
 
+    def test_unchanged_board_import_is_skipped_and_changes_apply_as_diff(self):
+        first = self.db.import_nflmock_url_board(
+            [{'name': 'Player One', 'rank': 1}, {'name': 'Player Two', 'rank': 2}, {'name': 'Player Three', 'rank': 3}],
+            'Diff Board'
+        )
+        self.assertFalse(first['unchanged'])
+        self.db.wait_for_rankings(first['ranking_generation'], timeout=5)
+
+        def board_rows():
+            conn = self._conn()
+            rows = conn.execute(
+                """
+                SELECT p.name, pbr.id, pbr.board_rank
+                FROM player_board_ranks pbr
+                JOIN players p ON p.id = pbr.player_id
+                JOIN rank_boards b ON b.id = pbr.board_id
+                WHERE b.board_key = 'diff_board'
+                """
+            ).fetchall()
+            conn.close()
+            return {name: (row_id, rank) for name, row_id, rank in rows}
+
+        before = board_rows()
+        runs_before = self.db.get_ranking_status()['runs']
+        repeat = self.db.import_nflmock_url_board(
+            [{'name': 'Player One', 'rank': 1}, {'name': 'Player Two', 'rank': 2}, {'name': 'Player Three', 'rank': 3}],
+            'Diff Board'
+        )
+        self.assertTrue(repeat['unchanged'])
+        self.assertEqual(repeat['entries_imported'], 3)
+        self.assertIsNone(repeat['ranking_generation'])
+        self.assertEqual(self.db.get_ranking_status()['runs'], runs_before)
+        self.assertEqual(board_rows(), before)
+
+        changed = self.db.import_nflmock_url_board(
+            [{'name': 'Player One', 'rank': 1}, {'name': 'Player Three', 'rank': 2}, {'name': 'Player Four', 'rank': 3}],
+            'Diff Board'
+        )
+        self.assertFalse(changed['unchanged'])
+        self.assertEqual(changed['changes'], {'added': 1, 'moved': 1, 'dropped': 1})
+        after = board_rows()
+        self.assertEqual(sorted(after), ['Player Four', 'Player One', 'Player Three'])
+        self.assertEqual(after['Player One'], before['Player One'])
+        self.assertEqual(after['Player Three'], (before['Player Three'][0], 2.0))
+
+        conn = self._conn()
+        conn.execute("DELETE FROM player_board_ranks WHERE id = ?", (after['Player Four'][0],))
+        conn.commit()
+        conn.close()
+        restored = self.db.import_nflmock_url_board(
+            [{'name': 'Player One', 'rank': 1}, {'name': 'Player Three', 'rank': 2}, {'name': 'Player Four', 'rank': 3}],
+            'Diff Board'
+        )
+        self.assertFalse(restored['unchanged'])
+        self.assertIn('Player Four', board_rows())
+
+    def test_staged_board_upsert_resolves_each_identity_once(self):
+        self.db.add_player({'name': 'Cam Ward Jr.', 'position': 'QB', 'school': 'Miami'})
+        result = self.db.import_external_big_boards(
+            [{'name': 'Staged Board', 'text': '1. Cam Ward\n2. New Prospect\n3. New  Prospect\n4. Cam Ward'}]
+        )
+        board = result['boards'][0]
+        self.assertEqual(board['matched'], 2)
+        self.assertEqual(result['new_players_added'], 1)
+        self.assertEqual(board['changes'], {'added': 2, 'moved': 0, 'dropped': 0})
+        self.assertIsNotNone(result['ranking_generation'])
+
+        conn = self._conn()
+        rows = conn.execute(
+            """
+            SELECT p.name, pbr.board_rank
+            FROM player_board_ranks pbr
+            JOIN players p ON p.id = pbr.player_id
+            JOIN rank_boards b ON b.id = pbr.board_id
+            WHERE b.board_key = 'imported_staged_board'
+            ORDER BY pbr.board_rank
+            """
+        ).fetchall()
+        conn.close()
+        self.assertEqual(rows, [('Cam Ward Jr.', 1.0), ('New Prospect', 2.0)])
+
+    def test_tankathon_json_runs_through_import_pipeline(self):
+        self.db.add_player({'name': 'Cam Ward Jr.', 'position': '', 'school': ''})
+        json_path = os.path.join(self.temp_dir.name, 'tankathon.json')
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump([
+                {'rank': 1, 'name': 'Cam Ward', 'position': 'QB', 'school': 'Miami', 'height': '6-2', 'forty': '4.7'},
+                {'rank': 2, 'name': 'Travis Hunter', 'position': 'CB/WR', 'school': 'Colorado'}
+            ], f)
+
+        result = self.db.import_players_from_json(json_path)
+        self.assertTrue(result['success'])
+        self.assertEqual(result['imported'], 2)
+        self.assertEqual(result['changes'], {'added': 2, 'moved': 0, 'dropped': 0})
+        self.assertEqual(
+            set(result['timings_ms']),
+            {'parse', 'normalize', 'resolve', 'enrich', 'write', 'recalc', 'total'}
+        )
+
+        conn = self._conn()
+        rows = conn.execute('SELECT name, position, school, height, tankathon_rank, stats FROM players ORDER BY tankathon_rank').fetchall()
+        conn.close()
+        self.assertEqual([row[:5] for row in rows], [
+            ('Cam Ward Jr.', 'QB', 'Miami', '6-2', 1),
+            ('Travis Hunter', 'CB/WR', 'Colorado', '', 2)
+        ])
+        self.assertEqual(json.loads(rows[0][5]), {'forty': '4.7'})
+
+        repeat = self.db.import_players_from_json(json_path)
+        self.assertTrue(repeat['unchanged'])
+        self.assertIsNone(repeat['ranking_generation'])
+
+    def test_identity_resolver_blocks_and_scores_name_variants(self):
+        resolver = IdentityResolver([
+            (1, 'jaxon smith njigba', 'WR', 'Ohio State'),
+            (2, 'tyler booker', 'OL', 'Alabama'),
+            (3, 'james smith', 'DL', 'Alabama'),
+            (4, 'jalen waddle', 'WR', 'Alabama')
+        ])
+        self.assertEqual(resolver.match('jaxson smith njigba', 'WR', 'Ohio State')[:3:2], (1, True))
+        self.assertEqual(resolver.match('jaylen waddle', 'WR')[:3:2], (4, True))
+        self.assertFalse(resolver.match('jaxson smith njigba').corroborated)
+        self.assertIsNone(resolver.match('jaxson smith njigba', 'WR', 'Oregon'))
+        self.assertIsNone(resolver.match('tyler baker', 'OL', 'Alabama'))
+        self.assertIsNone(resolver.match('john smith', 'DL', 'Alabama'))
+
+    def test_identity_resolver_never_corroborates_near_miss_surnames(self):
+        resolver = IdentityResolver([
+            (1, 'will anderson', 'EDGE', 'Alabama'),
+            (2, 'jalen green', 'WR', 'Houston'),
+            (3, 'mike green', 'S', 'Marshall'),
+            (4, 'derrick harmon', 'DL', 'Oregon'),
+            (5, 'chris johnson', 'CB', 'UCF')
+        ])
+        for name, position in [('will andersen', None), ('will andersen', 'EDGE'), ('jalen greene', 'WR'),
+                               ('mike greene', 'S'), ('derrick harman', 'DL'), ('chris johnston', 'CB')]:
+            match = resolver.match(name, position)
+            self.assertTrue(match is None or not match.corroborated, name)
+
+    def test_approximate_matches_apply_only_when_corroborated(self):
+        jaxon_id = self.db.add_player({'name': 'Jaxon Smith-Njigba', 'position': 'WR', 'school': 'Ohio State'})['player_id']
+        self.db.add_player({'name': 'Kaleb Johnson', 'position': 'RB', 'school': 'Iowa'})
+        json_path = os.path.join(self.temp_dir.name, 'tankathon.json')
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump([
+                {'rank': 1, 'name': 'Jaxson Smith-Njigba', 'position': 'WR', 'school': 'Ohio State'},
+                {'rank': 2, 'name': 'Caleb Johnson', 'position': 'RB', 'school': 'Kentucky'}
+            ], f)
+
+        result = self.db.import_players_from_json(json_path)
+        self.assertTrue(result['success'])
+        self.assertEqual([(m['name'], m['player_id']) for m in result['approximate_matches']], [('Jaxson Smith-Njigba', jaxon_id)])
+        self.assertEqual([a['alias'] for a in self.db.get_player_aliases(jaxon_id)['aliases']], ['jaxson smith-njigba'])
+        conn = self._conn()
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM players WHERE name LIKE '%aleb Johnson'").fetchone()[0], 2)
+        conn.close()
+
+        # The alias now resolves directly, even without the school to corroborate it
+        later = self.db.import_external_big_boards([{'name': 'Alias Board', 'text': '1. Jaxson Smith-Njigba'}])
+        self.assertEqual(later['new_players_added'], 0)
+        self.assertEqual(later['approximate_matches'], [])
+        self.assertIn('imported_alias_board', [rank['board_key'] for rank in self.db.get_player_board_ranks(jaxon_id)])
+        self.assertTrue(self.db.remove_player_alias(jaxon_id, 'Jaxson Smith-Njigba')['success'])
+        self.assertFalse(self.db.add_player_alias(jaxon_id, '  ')['success'])
+
+    def test_near_miss_names_are_suggested_not_merged(self):
+        anderson_id = self.db.add_player({'name': 'Will Anderson', 'position': 'EDGE', 'school': 'Alabama'})['player_id']
+        green_id = self.db.add_player({'name': 'Jalen Green', 'position': 'WR', 'school': 'Houston'})['player_id']
+
+        # A TXT-style entry has nothing to corroborate; a scraped one here has only the position
+        result = self.db.import_nflmock_url_board([
+            {'name': 'Will Andersen', 'rank': 1},
+            {'name': 'Jalen Greene', 'rank': 2, 'position': 'WR'}
+        ], 'Near Miss Board')
+        self.assertEqual(result['approximate_matches'], [])
+        self.assertEqual(result['new_players_added'], 2)
+        self.assertEqual(
+            sorted((s['name'], s['player_id']) for s in result['alias_suggestions']),
+            [('Jalen Greene', green_id), ('Will Andersen', anderson_id)]
+        )
+        self.assertEqual(self.db.get_player_board_ranks(anderson_id), [])
+        self.assertEqual(self.db.get_player_board_ranks(green_id), [])
+        conn = self._conn()
+        self.assertEqual(conn.execute('SELECT COUNT(*) FROM player_aliases').fetchone()[0], 0)
+        conn.close()
+
+        pending = self.db.get_player_aliases(anderson_id)
+        self.assertEqual((pending['aliases'], [s['alias'] for s in pending['suggestions']]), ([], ['will andersen']))
+
+        # Confirming folds the player the import created into the confirmed one
+        confirmed = self.db.add_player_alias(anderson_id, 'Will Andersen')
+        self.assertEqual((confirmed['success'], confirmed['players_merged']), (True, 1))
+        self.assertEqual([rank['board_key'] for rank in self.db.get_player_board_ranks(anderson_id)], ['near_miss_board'])
+        self.assertEqual(self.db.get_player_aliases(anderson_id)['suggestions'], [])
+
+        # Dismissing a suggestion leaves the separate player alone
+        self.assertTrue(self.db.remove_player_alias(green_id, 'Jalen Greene')['success'])
+        self.assertEqual(self.db.get_player_aliases(green_id), {'aliases': [], 'suggestions': []})
+
     def test_primary_board_then_fallback_to_tankathon_rank(self):
         conn = self._conn()
         cursor = conn.cursor()
@@ -137,6 +354,51 @@ class RankingsAndImportsTests(unittest.TestCase):
         self.assertEqual(second_merge['groups_merged'], 0)
         self.assertEqual(second_merge['players_removed'], 0)
 
+    def test_merge_duplicates_dry_run_previews_then_merges_set_based(self):
+        conn = self._conn()
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            INSERT INTO players (name, position, school, notes, scouted, tankathon_rank)
+            VALUES ('Ruben Bain', 'EDGE', 'Miami', 'Scouted note', 1, 9),
+                   ('Ruben Bain Jr.', '', '', '', 0, 4),
+                   ('RUBEN BAIN', '', '', '', 0, NULL)
+            """
+        )
+        conn.commit()
+        conn.close()
+        self.db.import_external_big_boards([{'name': 'Merge Board', 'text': '1. Ruben Bain Jr.\n2. RUBEN BAIN'}])
+        self.db.add_player_to_big_board(2)
+        self.db.add_player_to_big_board(3)
+
+        preview = self.db.merge_player_name_duplicates(dry_run=True)
+        self.assertTrue(preview['dry_run'])
+        self.assertEqual(preview['players_removed'], 2)
+        self.assertEqual(preview['groups'][0]['canonical'], {'id': 1, 'name': 'Ruben Bain'})
+        self.assertEqual([dup['id'] for dup in preview['groups'][0]['duplicates']], [2, 3])
+        conn = self._conn()
+        self.assertEqual(conn.execute('SELECT COUNT(*) FROM players').fetchone()[0], 3)
+        conn.close()
+
+        merged = self.db.merge_player_name_duplicates()
+        self.assertFalse(merged['dry_run'])
+        self.assertEqual((merged['groups_merged'], merged['players_removed']), (1, 2))
+
+        conn = self._conn()
+        self.assertEqual(
+            conn.execute('SELECT id, school, notes, scouted, tankathon_rank FROM players').fetchall(),
+            [(1, 'Miami', 'Scouted note', 1, 4)]
+        )
+        self.assertEqual(
+            conn.execute(
+                "SELECT pbr.player_id, pbr.board_rank FROM player_board_ranks pbr "
+                "JOIN rank_boards b ON b.id = pbr.board_id WHERE b.board_key = 'imported_merge_board'"
+            ).fetchall(),
+            [(1, 1.0)]
+        )
+        self.assertEqual(conn.execute('SELECT player_id FROM big_board_entries').fetchall(), [(1,)])
+        conn.close()
+
     def test_merge_duplicates_collapses_initial_variants(self):
         conn = self._conn()
         cursor = conn.cursor()
@@ -163,6 +425,38 @@ class RankingsAndImportsTests(unittest.TestCase):
         self.assertTrue(rows[0][0] in ('L.T. Overton', 'LT Overton'))
         self.assertEqual(rows[0][1], 'Alabama')
 
+    def test_imports_resolve_name_variants_through_normalized_name(self):
+        conn = self._conn()
+        cursor = conn.cursor()
+        cursor.execute("INSERT INTO players (name, school) VALUES ('Kenneth Grant Jr.', 'Michigan')")
+        grant_id = cursor.lastrowid
+        cursor.execute("INSERT INTO players (name) VALUES ('Old Name')")
+        renamed_id = cursor.lastrowid
+        conn.commit()
+        cursor.execute("UPDATE players SET name = 'T.J. Parker' WHERE id = ?", (renamed_id,))
+        conn.commit()
+        conn.close()
+
+        result = self.db.import_external_big_boards([
+            {'name': 'Variant Board', 'text': '1. Kenneth Grant\n2. TJ Parker', 'weight': 1}
+        ], weighting_mode='equal')
+        self.assertTrue(result['success'])
+        self.assertEqual(result['new_players_added'], 0)
+
+        conn = self._conn()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT pbr.player_id
+            FROM player_board_ranks pbr
+            JOIN rank_boards rb ON rb.id = pbr.board_id
+            WHERE rb.board_name = 'Variant Board'
+            ORDER BY pbr.board_rank
+        ''')
+        self.assertEqual([row[0] for row in cursor.fetchall()], [grant_id, renamed_id])
+        cursor.execute('SELECT normalized_name FROM players WHERE id IN (?, ?) ORDER BY id', (grant_id, renamed_id))
+        self.assertEqual([row[0] for row in cursor.fetchall()], ['kenneth grant', 'tj parker'])
+        conn.close()
+
     def test_export_big_board_text_uses_personal_board_order(self):
         conn = self._conn()
         cursor = conn.cursor()
@@ -180,6 +474,72 @@ class RankingsAndImportsTests(unittest.TestCase):
         export_text = self.db.export_big_board_text(scope='overall')
         self.assertEqual(export_text.splitlines(), ['1. Alpha Prospect', '2. Beta Prospect'])
 
+    def test_big_board_edits_touch_one_row_and_keep_dense_positions(self):
+        conn = self._conn()
+        cursor = conn.cursor()
+        player_ids = []
+        for index, rank in enumerate([1, 2, 4, 5, 6, 3], start=1):
+            cursor.execute('INSERT INTO players (name, rank) VALUES (?, ?)', (f'Board Key {index}', rank))
+            player_ids.append(cursor.lastrowid)
+        #Legacy dense keys leave no gaps, so the first insert between them respaces the board
+        cursor.execute("INSERT INTO big_boards (board_type, position) VALUES ('overall', NULL)")
+        board_id = cursor.lastrowid
+        for order, player_id in enumerate(player_ids[:5], start=1):
+            cursor.execute(
+                'INSERT INTO big_board_entries (board_id, player_id, rank_order) VALUES (?, ?, ?)',
+                (board_id, player_id, order)
+            )
+        conn.commit()
+        conn.close()
+
+        self.assertTrue(self.db.add_player_to_big_board(player_ids[5])['success'])
+        expected = [player_ids[0], player_ids[1], player_ids[5], player_ids[2], player_ids[3], player_ids[4]]
+        board = self.db.get_big_board()
+        self.assertEqual([entry['id'] for entry in board], expected)
+        self.assertEqual([entry['rank_order'] for entry in board], [1, 2, 3, 4, 5, 6])
+
+        moved = [expected[4]] + expected[:4] + expected[5:]
+        result = self.db.reorder_big_board(moved)
+        self.assertEqual(result['rows_written'], 1)
+        self.assertEqual([entry['id'] for entry in self.db.get_big_board()], moved)
+
+        self.db.remove_player_from_big_board(moved[0])
+        board = self.db.get_big_board()
+        self.assertEqual([entry['rank_order'] for entry in board], [1, 2, 3, 4, 5])
+        self.assertEqual(self.db.get_player_by_id(moved[3])['personal_big_board_rank'], 3)
+
+    def test_grade_sort_key_drives_insertion_and_auto_sort(self):
+        b_id = self.db.add_player({'name': 'Grade B', 'rank': 1, 'grade': 'Alphabet - B'})['player_id']
+        a_id = self.db.add_player({'name': 'Grade A', 'rank': 2, 'grade': 'Alphabet - A'})['player_id']
+        none_id = self.db.add_player({'name': 'No Grade', 'rank': 3})['player_id']
+        chip_id = self.db.add_player({'name': 'Chip Grade', 'rank': 4})['player_id']
+        self.db.update_grade(chip_id, 'Poker Chip - Purple')
+
+        conn = self._conn()
+        keys = dict(conn.execute('SELECT id, grade_sort_key FROM players').fetchall())
+        self.assertEqual((keys[chip_id], keys[a_id], keys[b_id], keys[none_id]), (0, 2001, 2004, 9999))
+        conn.close()
+
+        #Imports and merges write the key along with the grade
+        self.db.import_consensus_board([{'rank': 1, 'name': 'Grade Imported', 'position': 'WR'}])
+        stray_id = self.db.add_player({'name': 'Grade Stray', 'rank': 5, 'grade': 'Alphabet - A+'})['player_id']
+        self.assertEqual(self.db.add_player_alias(none_id, 'Grade Stray')['players_merged'], 1)
+        conn = self._conn()
+        imported_key = conn.execute("SELECT grade_sort_key FROM players WHERE name = 'Grade Imported'").fetchone()[0]
+        merged = conn.execute('SELECT grade, grade_sort_key FROM players WHERE id = ?', (none_id,)).fetchone()
+        self.assertIsNone(conn.execute('SELECT 1 FROM players WHERE id = ?', (stray_id,)).fetchone())
+        conn.close()
+        self.assertEqual(imported_key, 9999)
+        self.assertEqual(tuple(merged), ('Alphabet - A+', 2000))
+
+        for player_id in (b_id, a_id, chip_id, none_id):
+            self.assertTrue(self.db.add_player_to_big_board(player_id)['success'])
+        self.assertEqual([entry['id'] for entry in self.db.get_big_board()], [chip_id, none_id, a_id, b_id])
+
+        self.db.update_grade(chip_id, '')
+        self.db.auto_sort_big_board()
+        self.assertEqual([entry['id'] for entry in self.db.get_big_board()], [none_id, a_id, b_id, chip_id])
+
     def test_watch_list_add_reorder_and_remove(self):
         conn = self._conn()
         cursor = conn.cursor()
@@ -208,6 +568,42 @@ class RankingsAndImportsTests(unittest.TestCase):
         watch_list = self.db.get_watch_list()
         self.assertEqual([row['id'] for row in watch_list], [a_id])
 
+    def test_board_move_operations_return_only_changed_positions(self):
+        conn = self._conn()
+        cursor = conn.cursor()
+        player_ids = []
+        for index in range(1, 6):
+            cursor.execute('INSERT INTO players (name) VALUES (?)', (f'Move Prospect {index}',))
+            player_ids.append(cursor.lastrowid)
+        conn.commit()
+        conn.close()
+        for player_id in player_ids:
+            self.db.add_player_to_watch_list(player_id)
+        a, b, c, d, e = player_ids
+
+        result = self.db.apply_watch_list_moves([{'op': 'move', 'player_id': d, 'before_player_id': b}])
+        self.assertTrue(result['success'])
+        self.assertEqual(result['rows_written'], 1)
+        self.assertEqual(result['changed'], [
+            {'player_id': d, 'rank_order': 2},
+            {'player_id': b, 'rank_order': 3},
+            {'player_id': c, 'rank_order': 4}
+        ])
+
+        result = self.db.apply_watch_list_moves([
+            {'op': 'move_block', 'player_ids': [a, d], 'after_player_id': e},
+            {'op': 'swap', 'player_id': b, 'other_player_id': c}
+        ])
+        self.assertTrue(result['success'])
+        self.assertEqual([row['id'] for row in self.db.get_watch_list()], [c, b, e, a, d])
+
+        failed = self.db.apply_watch_list_moves([
+            {'op': 'move', 'player_id': a, 'before_player_id': c},
+            {'op': 'move', 'player_id': b, 'before_player_id': 999999}
+        ])
+        self.assertFalse(failed['success'])
+        self.assertEqual([row['id'] for row in self.db.get_watch_list()], [c, b, e, a, d])
+
     def test_mark_scouted_removes_from_watch_list(self):
         conn = self._conn()
         cursor = conn.cursor()
@@ -256,6 +652,161 @@ class RankingsAndImportsTests(unittest.TestCase):
         self.assertIn(watch_id, watch_only_ids)
         self.assertNotIn(non_watch_id, watch_only_ids)
 
+    def test_players_page_uses_keyset_cursor_and_projection(self):
+        conn = self._conn()
+        cursor = conn.cursor()
+        for index, rank in enumerate([None, 3, 1, 2, None, 2], start=1):
+            cursor.execute(
+                "INSERT INTO players (name, rank, position, stats, scouted) VALUES (?, ?, 'QB', '{\"ht\": 1}', 0)",
+                (f'Page Prospect {index}', rank)
+            )
+        conn.commit()
+        conn.close()
+        expected = [player['id'] for player in self.db.get_filtered_players(positions=['QB'])]
+
+        seen = []
+        cursor_text = None
+        while True:
+            page = self.db.get_players_page(positions=['QB'], fields=['name', 'rank'], limit=4, cursor=cursor_text)
+            self.assertEqual(page['total'], 6)
+            seen.extend(player['id'] for player in page['players'])
+            for player in page['players']:
+                self.assertEqual(set(player), {'id', 'name', 'rank'})
+            cursor_text = page['next_cursor']
+            if not cursor_text:
+                break
+        self.assertEqual(seen, expected)
+
+        with self.assertRaises(ValueError):
+            self.db.get_players_page(fields=['password'])
+        with self.assertRaises(ValueError):
+            self.db.get_players_page(cursor='not-a-cursor')
+        for bad_state in ({'i': {}}, {'r': 'x', 'i': 1}, {'i': True}, {'o': 'x'}, {'o': -4}, {'o': 1.5}):
+            with self.assertRaises(ValueError):
+                self.db.get_players_page(cursor=ScoutDatabase._encode_page_cursor(bad_state))
+
+    def test_random_sampling_respects_filters_without_replacement(self):
+        conn = self._conn()
+        cursor = conn.cursor()
+        eligible_ids = set()
+        for index in range(1, 9):
+            cursor.execute(
+                "INSERT INTO players (name, position, rank, scouted) VALUES (?, ?, ?, ?)",
+                (f'Sample Prospect {index}', 'WR' if index % 2 else 'TE', index, 1 if index == 7 else 0)
+            )
+            if index % 2 and index != 7 and index <= 6:
+                eligible_ids.add(cursor.lastrowid)
+        conn.commit()
+        conn.close()
+
+        sample = self.db.sample_random_players(n=10, positions=['WR'], max_rank=6, fields=['name'])
+        self.assertEqual({player['id'] for player in sample}, eligible_ids)
+        self.assertEqual(len(sample), len(eligible_ids))
+        self.assertEqual(set(sample[0]), {'id', 'name'})
+
+        single = self.db.sample_random_players(n=1, positions=['WR'], max_rank=6)
+        self.assertEqual(len(single), 1)
+        self.assertIn(single[0]['id'], eligible_ids)
+
+        #Rowid draws that land on deleted or ineligible players are rejected
+        conn = self._conn()
+        conn.executemany('INSERT INTO players (name, scouted) VALUES (?, ?)', [(f'Gap Prospect {i}', i % 3 == 0) for i in range(60)])
+        conn.execute("DELETE FROM players WHERE id % 4 = 0 AND name LIKE 'Gap Prospect%'")
+        conn.commit()
+        unscouted_ids = {row[0] for row in conn.execute('SELECT id FROM players WHERE scouted = 0')}
+        conn.close()
+        for _ in range(20):
+            drawn = [player['id'] for player in self.db.sample_random_players(n=5, fields=['name'])]
+            self.assertEqual(len(set(drawn)), 5)
+            self.assertTrue(set(drawn) <= unscouted_ids)
+
+    def test_player_detail_batch_matches_single_lookups(self):
+        self.db.import_external_big_boards([
+            {'name': 'Detail Board A', 'text': '1. Detail One\n2. Detail Two', 'weight': 1},
+            {'name': 'Detail Board B', 'text': '1. Detail Two\n2. Detail One', 'weight': 1}
+        ], weighting_mode='equal')
+        conn = self._conn()
+        cursor = conn.cursor()
+        cursor.execute("SELECT id FROM players WHERE name IN ('Detail One', 'Detail Two') ORDER BY name")
+        one_id, two_id = [row[0] for row in cursor.fetchall()]
+        conn.close()
+        self.db.add_player_to_big_board(two_id)
+        self.db.add_player_to_big_board(one_id)
+        self.db.add_player_to_watch_list(one_id)
+
+        batch = self.db.get_players_by_ids([two_id, 999999, one_id, two_id])
+        self.assertEqual([player['id'] for player in batch], [two_id, one_id])
+        self.assertEqual(batch, [self.db.get_player_by_id(two_id), self.db.get_player_by_id(one_id)])
+
+        one = batch[1]
+        self.assertTrue(one['in_watch_list'])
+        self.assertEqual(one['watchlist_rank'], 1)
+        self.assertIn(one['personal_big_board_rank'], (1, 2))
+        self.assertEqual([row['board_name'] for row in one['board_ranks']], ['Detail Board A', 'Detail Board B'])
+        self.assertFalse(batch[0]['in_watch_list'])
+        self.assertIsNone(batch[0]['watchlist_rank'])
+
+    def test_full_text_search_prefix_snippets_and_trigger_sync(self):
+        conn = self._conn()
+        cursor = conn.cursor()
+        cursor.execute("INSERT INTO players (name, position, school, rank, scouted) VALUES ('Travis Hunter', 'CB', 'Colorado', 1, 0)")
+        hunter_id = cursor.lastrowid
+        cursor.execute("INSERT INTO players (name, position, school, rank, scouted) VALUES ('Hunter Cole', 'WR', 'Press State', 2, 0)")
+        cole_id = cursor.lastrowid
+        conn.commit()
+        conn.close()
+
+        if not self.db.fts_enabled:
+            self.skipTest('SQLite build lacks FTS5')
+
+        by_name = self.db.get_filtered_players(name_search='trav hun')
+        self.assertEqual([player['id'] for player in by_name], [hunter_id])
+
+        self.db.update_notes(hunter_id, 'Mirrors <b>receivers</b> in press coverage.')
+        by_notes = self.db.get_filtered_players(search_term='press cov')
+        self.assertEqual([player['id'] for player in by_notes], [hunter_id])
+        self.assertEqual(
+            by_notes[0]['notes_snippet'],
+            'Mirrors &lt;b&gt;receivers&lt;/b&gt; in <mark>press</mark> <mark>coverage</mark>.'
+        )
+
+        #School hits outrank notes hits by relevance; sort='rank' restores board order
+        by_relevance = self.db.get_filtered_players(search_term='press')
+        self.assertEqual([player['id'] for player in by_relevance], [cole_id, hunter_id])
+        self.assertIsNone(by_relevance[0]['notes_snippet'])
+        by_rank = self.db.get_filtered_players(search_term='press', sort='rank')
+        self.assertEqual([player['id'] for player in by_rank], [hunter_id, cole_id])
+
+        self.db.update_notes(hunter_id, 'Zone corner.')
+        self.assertEqual(self.db.get_filtered_players(search_term='coverage'), [])
+        self.assertEqual([player['id'] for player in self.db.get_filtered_players(search_term='zone')], [hunter_id])
+
+    def test_position_filters_use_player_positions_tokens(self):
+        conn = self._conn()
+        cursor = conn.cursor()
+        cursor.execute("INSERT INTO players (name, position, rank, scouted) VALUES ('Token Safety', 'CB/S', 1, 0)")
+        safety_id = cursor.lastrowid
+        cursor.execute("INSERT INTO players (name, position, rank, scouted) VALUES ('Token Strong Safety', 'SS', 2, 0)")
+        cursor.execute("INSERT INTO players (name, position, rank, scouted) VALUES ('Token Edge', 'EDGE/LB', 3, 0)")
+        edge_id = cursor.lastrowid
+        cursor.execute("INSERT INTO players (name, position, rank, scouted) VALUES ('Token Outside', 'OLB', 4, 0)")
+        conn.commit()
+        conn.close()
+
+        self.assertEqual([player['id'] for player in self.db.get_filtered_players(positions=['S'])], [safety_id])
+        self.assertEqual([player['id'] for player in self.db.get_filtered_players(positions=['lb'])], [edge_id])
+        self.assertEqual(self.db.get_all_positions(), ['CB', 'EDGE', 'LB', 'OLB', 'S', 'SS'])
+
+        self.db.update_player_profile(edge_id, {'position': 'DL'})
+        self.assertEqual(self.db.get_filtered_players(positions=['LB', 'EDGE']), [])
+        self.assertEqual([player['id'] for player in self.db.get_filtered_players(positions=['DL'])], [edge_id])
+
+        conn = self._conn()
+        cursor = conn.cursor()
+        cursor.execute('SELECT position, is_primary FROM player_positions WHERE player_id = ? ORDER BY position', (safety_id,))
+        self.assertEqual(cursor.fetchall(), [('CB', 1), ('S', 0)])
+        conn.close()
+
     def test_remove_imported_rank_board(self):
         boards = [
             {
@@ -277,6 +828,443 @@ class RankingsAndImportsTests(unittest.TestCase):
         protected_remove = self.db.remove_rank_board('consensus_2026')
         self.assertFalse(protected_remove['success'])
 
+    def test_pooled_connections_use_wal_and_are_reused(self):
+        conn = self.db.get_connection()
+        raw_conn = conn._conn
+        journal_mode = conn.execute('PRAGMA journal_mode').fetchone()[0]
+        busy_timeout = conn.execute('PRAGMA busy_timeout').fetchone()[0]
+        conn.close()
+
+        self.assertEqual(journal_mode.lower(), 'wal')
+        self.assertEqual(busy_timeout, 5000)
+
+        reused = self.db.get_connection()
+        self.assertIs(reused._conn, raw_conn)
+        reused.close()
+
+    def test_readers_are_not_blocked_by_open_write_transaction(self):
+        writer = self._conn()
+        writer.execute("INSERT INTO players (name) VALUES ('Committed Prospect')")
+        writer.commit()
+        writer.execute("INSERT INTO players (name) VALUES ('Pending Prospect')")
+
+        stats = self.db.get_db_stats()
+        writer.rollback()
+        writer.close()
+
+        self.assertEqual(stats['total_players'], 1)
+
+    def test_read_cache_serves_hits_until_a_write_commits(self):
+        self.db.add_player({'name': 'Cache Player', 'position': 'QB', 'school': 'Alpha State'})
+        self.assertEqual(self.db.get_all_positions(), ['QB'])
+        self.assertEqual(self.db.get_all_positions(), ['QB'])
+        stats = self.db.get_read_cache_stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+
+        schools = self.db.get_all_schools()
+        schools.append('Mutated Locally')
+        self.assertEqual(self.db.get_all_schools(), ['Alpha State'])
+
+        self.db.add_player({'name': 'Cache Receiver', 'position': 'WR', 'school': 'Beta Tech'})
+        self.assertEqual(self.db.get_all_positions(), ['QB', 'WR'])
+        self.assertEqual(self.db.get_all_schools(), ['Alpha State', 'Beta Tech'])
+        self.assertEqual(self.db.get_db_stats()['total_players'], 2)
+
+        player_id = self.db.get_filtered_players(name_search='Cache Receiver')[0]['id']
+        self.assertEqual(self.db.get_big_board(), [])
+        self.db.add_player_to_big_board(player_id)
+        self.assertEqual([entry['id'] for entry in self.db.get_big_board()], [player_id])
+
+    def test_bootstrap_state_matches_individual_reads(self):
+        self.db.add_player({'name': 'Boot Passer', 'position': 'QB', 'school': 'Alpha State'})
+        self.db.add_player({'name': 'Boot Rusher', 'position': 'EDGE', 'school': 'Beta Tech'})
+        player_id = self.db.get_filtered_players(name_search='Boot Rusher')[0]['id']
+        self.db.add_player_to_watch_list(player_id)
+
+        state = self.db.get_bootstrap_state(include_big_board=True)
+        self.assertEqual(state['stats'], self.db.get_db_stats())
+        self.assertEqual(state['positions'], ['EDGE', 'QB'])
+        self.assertEqual(state['schools'], self.db.get_all_schools())
+        self.assertEqual(state['rank_boards'], self.db.get_rank_boards_config())
+        self.assertEqual([entry['id'] for entry in state['watch_list']], [player_id])
+        self.assertEqual(state['big_board'], [])
+        self.assertNotIn('big_board', self.db.get_bootstrap_state())
+
+    def test_read_paths_do_not_write(self):
+        player_id = self.db.add_player({'name': 'Read Only Prospect', 'position': 'QB'})['player_id']
+        self.db.add_player_to_big_board(player_id)
+        conn = self._conn()
+        conn.execute("INSERT INTO players (name) VALUES ('Raw Sql Prospect')")
+        conn.commit()
+        conn.close()
+
+        generation = self.db._pool.generation
+        self.db.get_big_board()
+        state = self.db.get_bootstrap_state(include_big_board=True)
+        self.assertEqual(self.db._pool.generation, generation)
+        self.assertEqual(state['data_generation'], generation)
+
+    def test_read_cache_evicts_least_recently_used_entries(self):
+        self.db.close()
+        self.db = ScoutDatabase(self.db_path, read_cache_size=2)
+        self.db.get_all_positions()
+        self.db.get_all_schools()
+        self.db.get_all_positions()
+        self.db.get_db_stats()
+        self.db.get_all_positions()
+        stats = self.db.get_read_cache_stats()
+        self.assertEqual(stats['entries'], 2)
+        self.assertEqual(stats['evictions'], 1)
+        self.assertEqual(stats['hits'], 2)
+
+    def _seed_ranking_fixture(self):
+        conn = self._conn()
+        cursor = conn.cursor()
+        positions = ['QB', 'EDGE/LB', 'CB/S', 'S', 'WR', '', None]
+        for index in range(1, 41):
+            cursor.execute(
+                'INSERT INTO players (name, position, tankathon_rank) VALUES (?, ?, ?)',
+                (f'Fixture Prospect {index:02d}', positions[index % len(positions)], (index * 7) % 45 if index % 3 else None)
+            )
+        conn.commit()
+        conn.close()
+
+        self.db.import_external_big_boards([
+            {'name': 'Fixture Board A', 'text': '\n'.join(f'{rank}. Fixture Prospect {(rank * 3) % 40 + 1:02d}' for rank in range(1, 21)), 'weight': 2},
+            {'name': 'Fixture Board B', 'text': '\n'.join(f'{rank}. Fixture Prospect {(rank * 11) % 40 + 1:02d}' for rank in range(1, 16)), 'weight': 0.5}
+        ], weighting_mode='weighted')
+        self.db.import_consensus_board([
+            {'rank': rank, 'name': f'Fixture Prospect {(rank * 5) % 40 + 1:02d}'} for rank in range(1, 9)
+        ])
+
+    def _ranking_snapshot(self):
+        conn = self._conn()
+        rows = conn.execute(
+            'SELECT id, rank, weighted_avg_rank, positional_rank FROM players ORDER BY id'
+        ).fetchall()
+        conn.close()
+        return rows
+
+    def test_sql_recalculation_matches_python_recalculation(self):
+        self._seed_ranking_fixture()
+
+        self.db.recalculate_default_rankings(mode='python')
+        python_snapshot = self._ranking_snapshot()
+
+        conn = self._conn()
+        conn.execute('UPDATE players SET rank = NULL, weighted_avg_rank = NULL, positional_rank = NULL')
+        conn.commit()
+        conn.close()
+
+        ranked_count = self.db.recalculate_default_rankings(mode='sql')
+        self.assertEqual(ranked_count, len(python_snapshot))
+        self.assertEqual(self._ranking_snapshot(), python_snapshot)
+        self.assertEqual(self.db.last_recalculation['mode'], 'sql')
+        self.assertIn('total', self.db.last_recalculation['timings_ms'])
+
+    def _assert_incremental_matches_full_rebuild(self):
+        incremental_snapshot = self._ranking_snapshot()
+        self.db.recalculate_default_rankings()
+        self.assertEqual(incremental_snapshot, self._ranking_snapshot())
+
+    def test_incremental_recalculation_matches_full_rebuild(self):
+        self._seed_ranking_fixture()
+        self.db.recalculate_default_rankings()
+
+        self.db.add_player({'name': 'Late Riser', 'position': 'QB', 'rank': 3})
+        self.assertEqual(self.db.last_recalculation['mode'], 'incremental')
+        self._assert_incremental_matches_full_rebuild()
+
+        self.db.update_rank_board_weights([{'board_key': 'imported_fixture_board_b', 'weight': 4}])
+        self._assert_incremental_matches_full_rebuild()
+
+        self.db.import_consensus_board([
+            {'rank': rank, 'name': f'Fixture Prospect {(rank * 5) % 40 + 1:02d}'} for rank in range(1, 9)
+        ] + [{'rank': 9, 'name': 'Fixture Prospect 40'}])
+        self._assert_incremental_matches_full_rebuild()
+
+        conn = self._conn()
+        player_id = conn.execute("SELECT id FROM players WHERE name = 'Fixture Prospect 07'").fetchone()[0]
+        conn.close()
+        self.db.update_player_profile(player_id, {'position': 'WR'})
+        self._assert_incremental_matches_full_rebuild()
+
+        self.db.update_rank_board_weights([{'board_key': 'imported_fixture_board_a', 'weight': 2, 'is_primary': True}])
+        self._assert_incremental_matches_full_rebuild()
+
+    def test_incremental_recalculation_only_rewrites_moved_range(self):
+        self._seed_ranking_fixture()
+        self.db.recalculate_default_rankings()
+
+        self.db.add_player({'name': 'Zz Unranked Prospect', 'position': 'QB'})
+
+        self.assertEqual(self.db.last_recalculation['mode'], 'incremental')
+        self.assertEqual(self.db.last_recalculation['dirty_players'], 1)
+        self.assertEqual(self.db.last_recalculation['rank_rows_written'], 1)
+        self._assert_incremental_matches_full_rebuild()
+
+    def test_deferred_recalculation_returns_generation_and_coalesces(self):
+        self.db.close()
+        self.db = ScoutDatabase(self.db_path, defer_rank_recalculation=True, rank_recalc_debounce_seconds=0.2)
+
+        first = self.db.add_player({'name': 'Deferred Prospect A', 'position': 'QB', 'rank': 2})
+        second = self.db.add_player({'name': 'Deferred Prospect B', 'position': 'QB', 'rank': 1})
+        self.assertGreater(second['ranking_generation'], first['ranking_generation'])
+
+        self.assertTrue(self.db.wait_for_rankings(second['ranking_generation'], timeout=5))
+        status = self.db.get_ranking_status()
+        self.assertFalse(status['pending'])
+        self.assertEqual(status['runs'], 1)
+
+        conn = self._conn()
+        ranked = conn.execute('SELECT name, rank, positional_rank FROM players ORDER BY rank').fetchall()
+        conn.close()
+        self.assertEqual(ranked, [('Deferred Prospect B', 1, '1'), ('Deferred Prospect A', 2, '2')])
+
+    def test_scheduler_wait_times_out_for_unrequested_generation(self):
+        runs = []
+        scheduler = RankRecalcScheduler(lambda: runs.append(threading.current_thread().name), deferred=False)
+
+        generation = scheduler.request()
+        self.assertEqual(runs, [threading.current_thread().name])
+        self.assertTrue(scheduler.wait(generation, timeout=0))
+        self.assertFalse(scheduler.wait(generation + 1, timeout=0))
+
+
+    def test_job_runner_reports_stages_and_result(self):
+        runner = JobRunner(max_workers=1)
+        self.addCleanup(runner.shutdown)
+        self.db.add_player({'name': 'Job Player', 'position': 'QB'})
+
+        def import_job(context):
+            context.stage('fetch')
+            context.stage('parse')
+            players = [{'name': 'Job Player', 'rank': 1}, {'name': 'Job Newcomer', 'rank': 2}]
+            return self.db.import_consensus_board(players, progress=context.stage)
+
+        job = runner.submit('import', ('fetch', 'parse', 'normalize', 'resolve', 'enrich', 'write', 'recalc'), import_job)
+        finished = runner.wait(job['id'], timeout=5)
+        self.assertEqual(finished['status'], 'succeeded')
+        self.assertEqual(finished['result']['entries_imported'], 2)
+        self.assertEqual(
+            [(stage['name'], stage['status']) for stage in finished['stages']],
+            [('fetch', 'done'), ('parse', 'done'), ('normalize', 'done'), ('resolve', 'done'),
+             ('enrich', 'done'), ('write', 'done'), ('recalc', 'skipped')]
+        )
+
+        failed = runner.wait(runner.submit('import', ('fetch',), lambda context: {'success': False, 'error': 'No players'})['id'], timeout=5)
+        self.assertEqual((failed['status'], failed['error']), ('failed', 'No players'))
+
+    def test_job_runner_cancels_at_next_stage_boundary(self):
+        runner = JobRunner(max_workers=1)
+        self.addCleanup(runner.shutdown)
+        fetching = threading.Event()
+        release = threading.Event()
+        reached = []
+
+        def slow_job(context):
+            context.stage('fetch')
+            fetching.set()
+            release.wait(5)
+            context.raise_if_cancelled()
+            context.stage('write')
+            reached.append('write')
+            return {'success': True}
+
+        job = runner.submit('slow', ('fetch', 'write'), slow_job)
+        self.assertTrue(fetching.wait(5))
+        self.assertTrue(runner.cancel(job['id'])['cancel_requested'])
+        release.set()
+
+        finished = runner.wait(job['id'], timeout=5)
+        self.assertEqual(finished['status'], 'cancelled')
+        self.assertEqual(reached, [])
+        self.assertEqual([stage['status'] for stage in finished['stages']], ['cancelled', 'skipped'])
+        self.assertIsNone(runner.cancel('missing'))
+
+
+    def test_single_flight_shares_in_flight_result(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        results = []
+
+        def expensive():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return {'success': True, 'run': len(calls)}
+
+        leader = threading.Thread(target=lambda: results.append(flight.do('recalc', expensive)))
+        leader.start()
+        self.assertTrue(started.wait(5))
+        follower = threading.Thread(target=lambda: results.append(flight.do('recalc', expensive)))
+        follower.start()
+        release.set()
+        leader.join(5)
+        follower.join(5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{'success': True, 'run': 1}] * 2)
+        self.assertEqual(flight.do('recalc', expensive)['run'], 2)
+
+    def test_job_runner_attaches_duplicate_submissions(self):
+        runner = JobRunner(max_workers=2)
+        self.addCleanup(runner.shutdown)
+        release = threading.Event()
+
+        def blocking_job(context):
+            release.wait(5)
+            return {'success': True}
+
+        first = runner.submit('import', ('fetch',), blocking_job, key='import-consensus-board')
+        second = runner.submit('import', ('fetch',), blocking_job, key='import-consensus-board')
+        other = runner.submit('import', ('fetch',), blocking_job, key='import-other')
+        self.assertEqual(second['id'], first['id'])
+        self.assertTrue(second['attached'])
+        self.assertNotEqual(other['id'], first['id'])
+
+        release.set()
+        self.assertEqual(runner.wait(first['id'], timeout=5)['status'], 'succeeded')
+        third = runner.submit('import', ('fetch',), blocking_job, key='import-consensus-board')
+        self.assertNotEqual(third['id'], first['id'])
+
+    def test_concurrent_board_imports_are_serialized(self):
+        players = [{'name': f'Serial Player {index}', 'rank': index} for index in range(1, 41)]
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.db.import_consensus_board(players)))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        self.assertEqual([result['success'] for result in results], [True] * 4)
+        conn = self._conn()
+        cursor = conn.cursor()
+        cursor.execute('SELECT COUNT(*) FROM player_board_ranks pbr JOIN rank_boards rb ON rb.id = pbr.board_id WHERE rb.board_key = ?', ('consensus_2026',))
+        self.assertEqual(cursor.fetchone()[0], 40)
+        conn.close()
+
+
+
+class _RecordedPagesHandler(BaseHTTPRequestHandler):
+    """Serves tests/fixtures/nflmock pages under the NFLMockDraftDatabase URL layout."""
+
+    def do_GET(self):
+        path = self.path.split('?', 1)[0].rstrip('/')
+        self.server.requests.append((path, time.monotonic()))
+        if path == '/big-boards/2026':
+            file_name = 'index.html'
+        elif path.startswith('/big-boards/2026/'):
+            file_name = path.rsplit('/', 1)[-1] + '.html'
+        else:
+            file_name = None
+
+        file_path = os.path.join(FIXTURES_DIR, 'nflmock', file_name) if file_name else None
+        if not file_path or not os.path.isfile(file_path):
+            self.send_error(404)
+            return
+
+        with open(file_path, 'rb') as f:
+            body = f.read()
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()
+        if self.headers.get('If-None-Match') == etag:
+            self.server.not_modified.append(path)
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@unittest.skipIf(consensus_scraper is None, 'requests and beautifulsoup4 are required for scraper tests')
+class BoardCrawlerTests(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _RecordedPagesHandler)
+        self.server.requests = []
+        self.server.not_modified = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.index_url = f'http://127.0.0.1:{self.server.server_address[1]}/big-boards/2026'
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db = ScoutDatabase(os.path.join(self.temp_dir.name, 'crawl.db'))
+        self.http_cache = http_cache.HttpCache(os.path.join(self.temp_dir.name, 'http_cache'), offline=False)
+        http_cache.set_default_cache(self.http_cache)
+
+    def tearDown(self):
+        http_cache.set_default_cache(None)
+        self.server.shutdown()
+        self.server.server_close()
+        self.db.close()
+        self.temp_dir.cleanup()
+
+    def test_discover_board_urls_skips_consensus_and_duplicates(self):
+        with open(os.path.join(FIXTURES_DIR, 'nflmock', 'index.html'), encoding='utf-8') as f:
+            urls = consensus_scraper.discover_board_urls(f.read(), self.index_url)
+
+        self.assertEqual(
+            [url.rsplit('/', 1)[-1] for url in urls],
+            ['alpha-board-2026', 'beta-board-2026', 'retired-board-2026', 'gamma-board-2026']
+        )
+
+    def test_crawl_fetches_every_board_once_and_imports_in_one_pass(self):
+        stages = []
+        crawl = consensus_scraper.crawl_nflmockdraftdatabase_big_boards(
+            index_url=self.index_url, max_workers=3, per_host_interval=0.05, progress=stages.append
+        )
+
+        self.assertEqual(stages, ['fetch', 'parse'])
+        self.assertEqual(
+            sorted(board['board_name'] for board in crawl['boards']),
+            ['Alpha Scouting 2026 Big Board', 'Beta Draft Network 2026 Big Board', 'Gamma Film Room 2026 Big Board']
+        )
+        self.assertTrue(all(len(board['players']) == 22 for board in crawl['boards']))
+        self.assertEqual([row['url'].rsplit('/', 1)[-1] for row in crawl['failed']], ['retired-board-2026'])
+
+        paths = [path for path, _ in self.server.requests]
+        self.assertEqual(len(paths), len(set(paths)))
+        # The index is fetched alone before the pool starts; spacing matters between the concurrent board fetches
+        request_times = sorted(requested_at for path, requested_at in self.server.requests if path != '/big-boards/2026')
+        self.assertGreaterEqual(min(b - a for a, b in zip(request_times, request_times[1:])), 0.04)
+
+        result = self.db.import_nflmock_url_boards(crawl['boards'])
+        self.assertTrue(result['success'])
+        self.assertEqual(result['boards_imported'], 3)
+        self.assertEqual(self.db.get_ranking_status()['runs'], 1)
+        config = {board['board_name']: board['player_count'] for board in self.db.get_rank_boards_config()}
+        self.assertEqual(config['Beta Draft Network 2026 Big Board'], 22)
+
+    def test_http_cache_revalidates_unchanged_pages_and_replays_offline(self):
+        board_url = self.index_url + '/alpha-board-2026'
+        first = consensus_scraper.fetch_board_html(board_url)
+        self.assertEqual(self.http_cache.stats['fetched'], 1)
+
+        self.assertEqual(consensus_scraper.fetch_board_html(board_url), first)
+        self.assertEqual(self.server.not_modified, ['/big-boards/2026/alpha-board-2026'])
+        self.assertEqual(self.http_cache.stats['revalidated'], 1)
+
+        self.server.shutdown()
+        self.server.server_close()
+        self.server.requests.clear()
+        self.http_cache.offline = True
+        replayed = consensus_scraper.fetch_board_html(board_url)
+        self.assertEqual(consensus_scraper.parse_board_name(replayed, board_url), 'Alpha Scouting 2026 Big Board')
+        self.assertEqual(self.server.requests, [])
+        with self.assertRaises(http_cache.OfflineCacheMiss):
+            consensus_scraper.fetch_board_html(self.index_url + '/beta-board-2026')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -4,6 +4,7 @@ import json
 import urllib3
 import time
 from requests.adapters import HTTPAdapter
+from http_cache import cached_get
 from urllib3.util.retry import Retry
 
 # Disable SSL warnings when verify=False is used
@@ -29,11 +30,20 @@ def create_session():
     return session
 
 
+TANKATHON_BIG_BOARD_URL = "https://tankathon.com/nfl/big_board"
+
+
 def scrape_nfl_big_board():
     """
     Scrapes all player information from Tankathon NFL Big Board
     """
-    url = "https://tankathon.com/nfl/big_board"
+    return parse_nfl_big_board_html(fetch_nfl_big_board_html())
+
+
+def fetch_nfl_big_board_html(url=TANKATHON_BIG_BOARD_URL):
+    """
+    Downloads the Tankathon NFL Big Board page through the HTTP cache, retrying connection errors with backoff
+    """
     
     # Add comprehensive headers to mimic a real browser
     headers = {
@@ -58,14 +68,10 @@ def scrape_nfl_big_board():
             # Create session with retry logic
             session = create_session()
             
-            # Add a small delay before request
-            time.sleep(1)
-            
             print(f"Attempt {attempt + 1} of {max_retries}...")
             
-            # Fetch the webpage with SSL verification disabled and timeout
-            response = session.get(url, headers=headers, verify=False, timeout=30)
-            response.raise_for_status()
+            # Fetch (or revalidate) the webpage with SSL verification disabled and timeout
+            response = cached_get(session, url, headers=headers, verify=False, timeout=30)
             
             # If here, the request was successful
             break
@@ -86,11 +92,18 @@ def scrape_nfl_big_board():
         except requests.RequestException as e:
             print(f"Request error: {e}")
             raise
-    
+
+    return response.content
+
+
+def parse_nfl_big_board_html(content):
+    """
+    Parses player rows out of Tankathon NFL Big Board HTML
+    """
     try:
         
         # Parse the HTML
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(content, 'html.parser')
         
         players = []
         seen_players = set() # Track unique player names to avoid duplicates